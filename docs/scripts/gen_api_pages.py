@@ -7,35 +7,66 @@ when you run `mkdocs build` or `mkdocs serve`.
 
 from __future__ import annotations
 
-import importlib
-import pkgutil
+import hashlib
+import importlib.util
+import json
+import os
 from pathlib import Path
 
 
 ROOT_PACKAGE = "vsc_sync"
 
+# Sidecar file recording the sha1 of every stub written by the previous run.
+INDEX_NAME = ".index"
+
 
 def iter_modules(package_name: str):
-    """Yield the given package and all its sub-modules recursively."""
-    module = importlib.import_module(package_name)
-    yield module.__name__
+    """Yield the given package and all its sub-modules recursively.
+
+    Modules are found by scanning the package directory, so no application
+    code is imported or executed while building the docs.
+    """
+    spec = importlib.util.find_spec(package_name)
+    pkg_root = Path(spec.submodule_search_locations[0])
 
-    # Packages (i.e. modules with a __path__) may contain sub-modules.
-    if hasattr(module, "__path__"):
-        for submodule in pkgutil.walk_packages(
-            module.__path__, prefix=f"{package_name}."
-        ):
-            yield from iter_modules(submodule.name)
+    for path in sorted(pkg_root.rglob("*.py")):
+        rel = path.relative_to(pkg_root)
+        if path.name == "__init__.py":
+            yield ".".join((package_name, *rel.parent.parts))
+        else:
+            yield ".".join((package_name, *rel.with_suffix("").parts))
 
 
 def main() -> None:
     docs_path = Path(__file__).resolve().parents[1]
     reference_root = docs_path / "reference"
     reference_root.mkdir(parents=True, exist_ok=True)
+    index_file = reference_root / INDEX_NAME
+
+    stubs = {mod_name: f"::: {mod_name}\n" for mod_name in iter_modules(ROOT_PACKAGE)}
+    index = {
+        mod_name: hashlib.sha1(content.encode()).hexdigest()
+        for mod_name, content in stubs.items()
+    }
+
+    with os.scandir(reference_root) as it:
+        existing = {entry.name for entry in it if entry.is_file()}
+
+    try:
+        previous = json.loads(index_file.read_text())
+    except (OSError, ValueError):
+        previous = {}
+
+    # Rewriting an unchanged stub bumps its mtime and makes mkdocs re-render
+    # the page, so only touch stubs that are missing or whose content changed.
+    for mod_name, content in stubs.items():
+        file_name = f"{mod_name}.md"
+        if file_name in existing and previous.get(mod_name) == index[mod_name]:
+            continue
+        (reference_root / file_name).write_text(content)
 
-    for mod_name in iter_modules(ROOT_PACKAGE):
-        out_file = reference_root / f"{mod_name}.md"
-        out_file.write_text(f"::: {mod_name}\n")
+    if previous != index:
+        index_file.write_text(json.dumps(index, indent=2, sort_keys=True) + "\n")
 
 
 if __name__ == "__main__":
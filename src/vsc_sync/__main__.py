@@ -1,6 +1,32 @@
 """Entry point for running vsc-sync as a module."""
 
-from .cli import app
+import sys
+
+
+def _fast_version() -> None:
+    """Print the version and exit before Typer or Rich are imported.
+
+    Only the global options preceding the sub-command are inspected, so a
+    ``--version`` meant for something else is left to the regular parser.
+    """
+    for arg in sys.argv[1:]:
+        if arg in ("-V", "--version"):
+            from . import __version__
+
+            sys.stdout.write(f"vsc-sync version {__version__}\n")
+            sys.exit(0)
+        if not arg.startswith("-"):
+            return
+
+
+def _entry() -> None:
+    """Console-script entry point."""
+    _fast_version()
+
+    from .cli import app
 
-if __name__ == "__main__":
     app()
+
+
+if __name__ == "__main__":
+    _entry()
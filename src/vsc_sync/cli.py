@@ -1,579 +1,225 @@
 """Main CLI application for vsc-sync."""
 
-import logging
-from pathlib import Path
-from typing import Optional
+import functools
+import importlib
+import os
+import sys
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 import typer
-from rich.console import Console
-from rich.table import Table
-
-from . import __version__
-from .config import ConfigManager
-from .core.app_manager import AppManager
-from .core.config_manager import LayerConfigManager
-from .exceptions import VscSyncError
-from .utils import setup_logging
-
-# Create the main Typer app
-app = typer.Typer(
-    name="vsc-sync",
-    help="Synchronize VSCode-like configurations across multiple editors",
-    rich_markup_mode="rich",
-    no_args_is_help=True,
+from typer.core import TyperGroup
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from typer._click import Command, Context
+
+    from .config import ConfigManager
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Sub-commands in the order they appear in ``--help``.  Each one lives in
+# ``vsc_sync.cli_cmds.<name>`` (dashes become underscores) and exposes a
+# ``command`` attribute holding the built Click command.
+COMMAND_NAMES = (
+    "init",
+    "add-app",
+    "list-apps",
+    "apply",
+    "status",
+    "setup-project",
+    "pull",
+    "edit",
+    "discover",
 )
 
-console = Console()
-
-
-def version_callback(value: bool) -> None:
-    """Show version information."""
-    if value:
-        console.print(f"vsc-sync version {__version__}")
-        raise typer.Exit()
-
-
-@app.callback()
-def main(
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Enable verbose output"
-    ),
-    version: Optional[bool] = typer.Option(
-        None, "--version", callback=version_callback, help="Show version"
-    ),
-) -> None:
-    """vsc-sync: Synchronize VSCode-like configurations across multiple editors."""
-    setup_logging(verbose)
-
+# Command implementations imported in the background when VSC_SYNC_PREWARM=1,
+# overlapping their import cost with the rest of start-up and user prompts.
+PREWARM_MODULES = (
+    "vsc_sync.commands.apply_cmd",
+    "vsc_sync.commands.pull_cmd",
+    "vsc_sync.commands.status_cmd",
+    "vsc_sync.commands.edit_cmd",
+    "vsc_sync.commands.setup_project_cmd",
+)
 
-@app.command()
-def init(
-    repo: Optional[str] = typer.Option(
-        None, "--repo", help="Git URL or local path to vscode-configs repository"
-    ),
-    config_file: Optional[str] = typer.Option(
-        None, "--config-file", help="Path to store vsc-sync configuration"
-    ),
-) -> None:
-    """Initialize vsc-sync for first-time use."""
-    try:
-        from .commands.init_cmd import InitCommand
-
-        config_manager = ConfigManager()
-        init_command = InitCommand(config_manager)
-        init_command.run(repo=repo, config_file=config_file)
-
-    except VscSyncError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Initialization cancelled by user.[/yellow]")
-        raise typer.Exit(1)
-
-
-@app.command()
-def add_app(
-    alias: str = typer.Argument(..., help="Unique alias for the application"),
-    config_path: str = typer.Argument(
-        ..., help="Path to the app's user configuration directory"
-    ),
-    executable: Optional[str] = typer.Option(
-        None, "--executable", help="Path to the app's executable"
-    ),
-) -> None:
-    """Register a new VSCode-like application."""
-    try:
-        # TODO: Implement add-app logic
-        console.print(f"[yellow]Add-app functionality coming soon![/yellow]")
-        console.print(f"Will register app '{alias}' with config path: {config_path}")
-        if executable:
-            console.print(f"Executable: {executable}")
+# Tables with more rows than this get fixed column widths computed up front.
+FIXED_WIDTH_MIN_ROWS = 50
 
-    except VscSyncError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
 
+class LazySubGroup(TyperGroup):
+    """Typer group that only imports and builds the invoked sub-command.
 
-@app.command()
-def list_apps(
-    verbose: bool = typer.Option(
-        False, "--verbose", "-v", help="Show detailed information"
-    ),
-) -> None:
-    """List all registered applications."""
-    try:
-        config_manager = ConfigManager()
-
-        if not config_manager.is_initialized():
-            console.print(
-                "[red]vsc-sync is not initialized. Run 'vsc-sync init' first.[/red]"
-            )
-            raise typer.Exit(1)
-
-        config = config_manager.load_config()
-
-        if not config.managed_apps:
-            console.print("No applications registered yet.")
-            console.print(
-                "Use 'vsc-sync add-app' to register applications or 'vsc-sync init' to auto-discover."
-            )
-            return
+    Click resolves a single command name per invocation, so only that
+    command's module (and its option objects) get constructed.  Listing
+    commands for ``--help`` still imports every module so the help output
+    stays complete.
+    """
 
-        table = Table(title="Registered Applications")
-        table.add_column("Alias", style="cyan")
-        table.add_column("Config Path", style="green")
+    def list_commands(self, ctx: "Context") -> List[str]:
+        return list(COMMAND_NAMES)
 
-        if verbose:
-            table.add_column("Executable", style="yellow")
-            table.add_column("Status", style="magenta")
+    def get_command(self, ctx: "Context", cmd_name: str) -> Optional["Command"]:
+        if cmd_name not in COMMAND_NAMES:
+            return None
+        module = importlib.import_module(
+            f".cli_cmds.{cmd_name.replace('-', '_')}", __package__
+        )
+        return cast("Command", module.command)
 
-        for alias, app_details in config.managed_apps.items():
-            row = [alias, str(app_details.config_path)]
 
-            if verbose:
-                exec_path = (
-                    str(app_details.executable_path)
-                    if app_details.executable_path
-                    else "Not set"
-                )
-                status = "✓" if app_details.config_path.exists() else "✗"
-                row.extend([exec_path, status])
+# Create the main Typer app
+app = typer.Typer(
+    name="vsc-sync",
+    help="Synchronize VSCode-like configurations across multiple editors",
+    cls=LazySubGroup,
+    no_args_is_help=True,
+)
 
-            table.add_row(*row)
 
-        console.print(table)
+@functools.lru_cache(maxsize=None)
+def _console() -> "Console":
+    """Return the shared Rich console, constructing it on first use.
 
-    except VscSyncError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    Rich is only imported once a command actually needs to print, so
+    ``--help`` and argument errors never pay for it.
+    """
+    from rich.console import Console
 
+    return Console()
 
-@app.command()
-def apply(
-    app_alias: str = typer.Argument(..., help="Alias of the target application"),
-    stack: Optional[list[str]] = typer.Option(
-        None, "--stack", help="Tech stack to apply (can be used multiple times)"
-    ),
-    backup: bool = typer.Option(
-        True,
-        "--backup/--no-backup",
-        help="Create backup before applying (default: enabled)",
-    ),
-    backup_suffix: Optional[str] = typer.Option(
-        None, "--backup-suffix", help="Custom backup suffix"
-    ),
-    dry_run: bool = typer.Option(
-        False, "--dry-run", "-n", help="Show what would be done without applying"
-    ),
-    force: bool = typer.Option(
-        False, "--force", "-f", help="Force overwrite without prompting"
-    ),
-    prune_extensions: bool = typer.Option(
-        False, "--prune-extensions", help="Uninstall extensions not in configuration"
-    ),
 
-    # Component selection flags
-    settings_flag: bool = typer.Option(
-        False, "--settings", help="Apply settings.json"
-    ),
-    keybindings_flag: bool = typer.Option(
-        False, "--keybindings", help="Apply keybindings.json"
-    ),
-    extensions_flag: bool = typer.Option(
-        False, "--extensions", help="Manage extensions"
-    ),
-    snippets_flag: bool = typer.Option(
-        False, "--snippets", help="Copy snippets"
-    ),
-    tasks: bool = typer.Option(
-        True, "--tasks/--no-tasks", help="Sync tasks.json (default: yes)"
-    ),
-) -> None:
-    """Apply configurations to an application."""
-    try:
-        from .commands.apply_cmd import ApplyCommand
-
-        config_manager = ConfigManager()
-
-        if not config_manager.is_initialized():
-            console.print(
-                "[red]vsc-sync is not initialized. Run 'vsc-sync init' first.[/red]"
-            )
-            raise typer.Exit(1)
-
-        apply_command = ApplyCommand(config_manager)
-        # Determine components; if none specified => all True
-        specified = any(
-            [settings_flag, keybindings_flag, extensions_flag, snippets_flag]
-        )
+def _get_cm() -> "ConfigManager":
+    """Return a ConfigManager for the default configuration path.
 
-        include_settings = settings_flag or not specified
-        include_keybindings = keybindings_flag or not specified
-        include_extensions = extensions_flag or not specified
-        include_snippets = snippets_flag or not specified
-
-        apply_command.run(
-            app_alias=app_alias,
-            stacks=stack,
-            backup=backup,
-            backup_suffix=backup_suffix,
-            dry_run=dry_run,
-            force=force,
-            prune_extensions=prune_extensions,
-            tasks=tasks,
-            include_settings=include_settings,
-            include_keybindings=include_keybindings,
-            include_extensions=include_extensions,
-            include_snippets=include_snippets,
-        )
+    The parsed configuration itself is cached in :mod:`vsc_sync.config`, so
+    every manager created here shares it while the file is unchanged.
+    """
+    from .config import ConfigManager
 
-    except VscSyncError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Apply cancelled by user.[/yellow]")
-        raise typer.Exit(1)
+    return ConfigManager()
 
 
-@app.command()
-def status(
-    app_alias: Optional[str] = typer.Argument(
-        None, help="App alias to check (if not provided, checks all)"
-    ),
-    stack: Optional[list[str]] = typer.Option(
-        None, "--stack", help="Stacks to consider for comparison"
-    ),
-) -> None:
-    """Show configuration status for applications."""
-    try:
-        from .commands.status_cmd import StatusCommand
+def _handle(cancel_message: str = "Cancelled.") -> Callable[[F], F]:
+    """Report vsc-sync errors and Ctrl-C uniformly for a command function.
 
-        config_manager = ConfigManager()
+    :class:`~vsc_sync.exceptions.VscSyncError` is printed in red and
+    KeyboardInterrupt prints ``cancel_message``; both exit with status 1.
+    Anything else propagates unchanged, including ``typer.Exit``.
+    """
 
-        if not config_manager.is_initialized():
-            console.print(
-                "[red]vsc-sync is not initialized. Run 'vsc-sync init' first.[/red]"
-            )
-            raise typer.Exit(1)
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return fn(*args, **kwargs)
+            except KeyboardInterrupt:
+                _console().print(f"\n[yellow]{cancel_message}[/yellow]")
+                raise typer.Exit(1)
+            except Exception as e:
+                from .exceptions import VscSyncError
 
-        status_command = StatusCommand(config_manager)
-        status_command.run(app_alias=app_alias, stacks=stack)
+                if not isinstance(e, VscSyncError):
+                    raise
+                _console().print(f"[red]Error:[/red] {e}")
+                raise typer.Exit(1)
 
-    except VscSyncError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Status check cancelled by user.[/yellow]")
-        raise typer.Exit(1)
+        return cast(F, wrapper)
 
+    return decorator
 
-@app.command()
-def setup_project(
-    project_path: str = typer.Argument(
-        ".", help="Path to the project directory (defaults to current directory)"
-    ),
-    stack: Optional[list[str]] = typer.Option(
-        None,
-        "--stack",
-        help="Tech stack(s) to use for project setup (can be used multiple times)",
-    ),
-    from_project_type: Optional[str] = typer.Option(
-        None,
-        "--from-project-type",
-        help="Use predefined project type as base configuration",
-    ),
-    force: bool = typer.Option(
-        False,
-        "--force",
-        "-f",
-        help="Overwrite existing .vscode files without prompting",
-    ),
-) -> None:
-    """Set up .vscode/ configuration files for a project."""
-    try:
-        from pathlib import Path
-        from .commands.setup_project_cmd import SetupProjectCommand
-
-        config_manager = ConfigManager()
-
-        if not config_manager.is_initialized():
-            console.print(
-                "[red]vsc-sync is not initialized. Run 'vsc-sync init' first.[/red]"
-            )
-            raise typer.Exit(1)
-
-        setup_command = SetupProjectCommand(config_manager)
-        setup_command.run(
-            project_path=Path(project_path),
-            stacks=stack,
-            from_project_type=from_project_type,
-            force=force,
-        )
 
-    except VscSyncError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Setup cancelled by user.[/yellow]")
-        raise typer.Exit(1)
-
-
-# --------------------------------------------------------------------------------------
-# PULL COMMAND
-# --------------------------------------------------------------------------------------
-
-@app.command(help=(
-    "Pull configurations from an application or project into the vscode-configs "
-    "repository.  [bold red]⚠ Existing files in the target layer may be overwritten![/bold red]"
-))
-def pull(
-    app_alias: Optional[str] = typer.Argument(
-        None,
-        help="Alias of the source application (required unless --from-project is used)",
-    ),
-    layer_type: str = typer.Option(
-        ..., "--to", help="Target layer type: base, app, stack, project"
-    ),
-    layer_name: Optional[str] = typer.Argument(
-        None, help="Layer name (required for stack, optional for app/project)"
-    ),
-    from_project: Optional[str] = typer.Option(
-        None,
-        "--from-project",
-        help="Pull from project .vscode directory instead of app",
-    ),
-    settings: bool = typer.Option(
-        True,
-        "--settings/--no-settings",
-        help="Include settings.json (default: yes)",
-    ),
-    keybindings: bool = typer.Option(
-        False, "--keybindings", help="Include keybindings.json"
-    ),
-    extensions: bool = typer.Option(
-        False, "--extensions", help="Include extensions list"
-    ),
-    snippets: bool = typer.Option(
-        False, "--snippets", help="Include snippets directory"
-    ),
-    overwrite: bool = typer.Option(
-        False,
-        "--overwrite",
-        help="[dangerous] Overwrite existing files without prompting",
-    ),
-    dry_run: bool = typer.Option(
-        False,
-        "--dry-run",
-        "-n",
-        help="Show what would be pulled without making changes",
-    ),
-    full_preview: bool = typer.Option(
-        False,
-        "--full-preview",
-        help="Show full content preview in pager (like git diff)",
-    ),
-    no_pager: bool = typer.Option(
-        False, "--no-pager", help="Disable pager for full preview output"
-    ),
+def _print_table(
+    title: str,
+    columns: Sequence[Tuple[str, str]],
+    rows: Iterable[Sequence[str]],
 ) -> None:
-    """Pull configurations from an application or project to the repository."""
-    try:
-        from .commands.pull_cmd import PullCommand
-
-        config_manager = ConfigManager()
-
-        if not config_manager.is_initialized():
-            console.print(
-                "[red]vsc-sync is not initialized. Run 'vsc-sync init' first.[/red]"
-            )
-            raise typer.Exit(1)
-
-        # Validate arguments
-        if from_project and app_alias:
-            console.print(
-                "[red]Error:[/red] Cannot specify both app_alias and --from-project"
-            )
-            raise typer.Exit(1)
-
-        if not from_project and not app_alias:
-            console.print(
-                "[red]Error:[/red] Must specify either app_alias or --from-project"
-            )
-            raise typer.Exit(1)
-
-        # Warn about extensions in project mode
-        if from_project and extensions:
-            console.print(
-                "[yellow]Warning:[/yellow] --include-extensions is not available in project mode, ignoring"
-            )
-            extensions = False
-
-        # Convert from_project to Path if provided
-        project_path = Path(from_project) if from_project else None
-
-        pull_command = PullCommand(config_manager)
-        pull_command.run(
-            app_alias=app_alias,
-            layer_type=layer_type,
-            layer_name=layer_name,
-            project_path=project_path,
-            include_settings=settings,
-            include_keybindings=keybindings,
-            include_extensions=extensions,
-            include_snippets=snippets,
-            overwrite=overwrite,
-            dry_run=dry_run,
-            full_preview=full_preview,
-            no_pager=no_pager,
-        )
-
-    except VscSyncError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Pull cancelled by user.[/yellow]")
-        raise typer.Exit(1)
+    """Print rows as a Rich table, or as tab-separated text when piped.
+
+    ``columns`` holds ``(header, style)`` pairs.  When stdout is not a
+    terminal the styling would be stripped anyway, so Rich's table layout
+    is skipped entirely.
+    """
+    console = _console()
+    if not console.is_terminal:
+        typer.echo("\t".join(header for header, _ in columns))
+        for row in rows:
+            typer.echo("\t".join(row))
+        return
+
+    from rich.cells import cell_len
+    from rich.table import Table
+
+    rows = list(rows)
+    headers = [header for header, _ in columns]
+    if len(rows) > FIXED_WIDTH_MIN_ROWS:
+        # Size columns from one scan so Rich can skip measuring every cell.
+        widths: List[Optional[int]] = [
+            max(cell_len(value) for value in column)
+            for column in zip(headers, *rows)
+        ]
+    else:
+        widths = [None] * len(columns)
+
+    table = Table(title=title)
+    for (header, style), width in zip(columns, widths):
+        table.add_column(header, style=style, width=width, no_wrap=width is not None)
+    for row in rows:
+        table.add_row(*row)
+
+    console.print(table)
+
+
+def _prewarm() -> None:
+    """Import the heavy command modules ahead of their first use."""
+    for module_name in PREWARM_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            # The import on dispatch will report the failure properly.
+            return
 
 
-@app.command()
-def edit(
-    layer_type: str = typer.Argument(
-        ..., help="Layer type: base, app, stack, project, live"
-    ),
-    layer_name: Optional[str] = typer.Argument(
-        None, help="Layer name (not needed for base)"
-    ),
-    # Mutually-exclusive file-type flags (default: settings)
-    settings_flag: bool = typer.Option(
-        False, "--settings", help="Edit settings.json"
-    ),
-    keybindings_flag: bool = typer.Option(
-        False, "--keybindings", help="Edit keybindings.json"
-    ),
-    extensions_flag: bool = typer.Option(
-        False, "--extensions", help="Edit extensions.json"
-    ),
-    snippets_flag: bool = typer.Option(
-        False, "--snippets", help="Edit snippets directory"
-    ),
-    tasks_flag: bool = typer.Option(
-        False, "--tasks", help="Edit tasks.json"
-    ),
-    sort: bool = typer.Option(
-        False,
-        "--sort",
-        help="Sort keybindings.json (only when editing keybindings)",
-    ),
-    yes: bool = typer.Option(
-        False,
-        "--yes",
-        "-y",
-        help="Assume yes for overwrite confirmation while sorting",
-    ),
-) -> None:
-    """Open configuration files for editing."""
-    try:
-        from .commands.edit_cmd import EditCommand
-
-        config_manager = ConfigManager()
-
-        if not config_manager.is_initialized():
-            console.print(
-                "[red]vsc-sync is not initialized. Run 'vsc-sync init' first.[/red]"
-            )
-            raise typer.Exit(1)
-
-        edit_command = EditCommand(config_manager)
-        # Determine chosen file type
-        flag_map = {
-            "settings": settings_flag,
-            "keybindings": keybindings_flag,
-            "extensions": extensions_flag,
-            "snippets": snippets_flag,
-            "tasks": tasks_flag,
-        }
-
-        chosen = [name for name, val in flag_map.items() if val]
-
-        if len(chosen) > 1:
-            console.print("[red]Error:[/red] Please specify only one of --settings/--keybindings/--extensions/--snippets/--tasks")
-            raise typer.Exit(1)
-
-        file_type = chosen[0] if chosen else "settings"
-
-        edit_command.run(
-            layer_type=layer_type,
-            layer_name=layer_name,
-            file_type=file_type,
-            sort=sort,
-            yes=yes,
-        )
+def version_callback(value: bool) -> None:
+    """Show version information."""
+    if value:
+        from . import __version__
 
-    except VscSyncError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Edit cancelled by user.[/yellow]")
-        raise typer.Exit(1)
+        _console().print(f"vsc-sync version {__version__}")
+        raise typer.Exit()
 
 
-@app.command()
-def discover(
-    add_found: bool = typer.Option(
-        False, "--add", help="Automatically add discovered apps to configuration"
+@app.callback()
+def main(
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Enable verbose output"
+    ),
+    version: Optional[bool] = typer.Option(
+        None, "--version", "-V", callback=version_callback, help="Show version"
     ),
 ) -> None:
-    """Discover VSCode-like applications on the system."""
-    try:
-        console.print("Discovering VSCode-like applications...")
-
-        discovered_apps = AppManager.auto_discover_apps()
+    """vsc-sync: Synchronize VSCode-like configurations across multiple editors."""
+    from .utils import setup_logging
 
-        if not discovered_apps:
-            console.print("No VSCode-like applications found.")
-            return
+    setup_logging(verbose)
 
-        table = Table(title="Discovered Applications")
-        table.add_column("Alias", style="cyan")
-        table.add_column("Config Path", style="green")
-        table.add_column("Executable", style="yellow")
-        table.add_column("Status", style="magenta")
-
-        for alias, app_details in discovered_apps.items():
-            exec_status = (
-                "✓"
-                if (
-                    app_details.executable_path and app_details.executable_path.exists()
-                )
-                else "✗"
-            )
-            config_status = "✓" if app_details.config_path.exists() else "✗"
-            status = f"Config: {config_status} | Exec: {exec_status}"
-
-            table.add_row(
-                alias,
-                str(app_details.config_path),
-                (
-                    str(app_details.executable_path)
-                    if app_details.executable_path
-                    else "Not found"
-                ),
-                status,
-            )
-
-        console.print(table)
-
-        if add_found:
-            console.print("[yellow]Auto-add functionality coming soon![/yellow]")
-        else:
-            console.print(
-                "\nUse 'vsc-sync discover --add' to automatically add these to your configuration."
-            )
-            console.print("Or use 'vsc-sync add-app' to add them individually.")
-
-    except VscSyncError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    if os.environ.get("VSC_SYNC_PREWARM") == "1" and not {
+        "--help",
+        "--version",
+        "-V",
+    } & set(sys.argv[1:]):
+        threading.Thread(target=_prewarm, daemon=True).start()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,4 @@
+"""Typer definitions for the individual vsc-sync sub-commands.
+
+Each module is imported on demand by :class:`vsc_sync.cli.LazySubGroup`.
+"""
@@ -0,0 +1,32 @@
+"""The ``vsc-sync add-app`` command."""
+
+from typing import Optional
+
+import typer
+
+from ..cli import _console, _handle
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+@_handle()
+def add_app(
+    alias: str = typer.Argument(..., help="Unique alias for the application"),
+    config_path: str = typer.Argument(
+        ..., help="Path to the app's user configuration directory"
+    ),
+    executable: Optional[str] = typer.Option(
+        None, "--executable", help="Path to the app's executable"
+    ),
+) -> None:
+    """Register a new VSCode-like application."""
+    console = _console()
+    # TODO: Implement add-app logic
+    console.print(f"[yellow]Add-app functionality coming soon![/yellow]")
+    console.print(f"Will register app '{alias}' with config path: {config_path}")
+    if executable:
+        console.print(f"Executable: {executable}")
+
+
+command = typer.main.get_command(app)
@@ -0,0 +1,93 @@
+"""The ``vsc-sync apply`` command."""
+
+from typing import Optional
+
+import typer
+
+from ..cli import _console, _get_cm, _handle
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+@_handle("Apply cancelled by user.")
+def apply(
+    app_alias: str = typer.Argument(..., help="Alias of the target application"),
+    stack: Optional[list[str]] = typer.Option(
+        None, "--stack", help="Tech stack to apply (can be used multiple times)"
+    ),
+    backup: bool = typer.Option(
+        True,
+        "--backup/--no-backup",
+        help="Create backup before applying (default: enabled)",
+    ),
+    backup_suffix: Optional[str] = typer.Option(
+        None, "--backup-suffix", help="Custom backup suffix"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", "-n", help="Show what would be done without applying"
+    ),
+    force: bool = typer.Option(
+        False, "--force", "-f", help="Force overwrite without prompting"
+    ),
+    prune_extensions: bool = typer.Option(
+        False, "--prune-extensions", help="Uninstall extensions not in configuration"
+    ),
+
+    # Component selection flags
+    settings_flag: bool = typer.Option(
+        False, "--settings", help="Apply settings.json"
+    ),
+    keybindings_flag: bool = typer.Option(
+        False, "--keybindings", help="Apply keybindings.json"
+    ),
+    extensions_flag: bool = typer.Option(
+        False, "--extensions", help="Manage extensions"
+    ),
+    snippets_flag: bool = typer.Option(
+        False, "--snippets", help="Copy snippets"
+    ),
+    tasks: bool = typer.Option(
+        True, "--tasks/--no-tasks", help="Sync tasks.json (default: yes)"
+    ),
+) -> None:
+    """Apply configurations to an application."""
+    console = _console()
+    config_manager = _get_cm()
+
+    if not config_manager.is_initialized():
+        console.print(
+            "[red]vsc-sync is not initialized. Run 'vsc-sync init' first.[/red]"
+        )
+        raise typer.Exit(1)
+
+    from ..commands.apply_cmd import ApplyCommand
+
+    apply_command = ApplyCommand(config_manager)
+    # Determine components; if none specified => all True
+    specified = any(
+        [settings_flag, keybindings_flag, extensions_flag, snippets_flag]
+    )
+
+    include_settings = settings_flag or not specified
+    include_keybindings = keybindings_flag or not specified
+    include_extensions = extensions_flag or not specified
+    include_snippets = snippets_flag or not specified
+
+    apply_command.run(
+        app_alias=app_alias,
+        stacks=stack,
+        backup=backup,
+        backup_suffix=backup_suffix,
+        dry_run=dry_run,
+        force=force,
+        prune_extensions=prune_extensions,
+        tasks=tasks,
+        include_settings=include_settings,
+        include_keybindings=include_keybindings,
+        include_extensions=include_extensions,
+        include_snippets=include_snippets,
+    )
+
+
+command = typer.main.get_command(app)
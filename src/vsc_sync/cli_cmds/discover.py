@@ -0,0 +1,87 @@
+"""The ``vsc-sync discover`` command."""
+
+import typer
+
+from ..cli import _console, _handle, _print_table
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+@_handle()
+def discover(
+    add_found: bool = typer.Option(
+        False, "--add", help="Automatically add discovered apps to configuration"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignore cached discovery results and probe again"
+    ),
+) -> None:
+    """Discover VSCode-like applications on the system."""
+    console = _console()
+    from ..core.app_manager import AppManager
+
+    console.print("Discovering VSCode-like applications...")
+
+    discovered_apps = AppManager.auto_discover_apps(use_cache=not no_cache)
+
+    if not discovered_apps:
+        console.print("No VSCode-like applications found.")
+        return
+
+    from ..utils import paths_exist
+
+    exists = paths_exist(
+        path
+        for app_details in discovered_apps.values()
+        for path in (app_details.config_path, app_details.executable_path)
+        if path
+    )
+
+    rows = []
+    for alias, app_details in discovered_apps.items():
+        exec_status = (
+            "✓"
+            if (
+                app_details.executable_path
+                and exists[app_details.executable_path]
+            )
+            else "✗"
+        )
+        config_status = "✓" if exists[app_details.config_path] else "✗"
+        status = f"Config: {config_status} | Exec: {exec_status}"
+
+        rows.append(
+            [
+                alias,
+                str(app_details.config_path),
+                (
+                    str(app_details.executable_path)
+                    if app_details.executable_path
+                    else "Not found"
+                ),
+                status,
+            ]
+        )
+
+    _print_table(
+        "Discovered Applications",
+        [
+            ("Alias", "cyan"),
+            ("Config Path", "green"),
+            ("Executable", "yellow"),
+            ("Status", "magenta"),
+        ],
+        rows,
+    )
+
+    if add_found:
+        console.print("[yellow]Auto-add functionality coming soon![/yellow]")
+    else:
+        console.print(
+            "\nUse 'vsc-sync discover --add' to automatically add these to your configuration."
+        )
+        console.print("Or use 'vsc-sync add-app' to add them individually.")
+
+
+command = typer.main.get_command(app)
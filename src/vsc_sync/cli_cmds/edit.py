@@ -0,0 +1,88 @@
+"""The ``vsc-sync edit`` command."""
+
+from typing import Optional
+
+import typer
+
+from ..cli import _console, _get_cm, _handle
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+@_handle("Edit cancelled by user.")
+def edit(
+    layer_type: str = typer.Argument(
+        ..., help="Layer type: base, app, stack, project, live"
+    ),
+    layer_name: Optional[str] = typer.Argument(
+        None, help="Layer name (not needed for base)"
+    ),
+    # Mutually-exclusive file-type flags (default: settings)
+    settings_flag: bool = typer.Option(
+        False, "--settings", help="Edit settings.json"
+    ),
+    keybindings_flag: bool = typer.Option(
+        False, "--keybindings", help="Edit keybindings.json"
+    ),
+    extensions_flag: bool = typer.Option(
+        False, "--extensions", help="Edit extensions.json"
+    ),
+    snippets_flag: bool = typer.Option(
+        False, "--snippets", help="Edit snippets directory"
+    ),
+    tasks_flag: bool = typer.Option(
+        False, "--tasks", help="Edit tasks.json"
+    ),
+    sort: bool = typer.Option(
+        False,
+        "--sort",
+        help="Sort keybindings.json (only when editing keybindings)",
+    ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Assume yes for overwrite confirmation while sorting",
+    ),
+) -> None:
+    """Open configuration files for editing."""
+    console = _console()
+    config_manager = _get_cm()
+
+    if not config_manager.is_initialized():
+        console.print(
+            "[red]vsc-sync is not initialized. Run 'vsc-sync init' first.[/red]"
+        )
+        raise typer.Exit(1)
+
+    from ..commands.edit_cmd import EditCommand
+
+    edit_command = EditCommand(config_manager)
+    # Determine chosen file type
+    flag_map = {
+        "settings": settings_flag,
+        "keybindings": keybindings_flag,
+        "extensions": extensions_flag,
+        "snippets": snippets_flag,
+        "tasks": tasks_flag,
+    }
+
+    chosen = [name for name, val in flag_map.items() if val]
+
+    if len(chosen) > 1:
+        console.print("[red]Error:[/red] Please specify only one of --settings/--keybindings/--extensions/--snippets/--tasks")
+        raise typer.Exit(1)
+
+    file_type = chosen[0] if chosen else "settings"
+
+    edit_command.run(
+        layer_type=layer_type,
+        layer_name=layer_name,
+        file_type=file_type,
+        sort=sort,
+        yes=yes,
+    )
+
+
+command = typer.main.get_command(app)
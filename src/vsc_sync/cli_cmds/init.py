@@ -0,0 +1,41 @@
+"""The ``vsc-sync init`` command."""
+
+from typing import Optional
+
+import typer
+
+from ..cli import _get_cm, _handle
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+@_handle("Initialization cancelled by user.")
+def init(
+    repo: Optional[str] = typer.Option(
+        None, "--repo", help="Git URL or local path to vscode-configs repository"
+    ),
+    config_file: Optional[str] = typer.Option(
+        None, "--config-file", help="Path to store vsc-sync configuration"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignore cached discovery results and probe again"
+    ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        "--non-interactive",
+        help="Accept defaults without prompting; never overwrites an existing "
+        "configuration or directory",
+    ),
+) -> None:
+    """Initialize vsc-sync for first-time use."""
+    from ..commands.init_cmd import InitCommand
+
+    config_manager = _get_cm()
+    init_command = InitCommand(config_manager, non_interactive=yes)
+    init_command.run(repo=repo, config_file=config_file, use_cache=not no_cache)
+
+
+command = typer.main.get_command(app)
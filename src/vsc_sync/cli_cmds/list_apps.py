@@ -0,0 +1,62 @@
+"""The ``vsc-sync list-apps`` command."""
+
+import typer
+
+from ..cli import _console, _get_cm, _handle, _print_table
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+@_handle()
+def list_apps(
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Show detailed information"
+    ),
+) -> None:
+    """List all registered applications."""
+    console = _console()
+    config_manager = _get_cm()
+
+    if not config_manager.is_initialized():
+        console.print(
+            "[red]vsc-sync is not initialized. Run 'vsc-sync init' first.[/red]"
+        )
+        raise typer.Exit(1)
+
+    config = config_manager.load_config()
+
+    if not config.managed_apps:
+        console.print("No applications registered yet.")
+        console.print(
+            "Use 'vsc-sync add-app' to register applications or 'vsc-sync init' to auto-discover."
+        )
+        return
+
+    # Build each column in one pass, then zip them into rows.
+    aliases = list(config.managed_apps)
+    details = list(config.managed_apps.values())
+    cfg_paths = [d.config_path for d in details]
+
+    columns = [("Alias", "cyan"), ("Config Path", "green")]
+    column_values = [aliases, [str(p) for p in cfg_paths]]
+
+    if verbose:
+        from ..utils import paths_exist
+
+        exists = paths_exist(cfg_paths)
+        columns += [("Executable", "yellow"), ("Status", "magenta")]
+        column_values += [
+            [
+                str(d.executable_path) if d.executable_path else "Not set"
+                for d in details
+            ],
+            ["✓" if exists[p] else "✗" for p in cfg_paths],
+        ]
+
+    rows = list(zip(*column_values))
+
+    _print_table("Registered Applications", columns, rows)
+
+
+command = typer.main.get_command(app)
@@ -0,0 +1,120 @@
+"""The ``vsc-sync pull`` command."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from ..cli import _console, _get_cm, _handle
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command(help=(
+    "Pull configurations from an application or project into the vscode-configs "
+    "repository.  [bold red]⚠ Existing files in the target layer may be overwritten![/bold red]"
+))
+@_handle("Pull cancelled by user.")
+def pull(
+    app_alias: Optional[str] = typer.Argument(
+        None,
+        help="Alias of the source application (required unless --from-project is used)",
+    ),
+    layer_type: str = typer.Option(
+        ..., "--to", help="Target layer type: base, app, stack, project"
+    ),
+    layer_name: Optional[str] = typer.Argument(
+        None, help="Layer name (required for stack, optional for app/project)"
+    ),
+    from_project: Optional[str] = typer.Option(
+        None,
+        "--from-project",
+        help="Pull from project .vscode directory instead of app",
+    ),
+    settings: bool = typer.Option(
+        True,
+        "--settings/--no-settings",
+        help="Include settings.json (default: yes)",
+    ),
+    keybindings: bool = typer.Option(
+        False, "--keybindings", help="Include keybindings.json"
+    ),
+    extensions: bool = typer.Option(
+        False, "--extensions", help="Include extensions list"
+    ),
+    snippets: bool = typer.Option(
+        False, "--snippets", help="Include snippets directory"
+    ),
+    overwrite: bool = typer.Option(
+        False,
+        "--overwrite",
+        help="[dangerous] Overwrite existing files without prompting",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        "-n",
+        help="Show what would be pulled without making changes",
+    ),
+    full_preview: bool = typer.Option(
+        False,
+        "--full-preview",
+        help="Show full content preview in pager (like git diff)",
+    ),
+    no_pager: bool = typer.Option(
+        False, "--no-pager", help="Disable pager for full preview output"
+    ),
+) -> None:
+    """Pull configurations from an application or project to the repository."""
+    console = _console()
+    config_manager = _get_cm()
+
+    if not config_manager.is_initialized():
+        console.print(
+            "[red]vsc-sync is not initialized. Run 'vsc-sync init' first.[/red]"
+        )
+        raise typer.Exit(1)
+
+    # Validate arguments
+    if from_project and app_alias:
+        console.print(
+            "[red]Error:[/red] Cannot specify both app_alias and --from-project"
+        )
+        raise typer.Exit(1)
+
+    if not from_project and not app_alias:
+        console.print(
+            "[red]Error:[/red] Must specify either app_alias or --from-project"
+        )
+        raise typer.Exit(1)
+
+    # Warn about extensions in project mode
+    if from_project and extensions:
+        console.print(
+            "[yellow]Warning:[/yellow] --include-extensions is not available in project mode, ignoring"
+        )
+        extensions = False
+
+    # Convert from_project to Path if provided
+    project_path = Path(from_project) if from_project else None
+
+    from ..commands.pull_cmd import PullCommand
+
+    pull_command = PullCommand(config_manager)
+    pull_command.run(
+        app_alias=app_alias,
+        layer_type=layer_type,
+        layer_name=layer_name,
+        project_path=project_path,
+        include_settings=settings,
+        include_keybindings=keybindings,
+        include_extensions=extensions,
+        include_snippets=snippets,
+        overwrite=overwrite,
+        dry_run=dry_run,
+        full_preview=full_preview,
+        no_pager=no_pager,
+    )
+
+
+command = typer.main.get_command(app)
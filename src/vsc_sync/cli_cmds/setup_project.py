@@ -0,0 +1,57 @@
+"""The ``vsc-sync setup-project`` command."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from ..cli import _console, _get_cm, _handle
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+@_handle("Setup cancelled by user.")
+def setup_project(
+    project_path: str = typer.Argument(
+        ".", help="Path to the project directory (defaults to current directory)"
+    ),
+    stack: Optional[list[str]] = typer.Option(
+        None,
+        "--stack",
+        help="Tech stack(s) to use for project setup (can be used multiple times)",
+    ),
+    from_project_type: Optional[str] = typer.Option(
+        None,
+        "--from-project-type",
+        help="Use predefined project type as base configuration",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Overwrite existing .vscode files without prompting",
+    ),
+) -> None:
+    """Set up .vscode/ configuration files for a project."""
+    console = _console()
+    config_manager = _get_cm()
+
+    if not config_manager.is_initialized():
+        console.print(
+            "[red]vsc-sync is not initialized. Run 'vsc-sync init' first.[/red]"
+        )
+        raise typer.Exit(1)
+
+    from ..commands.setup_project_cmd import SetupProjectCommand
+
+    setup_command = SetupProjectCommand(config_manager)
+    setup_command.run(
+        project_path=Path(project_path),
+        stacks=stack,
+        from_project_type=from_project_type,
+        force=force,
+    )
+
+
+command = typer.main.get_command(app)
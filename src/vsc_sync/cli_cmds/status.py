@@ -0,0 +1,38 @@
+"""The ``vsc-sync status`` command."""
+
+from typing import Optional
+
+import typer
+
+from ..cli import _console, _get_cm, _handle
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+@_handle("Status check cancelled by user.")
+def status(
+    app_alias: Optional[str] = typer.Argument(
+        None, help="App alias to check (if not provided, checks all)"
+    ),
+    stack: Optional[list[str]] = typer.Option(
+        None, "--stack", help="Stacks to consider for comparison"
+    ),
+) -> None:
+    """Show configuration status for applications."""
+    console = _console()
+    config_manager = _get_cm()
+
+    if not config_manager.is_initialized():
+        console.print(
+            "[red]vsc-sync is not initialized. Run 'vsc-sync init' first.[/red]"
+        )
+        raise typer.Exit(1)
+
+    from ..commands.status_cmd import StatusCommand
+
+    status_command = StatusCommand(config_manager)
+    status_command.run(app_alias=app_alias, stacks=stack)
+
+
+command = typer.main.get_command(app)
@@ -2,15 +2,28 @@
 
 import json
 import logging
+import os
 import shutil
+import sys
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from rich.console import Console
-from rich.panel import Panel
 from rich.prompt import Confirm
-from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
@@ -24,6 +37,114 @@ from ..models import AppDetails, MergeResult
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Settings with more top-level keys than this skip the full JSON dump in diffs.
+FULL_DUMP_MAX_KEYS = 200
+
+# Read size when comparing current and incoming config files.
+COMPARE_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_flat(d: Dict, prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """Yield ``(dotted_key, value)`` for every leaf of a nested dictionary.
+
+    Keys are interned: the same dotted names recur on both sides of a diff,
+    so the set operations that follow mostly compare by identity.
+    """
+    frames: Deque[Tuple[str, Dict]] = deque([(prefix, d)])
+    while frames:
+        prefix, current = frames.pop()
+        for k, v in current.items():
+            key = sys.intern(prefix + "." + k if prefix else k)
+            if isinstance(v, dict):
+                frames.append((key, v))
+            else:
+                yield key, v
+
+
+def flatten_dict(d: Dict) -> Dict[str, Any]:
+    """Flatten a nested dictionary into dotted keys for comparison."""
+    return dict(_iter_flat(d))
+
+
+def diff_settings(
+    current: Dict, new: Dict
+) -> Tuple[Dict[str, Any], Dict[str, Tuple[Any, Any]], Dict[str, Any]]:
+    """Return ``(added, modified, removed)`` leaf settings between two dicts.
+
+    Keys are dotted as in :func:`flatten_dict`.  Subtrees that compare equal
+    are skipped without being walked, so the cost follows the size of the
+    change rather than the size of the settings.
+    """
+    added: Dict[str, Any] = {}
+    modified: Dict[str, Tuple[Any, Any]] = {}
+    removed: Dict[str, Any] = {}
+
+    frames: Deque[Tuple[str, Dict, Dict]] = deque([("", current, new)])
+    while frames:
+        prefix, cur, nxt = frames.pop()
+        for k, new_v in nxt.items():
+            key = sys.intern(prefix + "." + k if prefix else k)
+            if k not in cur:
+                _add_leaves(added, key, new_v)
+                continue
+            cur_v = cur[k]
+            if cur_v is new_v or cur_v == new_v:
+                continue
+            cur_is_dict = isinstance(cur_v, dict)
+            new_is_dict = isinstance(new_v, dict)
+            if cur_is_dict and new_is_dict:
+                frames.append((key, cur_v, new_v))
+            elif not cur_is_dict and not new_is_dict:
+                modified[key] = (cur_v, new_v)
+            else:
+                # A leaf replaced by a subtree (or vice versa) shares no keys.
+                _add_leaves(removed, key, cur_v)
+                _add_leaves(added, key, new_v)
+        for k, cur_v in cur.items():
+            if k not in nxt:
+                _add_leaves(removed, prefix + "." + k if prefix else k, cur_v)
+
+    return added, modified, removed
+
+
+def _add_leaves(out: Dict[str, Any], key: str, value: Any) -> None:
+    """Record ``value`` under ``key``, flattening it first if it is a dict."""
+    if isinstance(value, dict):
+        out.update(_iter_flat(value, key))
+    else:
+        out[sys.intern(key)] = value
+
+
+def _section(title: str, style: str, lines: Iterable[str]) -> Text:
+    """Build a styled heading plus its plain lines as one printable block.
+
+    Printing the block once replaces a ``console.print`` (render and write)
+    per line, and keeps setting values from being parsed as Rich markup.
+    """
+    text = Text(title, style=style)
+    # Join first so the Text gets one unstyled span instead of two per line.
+    body = "\n".join(lines)
+    if body:
+        text.append("\n" + body)
+    return text
+
+
+def _files_equal(a: Path, b: Path) -> bool:
+    """Return True if two files have identical bytes.
+
+    Differing sizes settle it from ``stat`` alone; otherwise the files are
+    compared chunk by chunk and the read stops at the first difference.
+    """
+    if os.stat(a).st_size != os.stat(b).st_size:
+        return False
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        while True:
+            chunk_a = fa.read(COMPARE_CHUNK_SIZE)
+            if chunk_a != fb.read(COMPARE_CHUNK_SIZE):
+                return False
+            if not chunk_a:
+                return True
+
 
 class ApplyCommand:
     """Handles applying configurations to VSCode-like applications."""
@@ -32,6 +153,13 @@ class ApplyCommand:
         self.config_manager = config_manager
         self.config = config_manager.load_config()
         self.layer_manager = LayerConfigManager(self.config.vscode_configs_path)
+        self._available_apps_str = ", ".join(self.config.managed_apps) or "none"
+        # Raw bytes of files read while diffing; None records a missing file.
+        self._file_cache: Dict[Path, Optional[bytes]] = {}
+        # App alias -> installed extension IDs; listing spawns the app's CLI.
+        self._installed_ext_cache: Dict[str, Set[str]] = {}
+        # Listings started ahead of time by run(), consumed by _get_installed.
+        self._installed_ext_futures: Dict[str, "Future[List[str]]"] = {}
 
     def run(
         self,
@@ -57,11 +185,33 @@ class ApplyCommand:
             # Step 1: Validate app and get details
             app_details = self._validate_app(app_alias)
 
-            # Step 2: Always create backup before cleaning (unless dry run)
-            if not dry_run:
-                self._create_backup(app_details, backup_suffix)
+            stacks = stacks or []
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                # Step 2: Always create backup before cleaning (unless dry run).
+                # The backup only reads the app directory and the merge only
+                # reads the configs repo, so the two overlap.
+                backup_future = (
+                    None
+                    if dry_run
+                    else pool.submit(self._create_backup, app_details, backup_suffix)
+                )
 
-            # Step 3: Clean user directory for fresh start
+                # Step 3: Merge configuration layers
+                merge_result = self.layer_manager.merge_layers(
+                    app_alias=app_alias, stacks=stacks
+                )
+
+                if backup_future is not None:
+                    backup_future.result()
+
+            if (
+                include_extensions
+                and app_details.executable_path
+                and merge_result.extensions
+            ):
+                self._prefetch_installed(app_details)
+
+            # Step 4: Clean user directory for fresh start
             if not dry_run:
                 self._clean_user_directory(
                     app_details,
@@ -71,12 +221,6 @@ class ApplyCommand:
                     tasks,
                 )
 
-            # Step 4: Merge configuration layers
-            stacks = stacks or []
-            merge_result = self.layer_manager.merge_layers(
-                app_alias=app_alias, stacks=stacks
-            )
-
             # Step 5: Show what will be applied
             self._show_merge_summary(merge_result, stacks)
 
@@ -140,10 +284,9 @@ class ApplyCommand:
     def _validate_app(self, app_alias: str) -> AppDetails:
         """Validate that the app exists and is properly configured."""
         if app_alias not in self.config.managed_apps:
-            available_apps = list(self.config.managed_apps.keys())
             raise VscSyncError(
                 f"App '{app_alias}' is not registered. "
-                f"Available apps: {', '.join(available_apps) if available_apps else 'none'}"
+                f"Available apps: {self._available_apps_str}"
             )
 
         app_details = self.config.managed_apps[app_alias]
@@ -155,13 +298,30 @@ class ApplyCommand:
 
         return app_details
 
+    def _read_cached(self, path: Path) -> Optional[bytes]:
+        """Return the bytes of ``path`` (None if missing), reading it at most once."""
+        try:
+            return self._file_cache[path]
+        except KeyError:
+            pass
+        try:
+            data: Optional[bytes] = path.read_bytes()
+        except FileNotFoundError:
+            data = None
+        self._file_cache[path] = data
+        return data
+
+    def _invalidate_file_cache(self, directory: Path) -> None:
+        """Forget cached reads of files under ``directory`` after writing there."""
+        for path in [p for p in self._file_cache if directory in p.parents]:
+            del self._file_cache[path]
+
     def _create_backup(
         self, app_details: AppDetails, backup_suffix: Optional[str]
     ) -> Path:
         """Create a backup of the app's configuration directory."""
         if backup_suffix is None:
-            timestamp = int(time.time())
-            backup_suffix = f"bak.{timestamp}"
+            backup_suffix = self._default_backup_suffix(app_details.config_path)
 
         console.print(f"Creating backup with suffix: {backup_suffix}")
         backup_path = FileOperations.backup_directory(
@@ -170,6 +330,20 @@ class ApplyCommand:
         console.print(f"[green]Backup created:[/green] {backup_path}")
         return backup_path
 
+    @staticmethod
+    def _default_backup_suffix(config_path: Path) -> str:
+        """Return ``bak.<epoch seconds>``, numbered if that backup already exists.
+
+        Two applies within the same second would otherwise pick the same
+        name and the second backup would fail.
+        """
+        suffix = f"bak.{time.time_ns() // 1_000_000_000}"
+        candidate, n = suffix, 0
+        while config_path.with_name(f"{config_path.name}.{candidate}").exists():
+            n += 1
+            candidate = f"{suffix}.{n}"
+        return candidate
+
     def _clean_user_directory(
         self,
         app_details: AppDetails,
@@ -190,6 +364,7 @@ class ApplyCommand:
         console.print(
             f"[yellow]Cleaning managed config files in:[/yellow] {app_details.config_path}"
         )
+        self._invalidate_file_cache(app_details.config_path)
 
         managed_files: list[str] = []
         if include_settings:
@@ -201,17 +376,23 @@ class ApplyCommand:
         if include_snippets:
             managed_files.append("snippets")
 
+        # One directory scan replaces an exists/is_file/is_dir probe per item.
+        managed = set(managed_files)
+        with os.scandir(app_details.config_path) as it:
+            present = {entry.name: entry for entry in it if entry.name in managed}
+
         cleaned_count = 0
         for item_name in managed_files:
-            item_path = app_details.config_path / item_name
-            if item_path.exists():
-                if item_path.is_file():
-                    item_path.unlink()
-                    console.print(f"[dim]  Removed file: {item_name}[/dim]")
-                elif item_path.is_dir():
-                    shutil.rmtree(item_path)
-                    console.print(f"[dim]  Removed directory: {item_name}[/dim]")
-                cleaned_count += 1
+            entry = present.get(item_name)
+            if entry is None:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+                console.print(f"[dim]  Removed directory: {item_name}[/dim]")
+            else:
+                os.unlink(entry.path)
+                console.print(f"[dim]  Removed file: {item_name}[/dim]")
+            cleaned_count += 1
 
         # Preserve everything else:
         # - globalStorage/ (auth, licenses, app data)
@@ -285,66 +466,78 @@ class ApplyCommand:
         console.print("\n[bold]Settings.json changes:[/bold]")
 
         current_settings_file = app_details.config_path / "settings.json"
-        current_settings = FileOperations.read_json_file(current_settings_file)
+        raw = self._read_cached(current_settings_file)
+        try:
+            current_settings = json.loads(raw) if raw else {}
+        except ValueError as e:
+            logger.warning(f"Failed to read JSON file {current_settings_file}: {e}")
+            current_settings = {}
 
         if current_settings == merged_settings:
             console.print("[green]No changes needed[/green]")
             return
 
-        # Show current vs new settings
-        if current_settings:
-            console.print("[dim]Current settings:[/dim]")
-            current_json = json.dumps(current_settings, indent=2, sort_keys=True)
+        # Show current vs new settings.  Past a certain size the full dumps are
+        # slow to highlight and unreadable anyway; the key-level changes
+        # printed below carry the same information.
+        if max(len(current_settings), len(merged_settings)) > FULL_DUMP_MAX_KEYS:
             console.print(
-                Syntax(current_json, "json", line_numbers=False, theme="monokai")
+                "[dim]Settings too large to show in full; listing changes only.[/dim]"
             )
+        else:
+            # Imported here: rich.syntax pulls in pygments (~40ms) and only the
+            # dry-run settings dump needs it.
+            from rich.syntax import Syntax
+
+            if current_settings:
+                console.print("[dim]Current settings:[/dim]")
+                current_json = json.dumps(current_settings, indent=2, sort_keys=True)
+                console.print(
+                    Syntax(current_json, "json", line_numbers=False, theme="monokai")
+                )
 
-        console.print("[dim]New settings:[/dim]")
-        new_json = json.dumps(merged_settings, indent=2, sort_keys=True)
-        console.print(Syntax(new_json, "json", line_numbers=False, theme="monokai"))
+            console.print("[dim]New settings:[/dim]")
+            new_json = json.dumps(merged_settings, indent=2, sort_keys=True)
+            console.print(
+                Syntax(new_json, "json", line_numbers=False, theme="monokai")
+            )
 
         # Show added/modified/removed keys
         self._show_setting_changes(current_settings, merged_settings)
 
     def _show_setting_changes(self, current: Dict, new: Dict) -> None:
         """Show detailed setting changes."""
-
-        def flatten_dict(d: Dict, prefix: str = "") -> Dict[str, any]:
-            """Flatten nested dictionary for comparison."""
-            items = []
-            for k, v in d.items():
-                new_key = f"{prefix}.{k}" if prefix else k
-                if isinstance(v, dict):
-                    items.extend(flatten_dict(v, new_key).items())
-                else:
-                    items.append((new_key, v))
-            return dict(items)
-
-        current_flat = flatten_dict(current)
-        new_flat = flatten_dict(new)
-
-        added = set(new_flat.keys()) - set(current_flat.keys())
-        removed = set(current_flat.keys()) - set(new_flat.keys())
-        modified = {
-            k
-            for k in current_flat.keys() & new_flat.keys()
-            if current_flat[k] != new_flat[k]
-        }
+        added, modified, removed = diff_settings(current, new)
 
         if added:
-            console.print(f"[green]Added settings ({len(added)}):[/green]")
-            for key in sorted(added):
-                console.print(f"  + {key}: {new_flat[key]}")
+            console.print(
+                _section(
+                    f"Added settings ({len(added)}):",
+                    "green",
+                    (f"  + {key}: {added[key]}" for key in sorted(added)),
+                )
+            )
 
         if modified:
-            console.print(f"[yellow]Modified settings ({len(modified)}):[/yellow]")
-            for key in sorted(modified):
-                console.print(f"  ~ {key}: {current_flat[key]} → {new_flat[key]}")
+            console.print(
+                _section(
+                    f"Modified settings ({len(modified)}):",
+                    "yellow",
+                    (
+                        f"  ~ {key}: {modified[key][0]} → {modified[key][1]}"
+                        for key in sorted(modified)
+                    ),
+                )
+            )
 
         if removed:
-            console.print(f"[red]Removed settings ({len(removed)}):[/red]")
-            for key in sorted(removed):
-                console.print(f"  - {key}: {current_flat[key]}")
+            console.print(
+                _section(
+                    f"Removed settings ({len(removed)}):",
+                    "red",
+                    (f"  - {key}: {removed[key]}" for key in sorted(removed)),
+                )
+            )
 
     def _show_keybindings_diff(
         self, app_details: AppDetails, keybindings_source: Optional[Path]
@@ -356,10 +549,7 @@ class ApplyCommand:
 
         if keybindings_source:
             if current_keybindings_file.exists():
-                current_content = current_keybindings_file.read_text()
-                new_content = keybindings_source.read_text()
-
-                if current_content == new_content:
+                if _files_equal(current_keybindings_file, keybindings_source):
                     console.print("[green]No changes needed[/green]")
                 else:
                     console.print(
@@ -383,10 +573,7 @@ class ApplyCommand:
 
         if tasks_source:
             if current_tasks_file.exists():
-                current_content = current_tasks_file.read_text()
-                new_content = tasks_source.read_text()
-
-                if current_content == new_content:
+                if _files_equal(current_tasks_file, tasks_source):
                     console.print("[green]No changes needed[/green]")
                 else:
                     console.print(f"[yellow]Will replace with:[/yellow] {tasks_source}")
@@ -409,22 +596,31 @@ class ApplyCommand:
             return
 
         app_snippets_dir = app_details.config_path / "snippets"
+        # One listing of the target replaces an exists() per snippet file.
+        try:
+            with os.scandir(app_snippets_dir) as it:
+                existing = {entry.name for entry in it}
+        except FileNotFoundError:
+            existing = set()
 
         for snippets_path in snippets_paths:
             console.print(f"[green]Will copy snippets from:[/green] {snippets_path}")
 
-            if snippets_path.is_dir():
-                snippet_files = list(snippets_path.glob("*.code-snippets"))
-                for snippet_file in snippet_files:
-                    target_file = app_snippets_dir / snippet_file.name
-                    if target_file.exists():
-                        console.print(
-                            f"  [yellow]Will overwrite:[/yellow] {snippet_file.name}"
-                        )
-                    else:
-                        console.print(
-                            f"  [green]Will create:[/green] {snippet_file.name}"
-                        )
+            try:
+                with os.scandir(snippets_path) as it:
+                    names = [
+                        entry.name
+                        for entry in it
+                        if entry.name.endswith(".code-snippets")
+                    ]
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+            for name in names:
+                if name in existing:
+                    console.print(f"  [yellow]Will overwrite:[/yellow] {name}")
+                else:
+                    console.print(f"  [green]Will create:[/green] {name}")
 
     def _show_extensions_diff(
         self,
@@ -440,12 +636,16 @@ class ApplyCommand:
             return
 
         try:
-            current_extensions = set(AppManager.get_installed_extensions(app_details))
+            current_extensions = self._get_installed(app_details)
         except ExtensionError as e:
             console.print(f"[red]Cannot check current extensions:[/red] {e}")
-            console.print(f"[yellow]Would install these extensions:[/yellow]")
-            for ext in target_extensions:
-                console.print(f"  + {ext}")
+            console.print(
+                _section(
+                    "Would install these extensions:",
+                    "yellow",
+                    (f"  + {ext}" for ext in target_extensions),
+                )
+            )
             return
 
         target_extensions_set = set(target_extensions)
@@ -457,23 +657,64 @@ class ApplyCommand:
         already_installed = target_extensions_set & current_extensions
 
         if to_install:
-            console.print(f"[green]Extensions to install ({len(to_install)}):[/green]")
-            for ext in sorted(to_install):
-                console.print(f"  + {ext}")
+            console.print(
+                _section(
+                    f"Extensions to install ({len(to_install)}):",
+                    "green",
+                    (f"  + {ext}" for ext in sorted(to_install)),
+                )
+            )
 
         if to_uninstall:
-            console.print(f"[red]Extensions to uninstall ({len(to_uninstall)}):[/red]")
-            for ext in sorted(to_uninstall):
-                console.print(f"  - {ext}")
+            console.print(
+                _section(
+                    f"Extensions to uninstall ({len(to_uninstall)}):",
+                    "red",
+                    (f"  - {ext}" for ext in sorted(to_uninstall)),
+                )
+            )
 
         if already_installed:
-            console.print(f"[dim]Already installed ({len(already_installed)}):[/dim]")
-            for ext in sorted(already_installed):
-                console.print(f"  ✓ {ext}")
+            console.print(
+                _section(
+                    f"Already installed ({len(already_installed)}):",
+                    "dim",
+                    (f"  ✓ {ext}" for ext in sorted(already_installed)),
+                )
+            )
 
         if not to_install and not to_uninstall:
             console.print("[green]No extension changes needed[/green]")
 
+    def _prefetch_installed(self, app_details: AppDetails) -> None:
+        """Start listing the app's installed extensions in the background.
+
+        The executor is shut down without waiting, so cleaning, the summary
+        and the confirmation prompts go ahead while the app's CLI runs.
+        """
+        pool = ThreadPoolExecutor(max_workers=1)
+        self._installed_ext_futures[app_details.alias] = pool.submit(
+            AppManager.get_installed_extensions, app_details
+        )
+        pool.shutdown(wait=False)
+
+    def _get_installed(self, app_details: AppDetails) -> Set[str]:
+        """Return the app's installed extensions, listing them once per command."""
+        installed = self._installed_ext_cache.get(app_details.alias)
+        if installed is None:
+            pending = self._installed_ext_futures.pop(app_details.alias, None)
+            if pending is not None:
+                installed = set(pending.result())
+            else:
+                installed = set(AppManager.get_installed_extensions(app_details))
+            self._installed_ext_cache[app_details.alias] = installed
+        return installed
+
+    def _forget_installed(self, app_details: AppDetails) -> None:
+        """Drop cached or pending extension listings once they are stale."""
+        self._installed_ext_cache.pop(app_details.alias, None)
+        self._installed_ext_futures.pop(app_details.alias, None)
+
     def _confirm_apply(
         self,
         app_details: AppDetails,
@@ -543,6 +784,7 @@ class ApplyCommand:
     ) -> None:
         """Actually apply the configurations."""
         console.print("\n[bold]Applying configurations...[/bold]")
+        self._invalidate_file_cache(app_details.config_path)
 
         # Apply settings.json
         if include_settings and merge_result.merged_settings:
@@ -605,14 +847,25 @@ class ApplyCommand:
 
         FileOperations.ensure_directory(app_snippets_dir)
 
+        # Later layers win, so collect destinations first and copy each once.
+        copies: Dict[Path, Path] = {}
         snippets_applied = 0
         for snippets_path in snippets_paths:
-            if snippets_path.is_dir():
-                FileOperations.copy_directory_contents(
-                    snippets_path, app_snippets_dir, overwrite_existing=True
-                )
-                snippet_files = list(snippets_path.glob("*.code-snippets"))
-                snippets_applied += len(snippet_files)
+            if not snippets_path.is_dir():
+                continue
+            with os.scandir(snippets_path) as it:
+                for entry in it:
+                    target = app_snippets_dir / entry.name
+                    if entry.is_dir():
+                        shutil.copytree(entry.path, target, dirs_exist_ok=True)
+                    elif entry.is_file():
+                        copies[target] = Path(entry.path)
+                        if entry.name.endswith(".code-snippets"):
+                            snippets_applied += 1
+
+        FileOperations.copy_files(
+            (source, target) for target, source in copies.items()
+        )
 
         console.print(f"[green]✓[/green] {snippets_applied} snippet files applied")
 
@@ -630,8 +883,9 @@ class ApplyCommand:
             f"[yellow]Cleaning extensions directory:[/yellow] {extension_dir}"
         )
 
+        self._forget_installed(app_details)
         try:
-            shutil.rmtree(extension_dir)
+            FileOperations.parallel_rmtree(extension_dir)
             console.print(f"[green]✓[/green] Extensions directory cleaned")
         except Exception as e:
             console.print(f"[red]Failed to clean extensions directory:[/red] {e}")
@@ -660,9 +914,7 @@ class ApplyCommand:
                 to_uninstall = set()
             else:
                 # Normal case: check what's currently installed
-                current_extensions = set(
-                    AppManager.get_installed_extensions(app_details)
-                )
+                current_extensions = self._get_installed(app_details)
                 target_extensions_set = set(target_extensions)
 
                 to_install = target_extensions_set - current_extensions
@@ -672,25 +924,18 @@ class ApplyCommand:
                     else set()
                 )
 
-            # Install extensions
-            installed_count = 0
-            for extension in to_install:
-                console.print(f"Installing {extension}...")
-                if AppManager.install_extension(app_details, extension):
-                    installed_count += 1
-                    console.print(f"[green]✓[/green] Installed {extension}")
-                else:
-                    console.print(f"[red]✗[/red] Failed to install {extension}")
-
+            installed_count = self._run_extension_ops(
+                app_details, to_install, AppManager.install_extensions_batch, "Install"
+            )
             # Uninstall extensions (if prune_extensions is enabled)
-            uninstalled_count = 0
-            for extension in to_uninstall:
-                console.print(f"Uninstalling {extension}...")
-                if AppManager.uninstall_extension(app_details, extension):
-                    uninstalled_count += 1
-                    console.print(f"[green]✓[/green] Uninstalled {extension}")
-                else:
-                    console.print(f"[red]✗[/red] Failed to uninstall {extension}")
+            uninstalled_count = self._run_extension_ops(
+                app_details,
+                to_uninstall,
+                AppManager.uninstall_extensions_batch,
+                "Uninstall",
+            )
+            if to_install or to_uninstall:
+                self._forget_installed(app_details)
 
             if installed_count > 0 or uninstalled_count > 0:
                 console.print(
@@ -702,6 +947,34 @@ class ApplyCommand:
         except ExtensionError as e:
             console.print(f"[red]Extension management failed:[/red] {e}")
 
+    def _run_extension_ops(
+        self,
+        app_details: AppDetails,
+        extensions: Set[str],
+        batch_operation: Callable[[AppDetails, List[str]], Dict[str, bool]],
+        verb: str,
+    ) -> int:
+        """Run ``batch_operation`` once for all extensions; return the successes.
+
+        A single CLI process handles the whole set, so the cost is one spawn
+        rather than one per extension.
+        """
+        if not extensions:
+            return 0
+
+        with console.status(f"{verb}ing {len(extensions)} extensions..."):
+            results = batch_operation(app_details, sorted(extensions))
+
+        lines = []
+        for extension, ok in results.items():
+            if ok:
+                lines.append(f"[green]✓[/green] {verb}ed {extension}")
+            else:
+                lines.append(f"[red]✗[/red] Failed to {verb.lower()} {extension}")
+        console.print("\n".join(lines))
+
+        return sum(results.values())
+
     def _show_success_message(
         self,
         app_details: AppDetails,
@@ -1,19 +1,37 @@
 """Implementation of the edit command."""
 
+import functools
+import hashlib
+import json
 import logging
-import subprocess
+import os
+import re
+import shutil
+import stat
+import struct
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from rich.console import Console
-from rich.prompt import Confirm
+try:
+    import msgspec.json
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from ..config import ConfigManager
+from ..core.file_ops import FileOperations
 from ..exceptions import VscSyncError
+from ..utils import get_vsc_sync_cache_dir
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 logger = logging.getLogger(__name__)
-console = Console()
 
 FILE_TYPE_MAPPING = {
     "settings": "settings.json",
@@ -23,6 +41,29 @@ FILE_TYPE_MAPPING = {
     "snippets": "snippets",
 }
 
+# One pass over a JSONC document: string literals are matched (and kept via
+# ``\1``) so that comment markers inside them, e.g. URLs, survive; ``//`` and
+# ``/* */`` comments match with group 1 unset and are replaced by nothing.
+_COMMENT_RE = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*.*?\*/', re.S)
+# The same over raw UTF-8, whose multi-byte sequences never contain '"',
+# '\\', '/' or '*' bytes.
+_COMMENT_RE_B = re.compile(_COMMENT_RE.pattern.encode("ascii"), re.S)
+
+# Fixed-width middle of a keybinding sort key: has_when, num_ops, len_when.
+_SORT_KEY_FIELDS = struct.Struct(">BII")
+
+# Keybinding fields read for every entry while building sort keys.
+_KEY_FIELD = sys.intern("key")
+_WHEN_FIELD = sys.intern("when")
+_COMMAND_FIELD = sys.intern("command")
+_EMPTY_SORT_KEY = b"\x00" + _SORT_KEY_FIELDS.pack(0, 0, 0) + b"\x00"
+
+# Editor CLIs tried in order before falling back to the platform opener.
+EDITOR_CANDIDATES = ("code", "codium", "cursor")
+
+# Sidecar recording keybindings files that ``--sort`` left untouched since.
+_SORTED_CACHE_NAME = "sorted-keybindings.json"
+
 LAYER_TYPE_PATHS = {
     "base": "base",
     "app": "apps",
@@ -31,6 +72,181 @@ LAYER_TYPE_PATHS = {
     "live": None,  # Special case for actual app configs
 }
 
+# Starting content for configuration files created by ``edit``.
+_INITIAL_CONTENT = {
+    "settings": "{\n}\n",
+    "keybindings": "[\n]\n",
+    "extensions": '{\n  "recommendations": [\n  ]\n}\n',
+    "tasks": '{\n  "version": "2.0.0",\n  "tasks": []\n}\n',
+}
+
+# Listed in "invalid type" errors.
+_LAYER_TYPES_STR = ", ".join(LAYER_TYPE_PATHS)
+_FILE_TYPES_STR = ", ".join(FILE_TYPE_MAPPING)
+
+
+def _loads_json(text: Union[str, bytes]) -> Any:
+    """Parse JSON text or UTF-8 bytes with msgspec or orjson when installed.
+
+    Input the fast decoder rejects is re-parsed by the stdlib, which also
+    accepts NaN and arbitrarily large integers and raises the usual
+    :class:`json.JSONDecodeError` for genuinely invalid documents.
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(text)
+        except msgspec.DecodeError:
+            pass
+    elif orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialise ``data`` as two-space indented UTF-8 JSON, without newline.
+
+    Uses orjson when it is installed; the stdlib encoder produces the same
+    layout and covers anything orjson rejects, such as huge integers.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _console() -> "Console":
+    """Return this module's Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _keybinding_sort_key(item: Any) -> bytes:
+    """Build a normalized byte key implementing the PRD ordering rules.
+
+    See :meth:`EditCommand._sort_keybindings` for the rules.  Fields are
+    concatenated so one ``bytes`` comparison (a C ``memcmp``) orders
+    bindings exactly as the tuple ``(key, has_when, num_ops, len_when,
+    when, command)`` would: UTF-8 preserves code point order, the ``\\x00``
+    separators sort before any real character, and the numeric fields are
+    fixed-width big-endian.
+    """
+    if not isinstance(item, dict):
+        # Non-dict items go to the top to avoid crashing; should not
+        # happen with valid VS Code keybindings.json.
+        return _EMPTY_SORT_KEY
+
+    key_str = str(item.get(_KEY_FIELD, ""))
+
+    when_raw = item.get(_WHEN_FIELD)
+    has_when = 1 if when_raw else 0  # 0 → *no* when, comes first
+
+    when_str = when_raw if when_raw else ""
+
+    # Heuristic specificity score: (number_of_ops, len_when).
+    # Overlapping operator tokens are impossible because they
+    # differ by the first char.
+    num_ops = when_str.count("&&") + when_str.count("||")
+    len_when = len(when_str)
+
+    command_str = str(item.get(_COMMAND_FIELD, ""))
+
+    return b"".join(
+        (
+            key_str.lower().encode("utf-8", "surrogatepass"),  # primary
+            b"\x00",
+            # secondary, then tertiary (ops count, when length)
+            _SORT_KEY_FIELDS.pack(has_when, num_ops, len_when),
+            when_str.lower().encode("utf-8", "surrogatepass"),  # quaternary
+            b"\x00",
+            command_str.lower().encode("utf-8", "surrogatepass"),  # tie-break
+        )
+    )
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Return ``path``'s stat result, or None if it does not exist."""
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
+def _file_signature(st: os.stat_result, data: bytes) -> List[Union[int, str]]:
+    """Return ``[mtime_ns, size, blake2b]`` identifying a file's contents."""
+    return [
+        st.st_mtime_ns,
+        st.st_size,
+        hashlib.blake2b(data, digest_size=16).hexdigest(),
+    ]
+
+
+def _load_sorted_cache() -> Dict[str, list]:
+    """Load the sorted-keybindings sidecar, treating any problem as empty."""
+    cache_file = get_vsc_sync_cache_dir() / _SORTED_CACHE_NAME
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _remember_sorted(file_path: Path, signature: List[Union[int, str]]) -> None:
+    """Record that ``file_path`` is sorted; failures only cost a re-sort."""
+    cache = _load_sorted_cache()
+    cache[str(file_path.resolve())] = signature
+    cache_file = get_vsc_sync_cache_dir() / _SORTED_CACHE_NAME
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError as e:
+        logger.debug(f"Could not write sort cache {cache_file}: {e}")
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_editor(path_env: str) -> Optional[str]:
+    """Return the first of :data:`EDITOR_CANDIDATES` found on ``path_env``.
+
+    Lookups use :func:`shutil.which`, which only stats ``PATH`` entries.  The
+    answer is memoised per process and persisted in the cache directory,
+    keyed by a hash of ``path_env``; a persisted editor is re-checked before
+    it is trusted.
+    """
+    path_key = hashlib.blake2b(path_env.encode("utf-8"), digest_size=16).hexdigest()
+    cache_file = get_vsc_sync_cache_dir() / "editor"
+
+    try:
+        cached_key, _, cached_editor = cache_file.read_text(encoding="utf-8").partition(
+            "\n"
+        )
+    except OSError:
+        cached_key = cached_editor = ""
+    cached_editor = cached_editor.strip()
+    if (
+        cached_key == path_key
+        and cached_editor in EDITOR_CANDIDATES
+        and shutil.which(cached_editor, path=path_env)
+    ):
+        return cached_editor
+
+    for editor in EDITOR_CANDIDATES:
+        if shutil.which(editor, path=path_env):
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(f"{path_key}\n{editor}\n", encoding="utf-8")
+            except OSError as e:
+                logger.debug(f"Could not write editor cache {cache_file}: {e}")
+            return editor
+
+    return None
+
 
 class EditCommand:
     """Handles opening configuration files for editing."""
@@ -49,7 +265,7 @@ class EditCommand:
     ) -> None:
         """Execute the edit command."""
         try:
-            console.print(
+            _console().print(
                 f"[bold blue]Opening {layer_type} {file_type} for editing...[/bold blue]"
             )
 
@@ -59,26 +275,29 @@ class EditCommand:
             # Step 2: Construct file path
             file_path = self._construct_file_path(layer_type, layer_name, file_type)
 
-            # Step 3: Handle file creation if needed
-            if not file_path.exists():
+            # Step 3: Handle file creation if needed.  One stat answers both
+            # "does it exist" and "is it a directory" for the later steps.
+            st = _stat_or_none(file_path)
+            if st is None:
                 if not self._prompt_create_file(file_path):
-                    console.print("[yellow]Edit cancelled.[/yellow]")
+                    _console().print("[yellow]Edit cancelled.[/yellow]")
                     return
 
                 self._create_file_if_needed(file_path, file_type)
+                st = file_path.stat()
 
             # Step 4: Sort keybindings if requested
             if sort:
                 if file_type == "keybindings":
-                    self._sort_keybindings(file_path, yes=yes)
+                    self._sort_keybindings(file_path, yes=yes, st=st)
                 elif file_type == "settings":
-                    self._sort_settings(file_path, yes=yes)
+                    self._sort_settings(file_path, yes=yes, st=st)
 
             # Step 5: Open file in editor
-            self._open_file_in_editor(file_path)
+            self._open_file_in_editor(file_path, st)
 
         except Exception as e:
-            console.print(f"[red]Edit failed:[/red] {e}")
+            _console().print(f"[red]Edit failed:[/red] {e}")
             logger.exception("Edit command failed")
             raise VscSyncError(f"Edit failed: {e}")
 
@@ -87,15 +306,13 @@ class EditCommand:
     ) -> None:
         """Validate command inputs."""
         if layer_type not in LAYER_TYPE_PATHS:
-            available_types = ", ".join(LAYER_TYPE_PATHS.keys())
             raise VscSyncError(
-                f"Invalid layer type '{layer_type}'. Available: {available_types}"
+                f"Invalid layer type '{layer_type}'. Available: {_LAYER_TYPES_STR}"
             )
 
         if file_type not in FILE_TYPE_MAPPING:
-            available_types = ", ".join(FILE_TYPE_MAPPING.keys())
             raise VscSyncError(
-                f"Invalid file type '{file_type}'. Available: {available_types}"
+                f"Invalid file type '{file_type}'. Available: {_FILE_TYPES_STR}"
             )
 
         # layer_name is required for non-base layers
@@ -117,35 +334,32 @@ class EditCommand:
 
         # Special handling for live app configs
         if layer_type == "live":
-            app_details = self.config.managed_apps[layer_name]
-            if file_type == "snippets":
-                return app_details.config_path / FILE_TYPE_MAPPING[file_type]
-            else:
-                return app_details.config_path / FILE_TYPE_MAPPING[file_type]
+            layer_path = self.config.managed_apps[layer_name].config_path
 
         # Normal handling for vscode-configs repository files
-        configs_path = self.config.vscode_configs_path
-
-        if layer_type == "base":
-            layer_path = configs_path / LAYER_TYPE_PATHS[layer_type]
+        elif layer_type == "base":
+            layer_path = self.config.vscode_configs_path / LAYER_TYPE_PATHS[layer_type]
         else:
-            layer_path = configs_path / LAYER_TYPE_PATHS[layer_type] / layer_name
+            layer_path = (
+                self.config.vscode_configs_path
+                / LAYER_TYPE_PATHS[layer_type]
+                / layer_name
+            )
 
-        # Handle special case for snippets directory
-        if file_type == "snippets":
-            return layer_path / FILE_TYPE_MAPPING[file_type]
-        else:
-            return layer_path / FILE_TYPE_MAPPING[file_type]
+        # FILE_TYPE_MAPPING names the snippets directory too
+        return layer_path / FILE_TYPE_MAPPING[file_type]
 
     def _prompt_create_file(self, file_path: Path) -> bool:
         """Ask user if they want to create the file if it doesn't exist."""
+        from rich.prompt import Confirm
+
         if file_path.name == "snippets":
-            console.print(
+            _console().print(
                 f"[yellow]Snippets directory doesn't exist:[/yellow] {file_path}"
             )
             return Confirm.ask("Create snippets directory?", default=True)
         else:
-            console.print(f"[yellow]File doesn't exist:[/yellow] {file_path}")
+            _console().print(f"[yellow]File doesn't exist:[/yellow] {file_path}")
             return Confirm.ask("Create new file?", default=True)
 
     def _create_file_if_needed(self, file_path: Path, file_type: str) -> None:
@@ -156,31 +370,27 @@ class EditCommand:
         if file_type == "snippets":
             # Create snippets directory
             file_path.mkdir(exist_ok=True)
-            console.print(f"[green]✓[/green] Created snippets directory: {file_path}")
+            _console().print(f"[green]✓[/green] Created snippets directory: {file_path}")
         else:
             # Create JSON file with appropriate initial content
             initial_content = self._get_initial_content(file_type)
             file_path.write_text(initial_content)
-            console.print(f"[green]✓[/green] Created file: {file_path}")
+            _console().print(f"[green]✓[/green] Created file: {file_path}")
 
     def _get_initial_content(self, file_type: str) -> str:
         """Get initial content for new configuration files."""
-        if file_type == "settings":
-            return "{\n}\n"
-        elif file_type == "keybindings":
-            return "[\n]\n"
-        elif file_type == "extensions":
-            return '{\n  "recommendations": [\n  ]\n}\n'
-        elif file_type == "tasks":
-            return '{\n  "version": "2.0.0",\n  "tasks": []\n}\n'
-        else:
-            return "{}\n"
+        return _INITIAL_CONTENT.get(file_type, "{}\n")
 
     # ------------------------------------------------------------------
     # Keybindings sorting
     # ------------------------------------------------------------------
 
-    def _sort_keybindings(self, file_path: Path, yes: bool = False) -> None:
+    def _sort_keybindings(
+        self,
+        file_path: Path,
+        yes: bool = False,
+        st: Optional[os.stat_result] = None,
+    ) -> None:
         """Sort *keybindings.json* entries in-place according to the Product
         Requirements Document (PRD) for the *VS Code Keybinding Sorter*.
 
@@ -204,14 +414,21 @@ class EditCommand:
         CLI flag may enable deduplication but that is *out of scope* for the
         current MVP.
         """
-        if not file_path.exists():
-            console.print(f"[red]Cannot sort: {file_path} does not exist[/red]")
+        if st is None:
+            st = _stat_or_none(file_path)
+        if st is None:
+            _console().print(f"[red]Cannot sort: {file_path} does not exist[/red]")
             return
 
         try:
-            import json, re
+            raw = file_path.read_bytes()
 
-            raw_text = file_path.read_text(encoding="utf-8")
+            # Skip the parse and sort entirely if this exact file is one we
+            # sorted ourselves and nobody has touched it since.
+            cache_key = str(file_path.resolve())
+            if _load_sorted_cache().get(cache_key) == _file_signature(st, raw):
+                _console().print("[green]✓[/green] keybindings already sorted")
+                return
 
             # -----------------------------------------------------------------
             # Best-effort comment stripping – VS Code allows // and /* */ comments
@@ -219,89 +436,55 @@ class EditCommand:
             # parser can handle the file.
             # -----------------------------------------------------------------
 
-            # 1. Line comments
-            cleaned_lines = []
-            for line in raw_text.splitlines():
-                stripped = line.lstrip()
-                if stripped.startswith("//"):
-                    continue
-                cleaned_lines.append(line)
-
-            cleaned = "\n".join(cleaned_lines)
-
-            # 2. Block comments
-            cleaned = re.sub(r"/\*.*?\*/", "", cleaned, flags=re.S)
+            # Stays in bytes: the parsers below take UTF-8 directly, so the
+            # file is never decoded to str as a whole.
+            cleaned = _COMMENT_RE_B.sub(rb"\1", raw)
 
-            # 3. Keep only the JSON array portion (everything between the first
+            # Keep only the JSON array portion (everything between the first
             #    '[' and the last ']') – guards against trailing characters.
-            start = cleaned.find("[")
-            end = cleaned.rfind("]")
+            start = cleaned.find(b"[")
+            end = cleaned.rfind(b"]")
             if start == -1 or end == -1:
-                console.print("[red]Could not locate a JSON array inside the keybindings file.[/red]")
+                _console().print("[red]Could not locate a JSON array inside the keybindings file.[/red]")
                 return
 
             cleaned = cleaned[start : end + 1]
 
             try:
-                bindings = json.loads(cleaned)
+                bindings = _loads_json(cleaned)
             except json.JSONDecodeError as exc:
-                console.print(f"[red]Failed to parse keybindings.json:[/red] {exc}")
+                _console().print(f"[red]Failed to parse keybindings.json:[/red] {exc}")
                 return
 
             if not isinstance(bindings, list):
-                console.print("[red]keybindings.json must contain a top-level JSON array – aborting sort.[/red]")
+                _console().print("[red]keybindings.json must contain a top-level JSON array – aborting sort.[/red]")
                 return
 
-            # -----------------------------------------------------------------
-            # Sorting helpers
-            # -----------------------------------------------------------------
-
-            def _num_logical_ops(when_clause: str) -> int:
-                """Return how many logical operators are present in *when_clause*."""
-                # Count occurrences of the two operator tokens.  Overlapping
-                # tokens are impossible because they differ by the first char.
-                return when_clause.count("&&") + when_clause.count("||")
-
-            def _sort_tuple(item):
-                """Build a tuple implementing the PRD ordering rules."""
-                if not isinstance(item, dict):
-                    # Non-dict items go to the top to avoid crashing; should not
-                    # happen with valid VS Code keybindings.json.
-                    return ("", 0, 0, 0, "", "")
+            # Decorate-sort-undecorate: each key is built exactly once and the
+            # index settles ties, so the dicts themselves are never compared.
+            decorated = [(_keybinding_sort_key(b), i, b) for i, b in enumerate(bindings)]
 
-                key_str = str(item.get("key", ""))
-
-                when_raw = item.get("when")
-                has_when = 1 if when_raw else 0  # 0 → *no* when, comes first
-
-                when_str = when_raw if when_raw else ""
-
-                # Heuristic specificity score: (number_of_ops, len_when)
-                num_ops = _num_logical_ops(when_str)
-                len_when = len(when_str)
-
-                command_str = str(item.get("command", ""))
-
-                return (
-                    key_str.lower(),  # primary key (case-insensitive)
-                    has_when,         # secondary – general before specific
-                    num_ops,          # tertiary (part 1) – general before specific
-                    len_when,         # tertiary (part 2)
-                    when_str.lower(), # quaternary
-                    command_str.lower(),  # tie-breaker
-                )
+            # Already in order: leave the file (and its comments) untouched
+            # rather than re-serialising an identical list.
+            if all(a[0] <= b[0] for a, b in zip(decorated, decorated[1:])):
+                _remember_sorted(file_path, _file_signature(st, raw))
+                _console().print("[green]✓[/green] keybindings already sorted, no changes")
+                return
 
-            bindings.sort(key=_sort_tuple)
+            decorated.sort()
+            bindings = [b for _, _, b in decorated]
 
             # -----------------------------------------------------------------
             # Confirmation prompt (unless --yes/yes=True)
             # -----------------------------------------------------------------
             if not yes:
-                console.print(
+                from rich.prompt import Confirm
+
+                _console().print(
                     f"This will overwrite [bold]{file_path}[/bold] with a best-effort sorted list (entries: {len(bindings)})."
                 )
                 if not Confirm.ask("Proceed?", default=True):
-                    console.print("[yellow]Sort cancelled.[/yellow]")
+                    _console().print("[yellow]Sort cancelled.[/yellow]")
                     return
 
             # -----------------------------------------------------------------
@@ -309,21 +492,25 @@ class EditCommand:
             # (Comment preservation is a known limitation; see PRD §5.1 FR8.)
             # -----------------------------------------------------------------
 
-            file_path.write_text(
-                json.dumps(bindings, indent=2, ensure_ascii=False) + "\n",
-                encoding="utf-8",
-            )
+            output = _dumps_json(bindings) + b"\n"
+            FileOperations.atomic_write_bytes(file_path, output)
+            _remember_sorted(file_path, _file_signature(file_path.stat(), output))
 
-            console.print(f"[green]✓[/green] keybindings sorted")
+            _console().print(f"[green]✓[/green] keybindings sorted")
 
         except Exception as exc:
-            console.print(f"[red]Failed to sort keybindings:[/red] {exc}")
+            _console().print(f"[red]Failed to sort keybindings:[/red] {exc}")
 
     # ------------------------------------------------------------------
     # Settings sorting
     # ------------------------------------------------------------------
 
-    def _sort_settings(self, file_path: Path, yes: bool = False) -> None:
+    def _sort_settings(
+        self,
+        file_path: Path,
+        yes: bool = False,
+        st: Optional[os.stat_result] = None,
+    ) -> None:
         """Sort and deduplicate *settings.json* in-place.
 
         Behaviour (matches Settings Sorter PRD v1.0):
@@ -334,39 +521,25 @@ class EditCommand:
           output (best-effort limitation).
         """
 
-        if not file_path.exists():
-            console.print(f"[red]Cannot sort: {file_path} does not exist[/red]")
+        if st is None:
+            st = _stat_or_none(file_path)
+        if st is None:
+            _console().print(f"[red]Cannot sort: {file_path} does not exist[/red]")
             return
 
         try:
-            import json, re
-
             raw_text = file_path.read_text(encoding="utf-8")
 
             # ------------------------------------------------------------
             # Strip // and /* */ comments so the stock JSON parser works.
             # ------------------------------------------------------------
-            cleaned_lines = []
-            for line in raw_text.splitlines():
-                stripped = line.lstrip()
-                if stripped.startswith("//"):
-                    continue
-                cleaned_lines.append(line)
-
-            cleaned = "\n".join(cleaned_lines)
-            cleaned = re.sub(r"/\*.*?\*/", "", cleaned, flags=re.S)
-
-            # Remove inline // comments that appear after a value on the same
-            # line.  This is a naïve implementation but works well for typical
-            # VS Code settings files where string values contain very few
-            # double-slash sequences.
-            cleaned = re.sub(r"//.*", "", cleaned)
+            cleaned = _COMMENT_RE.sub(r"\1", raw_text)
 
             # Keep the substring between the first '{' and the last '}'.
             start = cleaned.find("{")
             end = cleaned.rfind("}")
             if start == -1 or end == -1:
-                console.print("[red]Could not locate a JSON object inside the settings file.[/red]")
+                _console().print("[red]Could not locate a JSON object inside the settings file.[/red]")
                 return
 
             cleaned = cleaned[start : end + 1]
@@ -409,7 +582,7 @@ class EditCommand:
             try:
                 parsed_settings = json.loads(cleaned, object_pairs_hook=object_pairs_hook)
             except json.JSONDecodeError as exc:
-                console.print(f"[red]Failed to parse settings.json:[/red] {exc}")
+                _console().print(f"[red]Failed to parse settings.json:[/red] {exc}")
                 return
 
             # ------------------------------------------------------------
@@ -421,54 +594,72 @@ class EditCommand:
             # Prompt before overwriting unless --yes supplied.
             # ------------------------------------------------------------
             if not yes:
-                console.print(
+                from rich.prompt import Confirm
+
+                _console().print(
                     f"This will overwrite [bold]{file_path}[/bold] with a best-effort sorted settings file (entries: {len(sorted_settings)}; duplicates removed: {duplicates_removed})."
                 )
                 if not Confirm.ask("Proceed?", default=True):
-                    console.print("[yellow]Sort cancelled.[/yellow]")
+                    _console().print("[yellow]Sort cancelled.[/yellow]")
                     return
 
             # ------------------------------------------------------------
             # Write back – pretty-printed JSON (2-space indent like VS Code).
             # ------------------------------------------------------------
-            file_path.write_text(
-                json.dumps(sorted_settings, indent=2, ensure_ascii=False) + "\n",
-                encoding="utf-8",
+            FileOperations.atomic_write_bytes(
+                file_path,
+                (json.dumps(sorted_settings, indent=2, ensure_ascii=False) + "\n").encode(
+                    "utf-8"
+                ),
             )
 
-            console.print(
+            _console().print(
                 f"[green]✓[/green] settings sorted ({duplicates_removed} duplicates removed)"
             )
 
         except Exception as exc:
-            console.print(f"[red]Failed to sort settings:[/red] {exc}")
+            _console().print(f"[red]Failed to sort settings:[/red] {exc}")
+
+    def _open_file_in_editor(
+        self, file_path: Path, st: Optional[os.stat_result] = None
+    ) -> None:
+        """Open the file in the configured or system default editor.
+
+        ``st`` is the file's stat result when the caller already has it.
+        """
+        import subprocess
 
-    def _open_file_in_editor(self, file_path: Path) -> None:
-        """Open the file in the configured or system default editor."""
         editor = self._get_editor()
 
         try:
-            if file_path.is_dir():
+            if st is None:
+                st = _stat_or_none(file_path)
+            if st is not None and stat.S_ISDIR(st.st_mode):
                 # For snippets directory, open the directory
-                console.print(
+                _console().print(
                     f"[cyan]Opening directory in {editor}:[/cyan] {file_path}"
                 )
             else:
-                console.print(f"[cyan]Opening file in {editor}:[/cyan] {file_path}")
-
-            # Try to open with the editor
-            result = subprocess.run(
-                [editor, str(file_path)], check=True, capture_output=True, text=True
+                _console().print(f"[cyan]Opening file in {editor}:[/cyan] {file_path}")
+
+            # Try to open with the editor.  Its output is discarded rather
+            # than captured so a detaching GUI editor holding the pipes open
+            # cannot keep us waiting.
+            subprocess.run(
+                [editor, str(file_path)],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
-            console.print(f"[green]✓[/green] Opened successfully")
+            _console().print(f"[green]✓[/green] Opened successfully")
 
         except subprocess.CalledProcessError as e:
-            console.print(f"[red]Failed to open with {editor}:[/red] {e}")
-            console.print(f"[yellow]You can manually open:[/yellow] {file_path}")
+            _console().print(f"[red]Failed to open with {editor}:[/red] {e}")
+            _console().print(f"[yellow]You can manually open:[/yellow] {file_path}")
         except FileNotFoundError:
-            console.print(f"[red]Editor '{editor}' not found[/red]")
-            console.print(f"[yellow]You can manually open:[/yellow] {file_path}")
+            _console().print(f"[red]Editor '{editor}' not found[/red]")
+            _console().print(f"[yellow]You can manually open:[/yellow] {file_path}")
 
     def _get_editor(self) -> str:
         """Get the editor to use for opening files."""
@@ -476,16 +667,9 @@ class EditCommand:
         # For now, we'll use a simple priority order
 
         # 1. Check for VSCode (most likely to be available)
-        editors_to_try = ["code", "codium", "cursor"]
-
-        for editor in editors_to_try:
-            try:
-                result = subprocess.run(
-                    [editor, "--version"], check=True, capture_output=True, text=True
-                )
-                return editor
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
+        editor = _resolve_editor(os.environ.get("PATH", os.defpath))
+        if editor:
+            return editor
 
         # 2. Fall back to system defaults based on platform
         if sys.platform == "darwin":  # macOS
@@ -1,39 +1,94 @@
 """Implementation of the init command."""
 
+import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 
 from rich.console import Console
 from rich.prompt import Confirm, Prompt
-from rich.table import Table
 
 from ..config import ConfigManager
 from ..core.app_manager import AppManager
+from ..core.file_ops import FileOperations
 from ..core.git_ops import GitOperations
 from ..exceptions import GitOperationError, VscSyncError
 from ..models import AppDetails, VscSyncConfig
-from ..utils import resolve_path
+from ..utils import paths_exist, resolve_path
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+_HOME = Path.home()
+
+# Starter files for a new vscode-configs repository, serialised once.
+BASE_FILES = {
+    "settings.json": json.dumps(
+        {
+            "editor.fontSize": 14,
+            "editor.tabSize": 2,
+            "editor.insertSpaces": True,
+            "files.autoSave": "onFocusChange",
+        },
+        indent=2,
+    ).encode("utf-8"),
+    "extensions.json": json.dumps({"recommendations": []}, indent=2).encode("utf-8"),
+    "keybindings.json": b"[]",
+}
+
+README_CONTENT = """# VSCode Configurations
+
+This repository contains your synchronized VSCode-like editor configurations.
+
+## Structure
+
+- `base/`: Base configurations applied to all editors
+- `apps/`: Editor-specific configurations  
+- `stacks/`: Technology stack-specific configurations
+- `projects/`: Project template configurations
+
+## Usage
+
+Use the `vsc-sync` CLI tool to apply these configurations to your editors.
+"""
+
+# Directory names that mark a config file as already kept with dotfiles.
+DOTFILES_NAMES = frozenset({".config", ".dotfiles", "dotfiles", ".vsc-sync"})
+
 
 class InitCommand:
     """Handles the initialization process for vsc-sync."""
 
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(self, config_manager: ConfigManager, non_interactive: bool = False):
         self.config_manager = config_manager
+        # Answer every prompt with its default instead of asking.  Anything
+        # that would overwrite an existing configuration or directory is
+        # refused.
+        self.non_interactive = non_interactive
 
     def run(
-        self, repo: Optional[str] = None, config_file: Optional[str] = None
+        self,
+        repo: Optional[str] = None,
+        config_file: Optional[str] = None,
+        use_cache: bool = True,
     ) -> None:
-        """Execute the init command."""
+        """Execute the init command.
+
+        ``use_cache=False`` re-probes for applications instead of reusing a
+        recent discovery result.
+        """
         console.print("[bold blue]Initializing vsc-sync...[/bold blue]")
 
         # Handle reinitialization
         if self.config_manager.is_initialized():
             console.print("[yellow]vsc-sync is already initialized.[/yellow]")
+            if self.non_interactive:
+                console.print(
+                    "Initialization cancelled. Run without --yes to reinitialize."
+                )
+                return
             if not Confirm.ask(
                 "Do you want to reinitialize? This will overwrite your current configuration"
             ):
@@ -51,16 +106,17 @@ class InitCommand:
             vscode_configs_path = self._setup_vscode_configs_repo(repo)
 
             # Step 3: Auto-discover applications
-            managed_apps = self._setup_managed_apps()
+            managed_apps = self._setup_managed_apps(use_cache)
 
-            # Step 4: Create and save configuration
-            config = VscSyncConfig(
+            # Step 4: Create and save configuration.  Both fields are already
+            # a Path and validated AppDetails, so skip re-validating them.
+            config = VscSyncConfig.model_construct(
                 vscode_configs_path=vscode_configs_path, managed_apps=managed_apps
             )
 
-            # Update config manager with new path if provided
+            # Update config manager with the path resolved in step 1
             if config_file:
-                self.config_manager.config_path = resolve_path(config_file)
+                self.config_manager.config_path = config_path
 
             self.config_manager.save_config(config)
 
@@ -103,28 +159,44 @@ class InitCommand:
             )
 
         # Default clone location
-        default_path = Path.home() / "vscode-configs"
+        default_path = _HOME / "vscode-configs"
 
-        clone_path = Prompt.ask(
-            f"Where should the repository be cloned?", default=str(default_path)
-        )
+        if self.non_interactive:
+            clone_path_str = str(default_path)
+        else:
+            clone_path_str = Prompt.ask(
+                f"Where should the repository be cloned?", default=str(default_path)
+            )
 
-        clone_path = resolve_path(clone_path)
+        clone_path = resolve_path(clone_path_str)
 
         if clone_path.exists():
-            if not Confirm.ask(
+            if self.non_interactive or not Confirm.ask(
                 f"Directory {clone_path} already exists. Remove it and clone fresh?"
             ):
                 raise VscSyncError("Cannot clone to existing directory")
 
-            import shutil
-
-            shutil.rmtree(clone_path)
+            # A checkout is mostly small .git/objects files; unlink them on
+            # a thread pool rather than one at a time.
+            FileOperations.parallel_rmtree(clone_path)
 
         console.print(f"Cloning repository to [cyan]{clone_path}[/cyan]...")
 
         try:
-            GitOperations.clone_repository(repo_url, clone_path)
+            # A blobless partial clone keeps the history for 'git log' but
+            # only downloads the file contents that get checked out.
+            try:
+                GitOperations.clone_repository(
+                    repo_url, clone_path, filter_spec="blob:none"
+                )
+            except GitOperationError as e:
+                logger.debug(f"Partial clone failed, retrying shallow: {e}")
+                if clone_path.exists():
+                    FileOperations.parallel_rmtree(clone_path)
+                # vsc-sync only reads the current tree, so skip the history.
+                GitOperations.clone_repository(
+                    repo_url, clone_path, depth=1, single_branch=True
+                )
             console.print("[green]Repository cloned successfully![/green]")
             return clone_path
 
@@ -135,15 +207,18 @@ class InitCommand:
         """Verify and use a local repository path."""
         path = resolve_path(repo_path)
 
-        if not path.exists():
+        # One directory listing answers every check below
+        try:
+            with os.scandir(path) as it:
+                entries = {entry.name for entry in it if entry.is_dir()}
+        except FileNotFoundError:
             raise VscSyncError(f"Local path does not exist: {path}")
-
-        if not path.is_dir():
+        except NotADirectoryError:
             raise VscSyncError(f"Path is not a directory: {path}")
 
         # Check if it looks like a vscode-configs repository
         expected_dirs = ["base", "apps", "stacks"]
-        missing_dirs = [d for d in expected_dirs if not (path / d).exists()]
+        missing_dirs = [d for d in expected_dirs if d not in entries]
 
         if missing_dirs:
             console.print(
@@ -151,7 +226,7 @@ class InitCommand:
             )
             console.print(f"Missing directories: {', '.join(missing_dirs)}")
 
-            if not Confirm.ask("Continue anyway?"):
+            if self.non_interactive or not Confirm.ask("Continue anyway?"):
                 raise VscSyncError("Repository verification failed")
 
         console.print(f"Using local repository: [cyan]{path}[/cyan]")
@@ -159,6 +234,9 @@ class InitCommand:
 
     def _prompt_for_repo(self) -> Path:
         """Prompt user for repository location."""
+        if self.non_interactive:
+            return self._create_new_repo()
+
         console.print("Please specify your vscode-configs repository:")
         console.print("1. Git URL (will be cloned)")
         console.print("2. Local directory path")
@@ -179,16 +257,21 @@ class InitCommand:
 
     def _create_new_repo(self) -> Path:
         """Create a new vscode-configs repository."""
-        default_path = Path.home() / "vscode-configs"
+        default_path = _HOME / "vscode-configs"
 
-        repo_path = Prompt.ask(
-            "Where should the new repository be created?", default=str(default_path)
-        )
+        if self.non_interactive:
+            repo_path = str(default_path)
+        else:
+            repo_path = Prompt.ask(
+                "Where should the new repository be created?", default=str(default_path)
+            )
 
         repo_path = resolve_path(repo_path)
 
         if repo_path.exists():
-            if not Confirm.ask(f"Directory {repo_path} already exists. Use it anyway?"):
+            if self.non_interactive or not Confirm.ask(
+                f"Directory {repo_path} already exists. Use it anyway?"
+            ):
                 raise VscSyncError("Cannot create repository at existing location")
 
         console.print(
@@ -198,86 +281,74 @@ class InitCommand:
         # Create directory structure
         self._create_repo_structure(repo_path)
 
-        console.print("[green]Repository structure created successfully![/green]")
-        console.print(f"[yellow]Tip:[/yellow] Initialize this as a Git repository:")
-        console.print(f"  cd {repo_path}")
-        console.print(f"  git init")
-        console.print(f"  git add .")
-        console.print(f'  git commit -m "Initial vscode-configs repository"')
+        console.print(
+            "\n".join(
+                [
+                    "[green]Repository structure created successfully![/green]",
+                    "[yellow]Tip:[/yellow] Initialize this as a Git repository:",
+                    f"  cd {repo_path}",
+                    "  git init",
+                    "  git add .",
+                    '  git commit -m "Initial vscode-configs repository"',
+                ]
+            )
+        )
 
         return repo_path
 
     def _create_repo_structure(self, repo_path: Path) -> None:
         """Create the basic repository structure."""
-        from ..core.file_ops import FileOperations
-
-        # Create directories
-        directories = ["base", "apps", "stacks", "projects", "base/snippets"]
+        # Create directories ("base" comes with "base/snippets")
+        directories = ["apps", "stacks", "projects", "base/snippets"]
 
         for dir_name in directories:
-            dir_path = repo_path / dir_name
-            FileOperations.ensure_directory(dir_path)
+            (repo_path / dir_name).mkdir(parents=True, exist_ok=True)
 
-        # Create basic files
-        base_settings = {
-            "editor.fontSize": 14,
-            "editor.tabSize": 2,
-            "editor.insertSpaces": True,
-            "files.autoSave": "onFocusChange",
-        }
-
-        base_extensions = {"recommendations": []}
-
-        base_keybindings = []
-
-        FileOperations.write_json_file(
-            repo_path / "base" / "settings.json", base_settings
-        )
-        FileOperations.write_json_file(
-            repo_path / "base" / "extensions.json", base_extensions
-        )
-        FileOperations.write_json_file(
-            repo_path / "base" / "keybindings.json", base_keybindings
-        )
-
-        # Create README
-        readme_content = """# VSCode Configurations
-        
-This repository contains your synchronized VSCode-like editor configurations.
-
-## Structure
+        # Create basic files and the README.  The writes are independent,
+        # so issue them together; on network mounts that saves round trips.
+        files = [(repo_path / "base" / name, data) for name, data in BASE_FILES.items()]
+        files.append((repo_path / "README.md", README_CONTENT.encode("utf-8")))
 
-- `base/`: Base configurations applied to all editors
-- `apps/`: Editor-specific configurations  
-- `stacks/`: Technology stack-specific configurations
-- `projects/`: Project template configurations
-
-## Usage
+        with ThreadPoolExecutor(max_workers=len(files)) as pool:
+            # list() surfaces the first write error here.
+            list(pool.map(lambda item: item[0].write_bytes(item[1]), files))
 
-Use the `vsc-sync` CLI tool to apply these configurations to your editors.
-"""
-
-        (repo_path / "README.md").write_text(readme_content)
-
-    def _setup_managed_apps(self) -> Dict[str, AppDetails]:
+    def _setup_managed_apps(self, use_cache: bool = True) -> Dict[str, AppDetails]:
         """Set up managed applications through auto-discovery and user interaction."""
         console.print("\n[bold]Discovering VSCode-like applications...[/bold]")
 
         # Auto-discover applications
-        discovered_apps = AppManager.auto_discover_apps()
+        discovered_apps = AppManager.auto_discover_apps(use_cache=use_cache)
 
         if not discovered_apps:
             console.print("No VSCode-like applications found automatically.")
+            if self.non_interactive:
+                return {}
             return self._manually_add_apps({})
 
+        # Check every path once; the table and the review both need them
+        exists = paths_exist(
+            path
+            for app in discovered_apps.values()
+            for path in (app.config_path, app.executable_path)
+            if path
+        )
+
         # Show discovered applications
-        self._show_discovered_apps(discovered_apps)
+        self._show_discovered_apps(discovered_apps, exists)
 
         # Let user review and modify the list
-        return self._review_discovered_apps(discovered_apps)
+        return self._review_discovered_apps(discovered_apps, exists)
+
+    def _show_discovered_apps(
+        self, discovered_apps: Dict[str, AppDetails], exists: Dict[Path, bool]
+    ) -> None:
+        """Display discovered applications in a table.
+
+        ``exists`` maps each discovered path to whether it exists.
+        """
+        from rich.table import Table
 
-    def _show_discovered_apps(self, discovered_apps: Dict[str, AppDetails]) -> None:
-        """Display discovered applications in a table."""
         table = Table(title="Discovered Applications")
         table.add_column("Alias", style="cyan")
         table.add_column("Config Path", style="green")
@@ -285,12 +356,10 @@ Use the `vsc-sync` CLI tool to apply these configurations to your editors.
         table.add_column("Status", style="magenta")
 
         for alias, app_details in discovered_apps.items():
-            config_status = "✓" if app_details.config_path.exists() else "✗"
+            config_status = "✓" if exists[app_details.config_path] else "✗"
             exec_status = (
                 "✓"
-                if (
-                    app_details.executable_path and app_details.executable_path.exists()
-                )
+                if (app_details.executable_path and exists[app_details.executable_path])
                 else "✗"
             )
             status = f"Config: {config_status} | Exec: {exec_status}"
@@ -309,22 +378,23 @@ Use the `vsc-sync` CLI tool to apply these configurations to your editors.
         console.print(table)
 
     def _review_discovered_apps(
-        self, discovered_apps: Dict[str, AppDetails]
+        self, discovered_apps: Dict[str, AppDetails], exists: Dict[Path, bool]
     ) -> Dict[str, AppDetails]:
         """Let user review and modify the discovered applications."""
         console.print("\n[bold]Review discovered applications:[/bold]")
 
-        if not Confirm.ask(
+        if self.non_interactive or not Confirm.ask(
             "Do you want to review each application individually?", default=False
         ):
             # Use all discovered apps as-is
             selected_apps = {
                 alias: app
                 for alias, app in discovered_apps.items()
-                if app.config_path.exists()
+                if exists[app.config_path]
             }
 
-            if selected_apps != discovered_apps:
+            # selected_apps is a filtered subset, so sizes tell them apart
+            if len(selected_apps) != len(discovered_apps):
                 console.print(
                     "Only including applications with existing config directories."
                 )
@@ -339,7 +409,8 @@ Use the `vsc-sync` CLI tool to apply these configurations to your editors.
             console.print(f"Config Path: {app_details.config_path}")
             console.print(f"Executable: {app_details.executable_path or 'Not found'}")
 
-            if not app_details.config_path.exists():
+            config_exists = exists[app_details.config_path]
+            if not config_exists:
                 console.print(
                     "[yellow]Warning: Config directory doesn't exist[/yellow]"
                 )
@@ -347,7 +418,7 @@ Use the `vsc-sync` CLI tool to apply these configurations to your editors.
             action = Prompt.ask(
                 "Action",
                 choices=["include", "skip", "modify", "quit"],
-                default="include" if app_details.config_path.exists() else "skip",
+                default="include" if config_exists else "skip",
             )
 
             if action == "quit":
@@ -405,18 +476,19 @@ Use the `vsc-sync` CLI tool to apply these configurations to your editors.
         self, selected_apps: Dict[str, AppDetails]
     ) -> Dict[str, AppDetails]:
         """Ask if user wants to add more applications manually."""
-        if Confirm.ask(
+        if not self.non_interactive and Confirm.ask(
             "Do you want to add any additional applications manually?", default=False
         ):
             return self._manually_add_apps(selected_apps)
 
         return selected_apps
 
-    def _manually_add_apps(
-        self, existing_apps: Dict[str, AppDetails]
-    ) -> Dict[str, AppDetails]:
-        """Manually add applications."""
-        apps = existing_apps.copy()
+    def _manually_add_apps(self, apps: Dict[str, AppDetails]) -> Dict[str, AppDetails]:
+        """Manually add applications.
+
+        New entries are added to ``apps`` in place, which is also returned;
+        callers hand over a dict they no longer need unchanged.
+        """
 
         while True:
             console.print("\nAdding new application:")
@@ -464,46 +536,35 @@ Use the `vsc-sync` CLI tool to apply these configurations to your editors.
 
     def _show_success_message(self, config: VscSyncConfig) -> None:
         """Show success message and next steps."""
-        console.print("\n[bold green]✓ vsc-sync initialization completed![/bold green]")
-
-        console.print(
-            f"\n[bold]Configuration saved to:[/bold] [cyan]{self.config_manager.config_path}[/cyan]"
-        )
-        console.print(
-            f"[bold]VSCode configs repository:[/bold] [cyan]{config.vscode_configs_path}[/cyan]"
-        )
-        console.print(f"[bold]Managed applications:[/bold] {len(config.managed_apps)}")
+        # Collect the whole report and print it once
+        lines = [
+            "\n[bold green]✓ vsc-sync initialization completed![/bold green]",
+            f"\n[bold]Configuration saved to:[/bold] [cyan]{self.config_manager.config_path}[/cyan]",
+            f"[bold]VSCode configs repository:[/bold] [cyan]{config.vscode_configs_path}[/cyan]",
+            f"[bold]Managed applications:[/bold] {len(config.managed_apps)}",
+        ]
 
         if config.managed_apps:
-            console.print("\n[bold]Next steps:[/bold]")
-            console.print(
-                "• Use [cyan]vsc-sync list-apps[/cyan] to see your registered applications"
-            )
-            console.print(
-                "• Use [cyan]vsc-sync apply <app> --stack <stack>[/cyan] to apply configurations"
-            )
-            console.print(
-                "• Use [cyan]vsc-sync discover[/cyan] to find more applications"
-            )
-
             # Show example commands
             first_app = next(iter(config.managed_apps.keys()))
-            console.print(f"\n[bold]Example:[/bold]")
-            console.print(f"  vsc-sync apply {first_app} --stack python")
+            lines += [
+                "\n[bold]Next steps:[/bold]",
+                "• Use [cyan]vsc-sync list-apps[/cyan] to see your registered applications",
+                "• Use [cyan]vsc-sync apply <app> --stack <stack>[/cyan] to apply configurations",
+                "• Use [cyan]vsc-sync discover[/cyan] to find more applications",
+                "\n[bold]Example:[/bold]",
+                f"  vsc-sync apply {first_app} --stack python",
+            ]
 
         # Advice about version control
         if not self._is_in_dotfiles_location(self.config_manager.config_path):
-            console.print(
-                f"\n[yellow]Tip:[/yellow] Consider adding your configuration file to version control:"
-            )
-            console.print(f"  {self.config_manager.config_path}")
+            lines += [
+                "\n[yellow]Tip:[/yellow] Consider adding your configuration file to version control:",
+                f"  {self.config_manager.config_path}",
+            ]
+
+        console.print("\n".join(lines))
 
     def _is_in_dotfiles_location(self, config_path: Path) -> bool:
         """Check if config path is in a typical dotfiles location."""
-        dotfiles_patterns = [".config", ".dotfiles", "dotfiles", ".vsc-sync"]
-
-        for parent in config_path.parents:
-            if any(pattern in parent.name for pattern in dotfiles_patterns):
-                return True
-
-        return False
+        return any(parent.name in DOTFILES_NAMES for parent in config_path.parents)
@@ -1,34 +1,195 @@
 """Implementation of the pull command."""
 
+import functools
 import json
 import logging
 import os
+import stat
 import subprocess
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from rich.console import Console
 from rich.prompt import Confirm
-from rich.syntax import Syntax
-from rich.table import Table
 
 from vsc_sync.config import ConfigManager
 from vsc_sync.core.app_manager import AppManager
 from vsc_sync.core.file_ops import FileOperations
 from vsc_sync.exceptions import AppConfigPathError, ExtensionError, VscSyncError
-from vsc_sync.models import AppDetails
+from vsc_sync.models import AppDetails, VscSyncConfig
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Entries of an app's config directory that a pull may read.
+_SOURCE_NAMES = ("settings.json", "keybindings.json", "snippets")
+
+# Pull summary labels, in the order of _show_pull_summary's include flags.
+_COMPONENT_NAMES = (
+    "settings.json",
+    "keybindings.json",
+    "snippets/",
+    "extensions.json",
+)
+
+
+def _snippet_section(snippet_file: Path) -> str:
+    """Return one snippet file's block of the combined snippets preview."""
+    try:
+        content = snippet_file.read_text()
+    except Exception:
+        content = "[Error reading file]"
+    return f"=== {snippet_file.name} ===\n{content}\n\n"
+
+
+def _combine_snippets(snippet_files: List[Path]) -> str:
+    """Read snippet files concurrently and join them for the preview."""
+    with ThreadPoolExecutor(max_workers=min(8, len(snippet_files))) as pool:
+        return "".join(pool.map(_snippet_section, snippet_files))
+
 
 class PullCommand:
     """Handles pulling configurations from VSCode-like applications to the repository."""
 
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
-        self.config = config_manager.load_config()
+        # stat results for paths probed during this run; None if missing.
+        self._stat_cache: Dict[Path, Optional[os.stat_result]] = {}
+        # Raw bytes and parsed JSON of files read during this run.
+        self._file_cache: Dict[Path, bytes] = {}
+        self._json_cache: Dict[Path, Any] = {}
+        self._snippet_cache: Dict[Path, List[Path]] = {}
+        # Installed extensions per app alias; listing them spawns the app.
+        self._ext_cache: Dict[str, List[str]] = {}
+
+    @functools.cached_property
+    def config(self) -> VscSyncConfig:
+        """The vsc-sync configuration, loaded on first use."""
+        return self.config_manager.load_config()
+
+    def _stat(self, path: Path) -> Optional[os.stat_result]:
+        """Return ``path``'s stat result, or None if it does not exist.
+
+        Results are cached so the existence, type and read checks made for
+        the same file during one pull cost a single ``stat`` call.
+        """
+        try:
+            return self._stat_cache[path]
+        except KeyError:
+            pass
+        try:
+            st: Optional[os.stat_result] = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            st = None
+        self._stat_cache[path] = st
+        return st
+
+    def _exists(self, path: Path) -> bool:
+        """Return whether ``path`` exists, using the stat cache."""
+        return self._stat(path) is not None
+
+    def _is_dir(self, path: Path) -> bool:
+        """Return whether ``path`` is a directory, using the stat cache."""
+        st = self._stat(path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+
+    def _invalidate(self, *paths: Path) -> None:
+        """Forget cached stat results and contents for paths just written."""
+        for path in paths:
+            self._stat_cache.pop(path, None)
+            self._file_cache.pop(path, None)
+            self._json_cache.pop(path, None)
+            self._snippet_cache.pop(path, None)
+
+    def _index_source(self, directory: Path) -> None:
+        """Seed the stat cache for ``directory``'s pullable entries.
+
+        One ``os.scandir`` pass settles which of ``_SOURCE_NAMES`` exist, so
+        missing ones are never stat'ed and the previews/pulls that follow
+        look everything up in the cache.
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = {e.name: e for e in it if e.name in _SOURCE_NAMES}
+        except OSError:
+            return
+        for name in _SOURCE_NAMES:
+            path = directory / name
+            if path in self._stat_cache:
+                continue
+            entry = entries.get(name)
+            try:
+                self._stat_cache[path] = entry.stat() if entry else None
+            except OSError:
+                # Dangling symlink or similar; let _stat decide later.
+                pass
+
+    def _list_snippets(self, directory: Path) -> List[Path]:
+        """Return the ``*.code-snippets`` files in ``directory``.
+
+        One ``os.scandir`` pass whose entries answer ``is_file`` from the
+        directory listing itself; the result is shared by preview and pull.
+        """
+        try:
+            return self._snippet_cache[directory]
+        except KeyError:
+            pass
+        with os.scandir(directory) as it:
+            snippet_files = [
+                Path(entry.path)
+                for entry in it
+                if entry.name.endswith(".code-snippets") and entry.is_file()
+            ]
+        self._snippet_cache[directory] = snippet_files
+        return snippet_files
+
+    def _get_extensions(self, app_details: AppDetails) -> List[str]:
+        """Return the app's installed extensions, listing them once per run."""
+        try:
+            return self._ext_cache[app_details.alias]
+        except KeyError:
+            extensions = AppManager.get_installed_extensions(app_details)
+            self._ext_cache[app_details.alias] = extensions
+            return extensions
+
+    def _read_bytes(self, path: Path) -> bytes:
+        """Return ``path``'s contents, reading it at most once per run."""
+        try:
+            return self._file_cache[path]
+        except KeyError:
+            raw = self._file_cache[path] = path.read_bytes()
+            return raw
+
+    def _load_json_bytes(self, path: Path) -> Tuple[bytes, Any]:
+        """Return ``path``'s raw bytes and parsed JSON, reading it only once.
+
+        Like ``FileOperations.read_json_file``, content that is not valid
+        JSON parses to an empty dict.
+        """
+        raw = self._read_bytes(path)
+        try:
+            return raw, self._json_cache[path]
+        except KeyError:
+            pass
+        try:
+            parsed = json.loads(raw)
+        except ValueError as e:
+            logger.warning(f"Failed to read JSON file {path}: {e}")
+            parsed = {}
+        self._json_cache[path] = parsed
+        return raw, parsed
+
+    def _copy_source(self, source_file: Path, target_file: Path) -> None:
+        """Copy a pulled file into the repository.
+
+        Repository files get fresh metadata, so the source's times and
+        xattrs are not copied.
+        """
+        FileOperations.copy_file(
+            source_file, target_file, create_dirs=False, preserve_metadata=False
+        )
+        self._invalidate(target_file)
 
     def run(
         self,
@@ -146,7 +307,7 @@ class PullCommand:
 
         app_details = self.config.managed_apps[app_alias]
 
-        if not app_details.config_path.exists():
+        if not self._exists(app_details.config_path):
             raise AppConfigPathError(
                 f"App config directory does not exist: {app_details.config_path}",
             )
@@ -155,19 +316,19 @@ class PullCommand:
 
     def _validate_project(self, project_path: Path) -> AppDetails:
         """Validate that the project has a .vscode directory and return details."""
-        if not project_path.exists():
+        if not self._exists(project_path):
             raise VscSyncError(f"Project directory does not exist: {project_path}")
 
-        if not project_path.is_dir():
+        if not self._is_dir(project_path):
             raise VscSyncError(f"Project path is not a directory: {project_path}")
 
         vscode_dir = project_path / ".vscode"
-        if not vscode_dir.exists():
+        if not self._exists(vscode_dir):
             raise VscSyncError(
                 f"Project does not have a .vscode directory: {vscode_dir}"
             )
 
-        if not vscode_dir.is_dir():
+        if not self._is_dir(vscode_dir):
             raise VscSyncError(f".vscode path is not a directory: {vscode_dir}")
 
         # Create a pseudo AppDetails for the project
@@ -189,7 +350,7 @@ class PullCommand:
             )
 
         vscode_configs_path = self.config.vscode_configs_path
-        if not vscode_configs_path.exists():
+        if not self._exists(vscode_configs_path):
             raise VscSyncError(
                 f"vscode-configs repository not found at: {vscode_configs_path}"
             )
@@ -210,9 +371,10 @@ class PullCommand:
             target_path = vscode_configs_path / "projects" / name
 
         # Ensure target directory exists
-        if not target_path.exists():
+        if not self._exists(target_path):
             console.print(f"[yellow]Creating target directory:[/yellow] {target_path}")
             target_path.mkdir(parents=True, exist_ok=True)
+            self._invalidate(target_path)
 
         return target_path
 
@@ -223,44 +385,44 @@ class PullCommand:
         if not use_pager:
             # Direct output without pager
             console.print(f"\n[bold]{title}:[/bold]")
-            console.print(Syntax(content, "json", line_numbers=True, theme="monokai"))
+            self._render_json_preview(content, line_numbers=True)
             return
 
         # Try to use system pager
         pager_cmd = os.environ.get("PAGER", "less")
 
-        try:
-            # Create temporary file with content
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as tmp_file:
-                tmp_file.write(content)
-                tmp_file_path = tmp_file.name
-
-            # Set up pager command
-            if pager_cmd == "less":
-                # Use less with good defaults for JSON
-                cmd = ["less", "-R", "-S", "-F", "-X", tmp_file_path]
-            else:
-                cmd = [pager_cmd, tmp_file_path]
+        if pager_cmd == "less":
+            # Use less with good defaults for JSON
+            cmd = ["less", "-R", "-S", "-F", "-X"]
+        else:
+            cmd = [pager_cmd]
 
-            console.print(f"\n[bold]{title}:[/bold]")
-            console.print(f"[dim]Opening in pager... (Press 'q' to quit)[/dim]")
+        console.print(f"\n[bold]{title}:[/bold]")
+        console.print(f"[dim]Opening in pager... (Press 'q' to quit)[/dim]")
 
-            # Run pager
-            subprocess.run(cmd, check=False)
+        try:
+            # Feed the content on stdin; it never needs to touch the disk.
+            subprocess.run(cmd, input=content.encode("utf-8"), check=False)
 
         except (subprocess.SubprocessError, FileNotFoundError):
             # Fallback to direct output if pager fails
             console.print(f"\n[yellow]Pager not available, showing directly:[/yellow]")
             console.print(f"\n[bold]{title}:[/bold]")
-            console.print(Syntax(content, "json", line_numbers=True, theme="monokai"))
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(tmp_file_path)
-            except:
-                pass
+            self._render_json_preview(content, line_numbers=True)
+
+    def _render_json_preview(self, content: str, line_numbers: bool = False) -> None:
+        """Print ``content`` as syntax-highlighted JSON.
+
+        Pygments lexing is the expensive part of a preview, so callers pass
+        only the text that is actually shown (e.g. an already truncated head);
+        the pager path skips highlighting altogether.
+        """
+        # Deferred: rich.syntax pulls in Pygments, which only previews need.
+        from rich.syntax import Syntax
+
+        console.print(
+            Syntax(content, "json", line_numbers=line_numbers, theme="monokai")
+        )
 
     def _prompt_for_full_content(self, content_type: str = "content") -> str:
         """Prompt user for how they want to see full content."""
@@ -297,20 +459,20 @@ class PullCommand:
         """Show a summary of what will be pulled."""
         console.print("\n[bold]Pull configuration summary:[/bold]")
 
+        from rich.table import Table
+
         table = Table()
         table.add_column("Source", style="cyan")
         table.add_column("Target", style="green")
         table.add_column("Components", style="yellow")
 
-        components = []
-        if pull_settings:
-            components.append("settings.json")
-        if include_keybindings:
-            components.append("keybindings.json")
-        if include_snippets:
-            components.append("snippets/")
-        if include_extensions:
-            components.append("extensions.json")
+        flags = (
+            pull_settings,
+            include_keybindings,
+            include_snippets,
+            include_extensions,
+        )
+        components = [name for name, wanted in zip(_COMPONENT_NAMES, flags) if wanted]
 
         table.add_row(
             str(app_details.config_path),
@@ -333,6 +495,7 @@ class PullCommand:
     ) -> None:
         """Show what would be pulled in a dry run."""
         console.print("\n[bold yellow]DRY RUN - No changes will be made[/bold yellow]")
+        self._index_source(app_details.config_path)
 
         # Show settings.json changes
         if pull_settings:
@@ -371,17 +534,22 @@ class PullCommand:
         source_settings_file = app_details.config_path / "settings.json"
         target_settings_file = target_layer_path / "settings.json"
 
-        if not source_settings_file.exists():
+        if not self._exists(source_settings_file):
             console.print(
                 "[yellow]Source settings.json does not exist - nothing to pull[/yellow]"
             )
             return
 
-        source_settings = FileOperations.read_json_file(source_settings_file)
+        source_raw = self._read_bytes(source_settings_file)
 
-        if target_settings_file.exists():
-            target_settings = FileOperations.read_json_file(target_settings_file)
-            if source_settings == target_settings:
+        if self._exists(target_settings_file):
+            # Byte-identical files need no parsing; otherwise compare the
+            # parsed JSON so formatting-only differences still match.
+            if (
+                source_raw == self._read_bytes(target_settings_file)
+                or self._load_json_bytes(source_settings_file)[1]
+                == self._load_json_bytes(target_settings_file)[1]
+            ):
                 console.print(
                     "[green]No changes needed - settings are identical[/green]"
                 )
@@ -394,42 +562,34 @@ class PullCommand:
                 f"[green]Will create new settings.json in:[/green] {target_layer_path}"
             )
 
-        # Show content preview based on options
-        settings_json = json.dumps(source_settings, indent=2, sort_keys=True)
-
+        # Preview the file exactly as it will be copied; the full text is
+        # only decoded when it is actually going to be shown.
         if full_preview:
             # Show full content with pager (unless disabled)
             self._show_content_with_pager(
-                settings_json, "Full settings.json content", use_pager=not no_pager
+                source_raw.decode("utf-8", errors="replace"),
+                "Full settings.json content",
+                use_pager=not no_pager,
             )
         else:
             # Show truncated preview with option to expand
             console.print("\n[dim]Content preview:[/dim]")
-            if len(settings_json) > 500:
-                console.print(
-                    Syntax(
-                        settings_json[:500] + "...",
-                        "json",
-                        line_numbers=False,
-                        theme="monokai",
-                    )
-                )
+            if len(source_raw) > 500:
+                # A multi-byte character cut at the boundary is just dropped.
+                head = source_raw[:500].decode("utf-8", errors="ignore")
+                self._render_json_preview(head + "...")
 
                 # Interactive prompt for full content
                 choice = self._prompt_for_full_content("settings.json content")
-                if choice == "pager":
-                    self._show_content_with_pager(
-                        settings_json, "Full settings.json content", use_pager=True
-                    )
-                elif choice == "direct":
+                if choice != "no":
                     self._show_content_with_pager(
-                        settings_json, "Full settings.json content", use_pager=False
+                        source_raw.decode("utf-8", errors="replace"),
+                        "Full settings.json content",
+                        use_pager=choice == "pager",
                     )
             else:
                 # Content is short enough, show it all
-                console.print(
-                    Syntax(settings_json, "json", line_numbers=False, theme="monokai")
-                )
+                self._render_json_preview(source_raw.decode("utf-8", errors="replace"))
 
     def _show_keybindings_pull_preview(
         self,
@@ -444,13 +604,14 @@ class PullCommand:
         source_keybindings_file = app_details.config_path / "keybindings.json"
         target_keybindings_file = target_layer_path / "keybindings.json"
 
-        if not source_keybindings_file.exists():
+        source_st = self._stat(source_keybindings_file)
+        if source_st is None:
             console.print(
                 "[yellow]Source keybindings.json does not exist - nothing to pull[/yellow]"
             )
             return
 
-        if target_keybindings_file.exists():
+        if self._exists(target_keybindings_file):
             console.print(
                 f"[yellow]Will overwrite existing keybindings.json in:[/yellow] {target_layer_path}"
             )
@@ -462,7 +623,9 @@ class PullCommand:
         # Show content preview for keybindings if requested
         if full_preview:
             try:
-                keybindings_content = source_keybindings_file.read_text()
+                keybindings_content = self._read_bytes(source_keybindings_file).decode(
+                    "utf-8"
+                )
                 self._show_content_with_pager(
                     keybindings_content,
                     "Full keybindings.json content",
@@ -473,32 +636,21 @@ class PullCommand:
         else:
             # For keybindings, we could show a summary or offer to show full content
             try:
-                keybindings_content = source_keybindings_file.read_text()
-                if len(keybindings_content) > 200:
-                    console.print(
-                        f"[dim]Keybindings file size: {len(keybindings_content)} characters[/dim]"
-                    )
+                # The size comes from the cached stat; the file is only read
+                # once its content is actually going to be shown.
+                size = source_st.st_size
+                if size > 200:
+                    console.print(f"[dim]Keybindings file size: {size} bytes[/dim]")
                     choice = self._prompt_for_full_content("keybindings.json content")
-                    if choice == "pager":
-                        self._show_content_with_pager(
-                            keybindings_content,
-                            "Full keybindings.json content",
-                            use_pager=True,
-                        )
-                    elif choice == "direct":
+                    if choice != "no":
                         self._show_content_with_pager(
-                            keybindings_content,
+                            self._read_bytes(source_keybindings_file).decode("utf-8"),
                             "Full keybindings.json content",
-                            use_pager=False,
+                            use_pager=choice == "pager",
                         )
                 else:
-                    console.print(
-                        Syntax(
-                            keybindings_content,
-                            "json",
-                            line_numbers=False,
-                            theme="monokai",
-                        )
+                    self._render_json_preview(
+                        self._read_bytes(source_keybindings_file).decode("utf-8")
                     )
             except Exception:
                 console.print("[dim]Unable to preview keybindings content[/dim]")
@@ -516,13 +668,13 @@ class PullCommand:
         source_snippets_dir = app_details.config_path / "snippets"
         target_snippets_dir = target_layer_path / "snippets"
 
-        if not source_snippets_dir.exists():
+        if not self._exists(source_snippets_dir):
             console.print(
                 "[yellow]Source snippets directory does not exist - nothing to pull[/yellow]"
             )
             return
 
-        snippet_files = list(source_snippets_dir.glob("*.code-snippets"))
+        snippet_files = self._list_snippets(source_snippets_dir)
         if not snippet_files:
             console.print("[yellow]No snippet files found in source directory[/yellow]")
             return
@@ -532,7 +684,7 @@ class PullCommand:
         )
         for snippet_file in snippet_files:
             target_file = target_snippets_dir / snippet_file.name
-            status = "overwrite" if target_file.exists() else "create"
+            status = "overwrite" if self._exists(target_file) else "create"
             console.print(
                 f"  [{('yellow' if status == 'overwrite' else 'green')}]{status}:[/{('yellow' if status == 'overwrite' else 'green')}] {snippet_file.name}"
             )
@@ -540,38 +692,20 @@ class PullCommand:
         # Show snippet content preview if requested
         if full_preview and snippet_files:
             # Show all snippet files in pager
-            combined_content = ""
-            for snippet_file in snippet_files:
-                try:
-                    content = snippet_file.read_text()
-                    combined_content += f"=== {snippet_file.name} ===\n{content}\n\n"
-                except Exception:
-                    combined_content += (
-                        f"=== {snippet_file.name} ===\n[Error reading file]\n\n"
-                    )
-
             self._show_content_with_pager(
-                combined_content, "All snippet files content", use_pager=not no_pager
+                _combine_snippets(snippet_files),
+                "All snippet files content",
+                use_pager=not no_pager,
             )
         elif not full_preview and len(snippet_files) > 0:
             # Offer to show snippet content
             choice = self._prompt_for_full_content("snippet files content")
             if choice != "no":
-                combined_content = ""
-                for snippet_file in snippet_files:
-                    try:
-                        content = snippet_file.read_text()
-                        combined_content += (
-                            f"=== {snippet_file.name} ===\n{content}\n\n"
-                        )
-                    except Exception:
-                        combined_content += (
-                            f"=== {snippet_file.name} ===\n[Error reading file]\n\n"
-                        )
-
                 use_pager = choice == "pager"
                 self._show_content_with_pager(
-                    combined_content, "All snippet files content", use_pager=use_pager
+                    _combine_snippets(snippet_files),
+                    "All snippet files content",
+                    use_pager=use_pager,
                 )
 
     def _show_extensions_pull_preview(
@@ -591,7 +725,7 @@ class PullCommand:
             return
 
         try:
-            extensions = AppManager.get_installed_extensions(app_details)
+            extensions = self._get_extensions(app_details)
         except ExtensionError as e:
             console.print(f"[red]Cannot get installed extensions:[/red] {e}")
             return
@@ -600,8 +734,11 @@ class PullCommand:
             console.print("[yellow]No extensions installed - nothing to pull[/yellow]")
             return
 
+        # Sorted once; both the short list and the full JSON use this order.
+        sorted_extensions = sorted(extensions)
+
         target_extensions_file = target_layer_path / "extensions.json"
-        status = "overwrite" if target_extensions_file.exists() else "create"
+        status = "overwrite" if self._exists(target_extensions_file) else "create"
 
         console.print(
             f"[green]Will {status} extensions.json with {len(extensions)} extensions in:[/green] {target_layer_path}"
@@ -611,7 +748,7 @@ class PullCommand:
         if full_preview:
             # Show full extensions list in pager
             extensions_content = json.dumps(
-                {"recommendations": sorted(extensions)}, indent=2
+                {"recommendations": sorted_extensions}, indent=2
             )
             self._show_content_with_pager(
                 extensions_content,
@@ -622,7 +759,7 @@ class PullCommand:
             # Show a preview of extensions
             console.print("\n[dim]Extensions to be saved:[/dim]")
             preview_count = min(10, len(extensions))
-            for ext in sorted(extensions[:preview_count]):
+            for ext in sorted_extensions[:preview_count]:
                 console.print(f"  • {ext}")
 
             if len(extensions) > preview_count:
@@ -632,7 +769,7 @@ class PullCommand:
                 choice = self._prompt_for_full_content("complete extensions list")
                 if choice != "no":
                     extensions_content = json.dumps(
-                        {"recommendations": sorted(extensions)}, indent=2
+                        {"recommendations": sorted_extensions}, indent=2
                     )
                     use_pager = choice == "pager"
                     self._show_content_with_pager(
@@ -663,6 +800,7 @@ class PullCommand:
     ) -> None:
         """Actually pull the configurations."""
         console.print("\n[bold]Pulling configurations...[/bold]")
+        self._index_source(app_details.config_path)
 
         # Pull settings.json
         if pull_settings:
@@ -687,14 +825,14 @@ class PullCommand:
         source_file = app_details.config_path / "settings.json"
         target_file = target_layer_path / "settings.json"
 
-        if not source_file.exists():
+        if not self._exists(source_file):
             console.print(
                 "[yellow]Source settings.json does not exist - skipping[/yellow]"
             )
             return
 
         if (
-            target_file.exists()
+            self._exists(target_file)
             and not overwrite
             and not Confirm.ask(
                 f"Overwrite existing settings.json in {target_layer_path}?",
@@ -707,7 +845,7 @@ class PullCommand:
             return
 
         console.print("[cyan]Pulling settings.json...[/cyan]")
-        FileOperations.copy_file(source_file, target_file)
+        self._copy_source(source_file, target_file)
         console.print("[green]✓[/green] Settings.json pulled")
 
     def _pull_keybindings(
@@ -717,14 +855,14 @@ class PullCommand:
         source_file = app_details.config_path / "keybindings.json"
         target_file = target_layer_path / "keybindings.json"
 
-        if not source_file.exists():
+        if not self._exists(source_file):
             console.print(
                 "[yellow]Source keybindings.json does not exist - skipping[/yellow]"
             )
             return
 
         if (
-            target_file.exists()
+            self._exists(target_file)
             and not overwrite
             and not Confirm.ask(
                 f"Overwrite existing keybindings.json in {target_layer_path}?",
@@ -737,7 +875,7 @@ class PullCommand:
             return
 
         console.print("[cyan]Pulling keybindings.json...[/cyan]")
-        FileOperations.copy_file(source_file, target_file)
+        self._copy_source(source_file, target_file)
         console.print("[green]✓[/green] Keybindings.json pulled")
 
     def _pull_snippets(
@@ -747,13 +885,13 @@ class PullCommand:
         source_dir = app_details.config_path / "snippets"
         target_dir = target_layer_path / "snippets"
 
-        if not source_dir.exists():
+        if not self._exists(source_dir):
             console.print(
                 "[yellow]Source snippets directory does not exist - skipping[/yellow]"
             )
             return
 
-        snippet_files = list(source_dir.glob("*.code-snippets"))
+        snippet_files = self._list_snippets(source_dir)
         if not snippet_files:
             console.print(
                 "[yellow]No snippet files found in source directory - skipping[/yellow]"
@@ -761,7 +899,7 @@ class PullCommand:
             return
 
         if (
-            target_dir.exists()
+            self._exists(target_dir)
             and not overwrite
             and not Confirm.ask(
                 f"Overwrite existing snippets in {target_layer_path}?", default=False
@@ -773,14 +911,13 @@ class PullCommand:
             return
 
         console.print("[cyan]Pulling snippets...[/cyan]")
-        FileOperations.ensure_directory(target_dir)
+        # Creates target_dir and copies the files on a thread pool.
         FileOperations.copy_directory_contents(
             source_dir, target_dir, overwrite_existing=True
         )
+        self._invalidate(target_dir, *(target_dir / f.name for f in snippet_files))
 
-        # Count copied files
-        copied_files = len(list(target_dir.glob("*.code-snippets")))
-        console.print(f"[green]✓[/green] {copied_files} snippet files pulled")
+        console.print(f"[green]✓[/green] {len(snippet_files)} snippet files pulled")
 
     def _pull_extensions(
         self, app_details: AppDetails, target_layer_path: Path, *, overwrite: bool
@@ -795,7 +932,7 @@ class PullCommand:
             return
 
         try:
-            extensions = AppManager.get_installed_extensions(app_details)
+            extensions = self._get_extensions(app_details)
         except ExtensionError as e:
             console.print(f"[red]Cannot get installed extensions:[/red] {e}")
             return
@@ -805,7 +942,7 @@ class PullCommand:
             return
 
         if (
-            target_file.exists()
+            self._exists(target_file)
             and not overwrite
             and not Confirm.ask(
                 f"Overwrite existing extensions.json in {target_layer_path}?",
@@ -824,6 +961,7 @@ class PullCommand:
         }
 
         FileOperations.write_json_file(target_file, extensions_data)
+        self._invalidate(target_file)
         console.print(f"[green]✓[/green] {len(extensions)} extensions pulled")
 
     def _show_success_message(
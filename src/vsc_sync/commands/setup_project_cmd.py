@@ -136,9 +136,10 @@ class SetupProjectCommand:
         # Merge settings.json from all layers
         merged_settings = {}
         for layer in layers:
-            settings_file = layer.path / "settings.json"
-            if settings_file.exists():
-                layer_settings = self.layer_manager.load_json_file(settings_file)
+            layer_settings = self.layer_manager.load_json_file(
+                layer.path / "settings.json"
+            )
+            if layer_settings:
                 merged_settings = self.layer_manager.deep_merge_dicts(
                     merged_settings, layer_settings
                 )
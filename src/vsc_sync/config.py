@@ -2,8 +2,10 @@
 
 import json
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from .exceptions import ConfigError
 from .models import VscSyncConfig
@@ -11,6 +13,12 @@ from .utils import get_vsc_sync_config_path
 
 logger = logging.getLogger(__name__)
 
+# Parsed configurations keyed by path, together with the (mtime_ns, size,
+# inode) signature of the file they were parsed from.  Lets back-to-back
+# ConfigManager instances in one process skip re-reading an unchanged file.
+_CFG_CACHE: Dict[Path, Tuple[Tuple[int, int, int], VscSyncConfig]] = {}
+_CFG_CACHE_LOCK = threading.Lock()
+
 
 class ConfigManager:
     """Manages loading and saving of vsc-sync's own configuration."""
@@ -20,19 +28,37 @@ class ConfigManager:
         self._config: Optional[VscSyncConfig] = None
 
     def load_config(self) -> VscSyncConfig:
-        """Load configuration from disk, creating default if not exists."""
-        if not self.config_path.exists():
+        """Load configuration from disk, creating default if not exists.
+
+        Parsed configurations are cached per process and reused while the
+        file's mtime, size and inode are unchanged.  The returned object may
+        therefore be shared between managers and must be treated as
+        read-only; build a new ``VscSyncConfig`` and pass it to
+        ``save_config`` to change it.
+        """
+        try:
+            st = os.stat(self.config_path)
+        except FileNotFoundError:
             logger.info("No configuration file found, creating default config")
             self._config = VscSyncConfig(
                 vscode_configs_path=Path.home() / "vscode-configs", managed_apps={}
             )
             return self._config
 
+        sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+        with _CFG_CACHE_LOCK:
+            cached = _CFG_CACHE.get(self.config_path)
+        if cached is not None and cached[0] == sig:
+            self._config = cached[1]
+            return self._config
+
         try:
             with open(self.config_path, "r", encoding="utf-8") as f:
                 config_data = json.load(f)
 
             self._config = VscSyncConfig(**config_data)
+            with _CFG_CACHE_LOCK:
+                _CFG_CACHE[self.config_path] = (sig, self._config)
             logger.debug(f"Loaded configuration from {self.config_path}")
             return self._config
 
@@ -58,6 +84,9 @@ class ConfigManager:
             with open(self.config_path, "w", encoding="utf-8") as f:
                 json.dump(config_dict, f, indent=2, ensure_ascii=False)
 
+            with _CFG_CACHE_LOCK:
+                _CFG_CACHE.pop(self.config_path, None)
+
             logger.debug(f"Saved configuration to {self.config_path}")
             self._config = config_to_save
 
@@ -74,5 +103,9 @@ class ConfigManager:
         return self._config
 
     def is_initialized(self) -> bool:
-        """Check if vsc-sync has been initialized."""
-        return self.config_path.exists() and bool(self.config.vscode_configs_path)
+        """Check if vsc-sync has been initialized.
+
+        Only checks that the configuration file exists; parsing errors
+        surface from ``load_config`` when the configuration is first used.
+        """
+        return self.config_path.exists()
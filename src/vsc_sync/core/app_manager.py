@@ -1,16 +1,81 @@
 """Application management for discovering and interacting with VSCode-like apps."""
 
+import functools
+import json
 import logging
 import platform
 import subprocess
+import sys
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from ..exceptions import AppConfigPathError, ExtensionError
 from ..models import AppDetails
+from ..utils import get_vsc_sync_cache_dir
 
 logger = logging.getLogger(__name__)
 
+# How long (in seconds) a persisted auto-discovery result stays valid.
+DISCOVERY_CACHE_TTL = 60
+
+
+def _discovery_cache_path() -> Path:
+    """Return the file used to persist auto-discovery results."""
+    return get_vsc_sync_cache_dir() / "discover.json"
+
+
+def _discovery_signature() -> List[Any]:
+    """Return the values a persisted discovery result must match to be reused."""
+    try:
+        home_mtime = Path.home().stat().st_mtime_ns
+    except OSError:
+        home_mtime = None
+    return [sys.platform, home_mtime]
+
+
+def _load_discovery_cache(signature: List[Any]) -> Optional[Dict[str, AppDetails]]:
+    """Return persisted discovery results if they are fresh and still valid."""
+    try:
+        data = json.loads(_discovery_cache_path().read_text(encoding="utf-8"))
+        if data["signature"] != signature:
+            return None
+        if time.time() - data["created"] > DISCOVERY_CACHE_TTL:
+            return None
+        return {alias: AppDetails(**app) for alias, app in data["apps"].items()}
+    except Exception:
+        return None
+
+
+def _save_discovery_cache(
+    signature: List[Any], apps: Dict[str, AppDetails]
+) -> None:
+    """Persist discovery results; failures only cost a re-probe next time."""
+    cache_file = _discovery_cache_path()
+    data = {
+        "signature": signature,
+        "created": time.time(),
+        "apps": {alias: app.model_dump(mode="json") for alias, app in apps.items()},
+    }
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(data), encoding="utf-8")
+    except OSError as e:
+        logger.debug(f"Could not write discovery cache {cache_file}: {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_discovery() -> Dict[str, AppDetails]:
+    """Discover apps once per process, reusing a fresh on-disk result if any."""
+    signature = _discovery_signature()
+    apps = _load_discovery_cache(signature)
+    if apps is None:
+        apps = AppManager.probe_apps()
+        _save_discovery_cache(signature, apps)
+    else:
+        logger.debug("Using cached auto-discovery results")
+    return apps
+
 
 class AppManager:
     """Manages VSCode-like applications and their configurations."""
@@ -112,8 +177,25 @@ class AppManager:
             }
 
     @staticmethod
-    def auto_discover_apps() -> Dict[str, AppDetails]:
-        """Auto-discover installed VSCode-like applications."""
+    def auto_discover_apps(use_cache: bool = True) -> Dict[str, AppDetails]:
+        """Auto-discover installed VSCode-like applications.
+
+        Results are memoized for the process and persisted for
+        ``DISCOVERY_CACHE_TTL`` seconds, so running ``discover`` and then
+        ``init`` does not repeat the probes.  ``use_cache=False`` ignores
+        both caches and refreshes them with a new probe.
+        """
+        if not use_cache:
+            _cached_discovery.cache_clear()
+            apps = AppManager.probe_apps()
+            _save_discovery_cache(_discovery_signature(), apps)
+            return dict(apps)
+
+        return dict(_cached_discovery())
+
+    @staticmethod
+    def probe_apps() -> Dict[str, AppDetails]:
+        """Probe well-known install locations for VSCode-like applications."""
         discovered_apps = {}
         default_paths = AppManager.get_default_app_paths()
 
@@ -295,3 +377,86 @@ class AppManager:
                 f"Unexpected error uninstalling extension {extension_id} for {app_details.alias}: {e}"
             )
             return False
+
+    @staticmethod
+    def install_extensions_batch(
+        app_details: AppDetails, extension_ids: List[str]
+    ) -> Dict[str, bool]:
+        """Install several extensions with a single CLI invocation.
+
+        Returns whether each extension ended up installed.
+        """
+        return AppManager._run_extension_batch(
+            app_details, "--install-extension", extension_ids, 120, installed=True
+        )
+
+    @staticmethod
+    def uninstall_extensions_batch(
+        app_details: AppDetails, extension_ids: List[str]
+    ) -> Dict[str, bool]:
+        """Uninstall several extensions with a single CLI invocation.
+
+        Returns whether each extension ended up removed.
+        """
+        return AppManager._run_extension_batch(
+            app_details, "--uninstall-extension", extension_ids, 60, installed=False
+        )
+
+    @staticmethod
+    def _run_extension_batch(
+        app_details: AppDetails,
+        flag: str,
+        extension_ids: List[str],
+        timeout_each: int,
+        installed: bool,
+    ) -> Dict[str, bool]:
+        """Pass ``flag <id>`` for every extension to one CLI process.
+
+        VSCode-like CLIs process every flag and exit non-zero if any of them
+        failed.  In that case the installed extensions are listed once to
+        find out which operations actually took effect.
+        """
+        if not app_details.executable_path:
+            raise ExtensionError(
+                f"No executable path configured for {app_details.alias}"
+            )
+        if not extension_ids:
+            return {}
+
+        argv = [str(app_details.executable_path)]
+        for extension_id in extension_ids:
+            argv += [flag, extension_id]
+
+        try:
+            result = subprocess.run(
+                argv,
+                capture_output=True,
+                text=True,
+                timeout=timeout_each * len(extension_ids),
+            )
+            if result.returncode == 0:
+                logger.debug(
+                    f"Ran {flag} for {len(extension_ids)} extensions on {app_details.alias}"
+                )
+                return {extension_id: True for extension_id in extension_ids}
+            logger.error(
+                f"{flag} failed for some extensions on {app_details.alias}: "
+                f"{result.stderr.strip()}"
+            )
+        except subprocess.TimeoutExpired:
+            logger.error(f"Timeout while running {flag} for {app_details.alias}")
+        except Exception as e:
+            logger.error(
+                f"Unexpected error running {flag} for {app_details.alias}: {e}"
+            )
+
+        try:
+            present = {
+                ext.lower() for ext in AppManager.get_installed_extensions(app_details)
+            }
+        except ExtensionError:
+            return {extension_id: False for extension_id in extension_ids}
+        return {
+            extension_id: (extension_id.lower() in present) == installed
+            for extension_id in extension_ids
+        }
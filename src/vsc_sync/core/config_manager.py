@@ -2,8 +2,9 @@
 
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from ..exceptions import LayerNotFoundError
 from ..models import ExtensionsConfig, LayerInfo, MergeResult
@@ -37,19 +38,41 @@ class LayerConfigManager:
     def layer_exists(self, layer_type: str, layer_name: Optional[str] = None) -> bool:
         """Check if a layer exists."""
         try:
-            layer_path = self.get_layer_path(layer_type, layer_name)
-            return layer_path.exists() and layer_path.is_dir()
+            return self.get_layer_path(layer_type, layer_name).is_dir()
         except ValueError:
             return False
 
+    def list_layers(
+        self, layer_type: str, names: Optional[List[str]] = None
+    ) -> Iterator[LayerInfo]:
+        """Yield the existing layers of a named layer type (app, stack, project).
+
+        When ``names`` is given only those layer directories are probed, in
+        that order, instead of listing the whole ``<layer_type>s/`` directory.
+        """
+        if names is None:
+            type_dir = self.vscode_configs_path / f"{layer_type}s"
+            try:
+                with os.scandir(type_dir) as it:
+                    names = sorted(entry.name for entry in it if entry.is_dir())
+            except FileNotFoundError:
+                return
+
+        for name in names:
+            if self.layer_exists(layer_type, name):
+                yield LayerInfo(
+                    layer_type=layer_type,
+                    layer_name=name,
+                    path=self.get_layer_path(layer_type, name),
+                )
+
     def load_json_file(self, file_path: Path) -> Dict[str, Any]:
         """Load a JSON file, returning empty dict if file doesn't exist."""
-        if not file_path.exists():
-            return {}
-
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 return json.load(f)
+        except FileNotFoundError:
+            return {}
         except Exception as e:
             logger.warning(f"Failed to load JSON file {file_path}: {e}")
             return {}
@@ -78,15 +101,12 @@ class LayerConfigManager:
 
         for layer in layers:
             extensions_file = layer.path / "extensions.json"
-            if extensions_file.exists():
-                try:
-                    extensions_data = self.load_json_file(extensions_file)
-                    config = ExtensionsConfig(**extensions_data)
-                    extensions.extend(config.recommendations)
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load extensions from {extensions_file}: {e}"
-                    )
+            try:
+                extensions_data = self.load_json_file(extensions_file)
+                config = ExtensionsConfig(**extensions_data)
+                extensions.extend(config.recommendations)
+            except Exception as e:
+                logger.warning(f"Failed to load extensions from {extensions_file}: {e}")
 
         # Return deduplicated list while preserving order
         seen = set()
@@ -155,23 +175,19 @@ class LayerConfigManager:
                 logger.warning(f"App layer '{app_alias}' not found, skipping")
 
         # Add stack layers
+        stack_layers = list(self.list_layers("stack", stacks))
+        found_stacks = {layer.layer_name for layer in stack_layers}
         for stack in stacks:
-            if self.layer_exists("stack", stack):
-                stack_layer = LayerInfo(
-                    layer_type="stack",
-                    layer_name=stack,
-                    path=self.get_layer_path("stack", stack),
-                )
-                layers.append(stack_layer)
-            else:
+            if stack not in found_stacks:
                 logger.warning(f"Stack layer '{stack}' not found, skipping")
+        layers.extend(stack_layers)
 
         # Merge settings.json from all layers
         merged_settings = {}
+        # Literal file names are opened directly; a missing file loads as {}.
         for layer in layers:
-            settings_file = layer.path / "settings.json"
-            if settings_file.exists():
-                layer_settings = self.load_json_file(settings_file)
+            layer_settings = self.load_json_file(layer.path / "settings.json")
+            if layer_settings:
                 merged_settings = self.deep_merge_dicts(merged_settings, layer_settings)
 
         # Collect other components
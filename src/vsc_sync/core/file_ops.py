@@ -2,15 +2,131 @@
 
 import json
 import logging
+import os
 import shutil
+import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from ..exceptions import VscSyncError
 
 logger = logging.getLogger(__name__)
 
+# Worker threads for bulk copies; copies block on I/O with the GIL released.
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _kernel_copies() -> List[Callable[[int, int, int], int]]:
+    """Return the in-kernel copy primitives this platform offers, best first.
+
+    Each takes ``(src_fd, dst_fd, count)`` and advances both file offsets.
+    """
+    copies: List[Callable[[int, int, int], int]] = []
+    if hasattr(os, "copy_file_range"):
+        copies.append(os.copy_file_range)
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        # Linux allows any file as sendfile's destination.
+        copies.append(lambda src, dst, count: os.sendfile(dst, src, None, count))
+    return copies
+
+
+_KERNEL_COPIES = _kernel_copies()
+
+
+def _copy_contents(source: Path, destination: Path) -> None:
+    """Copy file bytes without a userspace buffer where the kernel allows it.
+
+    Tries ``copy_file_range`` (which can reflink on btrfs/xfs), then
+    ``sendfile``, and finally a plain 1 MiB buffered copy.
+    """
+    with open(source, "rb") as fsrc, open(destination, "wb") as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(src_fd).st_size
+        for kernel_copy in _KERNEL_COPIES:
+            try:
+                remaining = size
+                while remaining > 0:
+                    copied = kernel_copy(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                return
+            except OSError:
+                # e.g. EXDEV/ENOSYS/EINVAL; start over with the next method.
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst, 1 << 20)
+
+
+def _current_umask() -> int:
+    """Return the process umask (there is no way to read it without setting it)."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Permission bits for newly written files that have no mode to inherit.
+_NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def _replace_file(
+    target: Path,
+    write: Callable[[Path], object],
+    stat_from: Optional[Path] = None,
+    mode_from: Optional[Path] = None,
+) -> None:
+    """Replace ``target``'s contents by calling ``write`` on a path.
+
+    ``write`` fills a uniquely named temporary file beside ``target`` that is
+    then renamed over it, so readers never see a partial file.  A target with
+    other hard links is written in place instead, which keeps the links
+    intact at the cost of that atomicity.  ``target`` should already have
+    its symlinks resolved.
+
+    With ``stat_from`` its times, mode and xattrs are copied; otherwise the
+    file keeps the existing target's permission bits, or for a new file
+    takes ``mode_from``'s (or the umask default).
+    """
+    try:
+        hard_linked = os.stat(target).st_nlink > 1
+    except FileNotFoundError:
+        hard_linked = False
+
+    if hard_linked:
+        write(target)
+        if stat_from is not None:
+            shutil.copystat(stat_from, target)
+        return
+
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{target.name}.", suffix=".tmp", dir=target.parent
+    )
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        write(tmp)
+        if stat_from is not None:
+            shutil.copystat(stat_from, tmp)
+        else:
+            try:
+                shutil.copymode(target, tmp)
+            except FileNotFoundError:
+                if mode_from is not None:
+                    shutil.copymode(mode_from, tmp)
+                else:
+                    os.chmod(tmp, _NEW_FILE_MODE)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
 
 class FileOperations:
     """Handles file and directory operations for vsc-sync."""
@@ -44,8 +160,11 @@ class FileOperations:
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
+            # Serialise up front so the file gets one write instead of one per
+            # encoder chunk.
+            content = json.dumps(data, indent=2, ensure_ascii=False)
             with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write(content)
 
             logger.debug(f"Wrote JSON file: {file_path}")
 
@@ -67,54 +186,176 @@ class FileOperations:
             return {}
 
     @staticmethod
-    def copy_file(source: Path, destination: Path, create_dirs: bool = True) -> None:
-        """Copy a file from source to destination."""
+    def copy_file(
+        source: Path,
+        destination: Path,
+        create_dirs: bool = True,
+        preserve_metadata: bool = True,
+    ) -> None:
+        """Copy a file from source to destination.
+
+        The copy goes to a uniquely named temporary file that is renamed over
+        the destination, so readers never see a partial file.  A destination
+        with other hard links is overwritten in place instead, which keeps
+        the links intact at the cost of that atomicity.
+
+        With ``preserve_metadata`` False the source's times and xattrs are
+        not copied; the file keeps the permission bits of the existing
+        destination, or takes the source's if it is new.
+        """
         if not source.exists():
             raise VscSyncError(f"Source file does not exist: {source}")
 
         if create_dirs:
             destination.parent.mkdir(parents=True, exist_ok=True)
 
+        # Write through a symlinked destination rather than replacing the link.
+        target = Path(os.path.realpath(destination))
         try:
-            shutil.copy2(source, destination)
+            _replace_file(
+                target,
+                lambda path: _copy_contents(source, path),
+                stat_from=source if preserve_metadata else None,
+                mode_from=source,
+            )
             logger.debug(f"Copied file: {source} -> {destination}")
 
         except Exception as e:
             raise VscSyncError(f"Failed to copy file {source} to {destination}: {e}")
 
+    @staticmethod
+    def atomic_write_bytes(file_path: Path, data: bytes) -> None:
+        """Replace a file's contents with ``data``.
+
+        Written like :meth:`copy_file`: through a uniquely named temporary
+        file and a rename, or in place for a hard-linked file.  Symlinks are
+        written through and an existing file keeps its permission bits.
+        """
+        target = Path(os.path.realpath(file_path))
+        try:
+            _replace_file(target, lambda path: path.write_bytes(data))
+            logger.debug(f"Wrote file: {file_path}")
+
+        except Exception as e:
+            raise VscSyncError(f"Failed to write file {file_path}: {e}")
+
+    @staticmethod
+    def copy_files(
+        pairs: Iterable[Tuple[Path, Path]], max_workers: int = COPY_WORKERS
+    ) -> int:
+        """Copy many ``(source, destination)`` files concurrently.
+
+        Destination directories must already exist and destinations should be
+        unique.  Returns the number of files copied; the first failure is
+        raised as :class:`VscSyncError`.
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as pool:
+            futures = {
+                pool.submit(shutil.copy2, source, destination): (source, destination)
+                for source, destination in pairs
+            }
+            for future in as_completed(futures):
+                source, destination = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    raise VscSyncError(
+                        f"Failed to copy file {source} to {destination}: {e}"
+                    )
+                logger.debug(f"Copied file: {source} -> {destination}")
+
+        return len(pairs)
+
     @staticmethod
     def copy_directory_contents(
         source_dir: Path, destination_dir: Path, overwrite_existing: bool = True
     ) -> None:
-        """Copy contents of source directory to destination directory."""
+        """Copy contents of source directory to destination directory.
+
+        Top-level files are copied concurrently via :meth:`copy_files`;
+        subdirectories are copied with ``shutil.copytree``.
+        """
         if not source_dir.exists():
             raise VscSyncError(f"Source directory does not exist: {source_dir}")
 
         destination_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            for item in source_dir.iterdir():
-                dest_item = destination_dir / item.name
-
-                if item.is_file():
-                    if dest_item.exists() and not overwrite_existing:
+            file_pairs = []
+            with os.scandir(source_dir) as it:
+                entries = list(it)
+            for entry in entries:
+                item = Path(entry.path)
+                dest_item = destination_dir / entry.name
+
+                if entry.is_file():
+                    if not overwrite_existing and dest_item.exists():
                         logger.warning(f"Skipping existing file: {dest_item}")
                         continue
-                    shutil.copy2(item, dest_item)
-                    logger.debug(f"Copied file: {item} -> {dest_item}")
+                    file_pairs.append((item, dest_item))
 
-                elif item.is_dir():
-                    if dest_item.exists() and not overwrite_existing:
+                elif entry.is_dir():
+                    if not overwrite_existing and dest_item.exists():
                         logger.warning(f"Skipping existing directory: {dest_item}")
                         continue
                     shutil.copytree(item, dest_item, dirs_exist_ok=overwrite_existing)
                     logger.debug(f"Copied directory: {item} -> {dest_item}")
 
+            copied = FileOperations.copy_files(file_pairs)
+            logger.debug(f"Copied {copied} files: {source_dir} -> {destination_dir}")
+
         except Exception as e:
             raise VscSyncError(
                 f"Failed to copy directory contents from {source_dir} to {destination_dir}: {e}"
             )
 
+    @staticmethod
+    def parallel_rmtree(root: Path, workers: int = 16) -> None:
+        """Remove a directory tree, unlinking its files on a thread pool.
+
+        Suited to trees of many small files (e.g. extension ``node_modules``)
+        where a serial ``shutil.rmtree`` is dominated by per-file syscalls.
+        Directories are removed afterwards in post-order, once empty.
+
+        Like ``shutil.rmtree``, a symlinked ``root`` is refused rather than
+        emptying the directory it points to.
+        """
+        if os.path.islink(root):
+            raise OSError(f"Cannot call parallel_rmtree on a symbolic link: {root}")
+
+        def _raise(error: OSError) -> None:
+            # Don't skip unreadable directories; their rmdir would fail later
+            # with a less useful error.
+            raise error
+
+        files: List[str] = []
+        dirs: List[str] = []
+        for dirpath, dirnames, filenames in os.walk(
+            root, topdown=False, onerror=_raise
+        ):
+            files.extend(os.path.join(dirpath, name) for name in filenames)
+            for name in dirnames:
+                path = os.path.join(dirpath, name)
+                # os.walk lists symlinked dirs without descending into them.
+                if os.path.islink(path):
+                    files.append(path)
+            dirs.append(dirpath)
+
+        if files:
+            with ThreadPoolExecutor(max_workers=min(workers, len(files))) as pool:
+                # list() surfaces the first unlink error here.
+                list(pool.map(os.unlink, files))
+
+        # os.walk with topdown=False yields children before their parents.
+        for path in dirs:
+            os.rmdir(path)
+
+        logger.debug(f"Removed directory tree: {root}")
+
     @staticmethod
     def safe_remove_file(file_path: Path) -> bool:
         """Safely remove a file, returning True if successful."""
@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 try:
     import git
@@ -27,9 +27,20 @@ class GitOperations:
 
     @staticmethod
     def clone_repository(
-        repo_url: str, destination: Path, branch: Optional[str] = None
+        repo_url: str,
+        destination: Path,
+        branch: Optional[str] = None,
+        depth: Optional[int] = None,
+        single_branch: bool = False,
+        filter_spec: Optional[str] = None,
     ) -> None:
-        """Clone a Git repository to the specified destination."""
+        """Clone a Git repository to the specified destination.
+
+        ``depth`` limits the history fetched (``--depth``),
+        ``single_branch`` fetches only the cloned branch (``--single-branch``)
+        and ``filter_spec`` makes a partial clone (``--filter``), e.g.
+        ``"blob:none"`` to fetch file contents only when checked out.
+        """
         if not GitOperations.is_git_available():
             raise GitOperationError(
                 "Git support is not available. Please install GitPython: pip install gitpython"
@@ -46,9 +57,15 @@ class GitOperations:
 
             logger.info(f"Cloning repository {repo_url} to {destination}")
 
-            clone_kwargs = {}
+            clone_kwargs: Dict[str, Any] = {}
             if branch:
                 clone_kwargs["branch"] = branch
+            if depth:
+                clone_kwargs["depth"] = depth
+            if single_branch:
+                clone_kwargs["single_branch"] = True
+            if filter_spec:
+                clone_kwargs["filter"] = filter_spec
 
             repo = git.Repo.clone_from(repo_url, destination, **clone_kwargs)
             logger.info(f"Successfully cloned repository to {destination}")
@@ -1,9 +1,11 @@
 """General utility functions for vsc-sync."""
 
+import functools
 import logging
+import os
 import platform
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from rich.console import Console
 from rich.logging import RichHandler
@@ -12,7 +14,15 @@ console = Console()
 
 
 def setup_logging(verbose: bool = False) -> None:
-    """Set up logging configuration."""
+    """Set up logging configuration.
+
+    Repeated calls with the same ``verbose`` value are no-ops, so invoking
+    the CLI several times in one process does not redo the setup.
+    """
+    if getattr(setup_logging, "_done", None) == verbose:
+        return
+    setup_logging._done = verbose  # type: ignore[attr-defined]
+
     level = logging.DEBUG if verbose else logging.INFO
 
     logging.basicConfig(
@@ -47,10 +57,74 @@ def get_vsc_sync_config_path() -> Path:
         return config_dir / "vsc-sync" / "config.json"
 
 
+def get_vsc_sync_cache_dir() -> Path:
+    """Get the directory where vsc-sync keeps disposable caches."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "vsc-sync"
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_cached(path_str: str, cwd: str, home: Optional[str]) -> Path:
+    """Resolve ``path_str``; ``cwd`` and ``home`` only key the cache."""
+    return Path(path_str).expanduser().resolve()
+
+
 def resolve_path(path_str: str) -> Path:
-    """Resolve a path string to an absolute Path object."""
-    path = Path(path_str).expanduser().resolve()
-    return path
+    """Resolve a path string to an absolute Path object.
+
+    Results are memoised per working directory and ``$HOME``, so resolving
+    the same input again skips the lstat of every path component.
+    """
+    return _resolve_cached(path_str, os.getcwd(), os.environ.get("HOME"))
+
+
+def paths_exist(paths: Iterable[Path]) -> Dict[Path, bool]:
+    """Check whether each of ``paths`` exists, batching by parent directory.
+
+    Paths sharing a parent are answered from a single ``os.scandir`` of that
+    parent instead of one ``stat`` each; a lone path is simply stat'ed.
+    Paths are made absolute first, so ``.`` and ``..`` components group
+    with their real parent.  As with ``Path.exists``, a dangling symlink
+    counts as missing.
+
+    A name absent from the listing is confirmed with ``os.path.lexists``, so
+    a differently cased path on a case-insensitive filesystem still counts,
+    and an unlistable parent falls back to one ``exists`` per path.
+    """
+    by_parent: Dict[Path, List[Tuple[Path, Path]]] = {}
+    for path in paths:
+        normalized = Path(os.path.abspath(path))
+        by_parent.setdefault(normalized.parent, []).append((path, normalized))
+
+    result: Dict[Path, bool] = {}
+    for parent, children in by_parent.items():
+        if len(children) == 1:
+            path, normalized = children[0]
+            result[path] = normalized.exists()
+            continue
+
+        try:
+            with os.scandir(parent) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            # e.g. an execute-only directory; its children can still be stat'ed.
+            for path, normalized in children:
+                result[path] = normalized.exists()
+            continue
+
+        for path, normalized in children:
+            entry = entries.get(normalized.name)
+            if entry is None:
+                # Case-insensitive filesystems list the name as stored on disk.
+                result[path] = os.path.lexists(normalized) and normalized.exists()
+            elif entry.is_symlink():
+                # Follow the link, like Path.exists().
+                result[path] = os.path.exists(entry.path)
+            else:
+                result[path] = True
+
+    return result
 
 
 def confirm_action(message: str, default: bool = False) -> bool:
@@ -6,7 +6,12 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from vsc_sync.commands.apply_cmd import ApplyCommand
+from vsc_sync.commands.apply_cmd import (
+    ApplyCommand,
+    _files_equal,
+    diff_settings,
+    flatten_dict,
+)
 from vsc_sync.config import ConfigManager
 from vsc_sync.exceptions import AppConfigPathError, VscSyncError
 from vsc_sync.models import AppDetails, VscSyncConfig, MergeResult
@@ -267,8 +272,92 @@ class TestApplyCommand:
         assert app_snippets_dir.exists()
         assert (app_snippets_dir / "global.code-snippets").exists()
 
+    def test_backups_in_same_second_do_not_collide(
+        self, temp_dir, mock_vscode_configs_repo
+    ):
+        """A second default backup in the same second gets a numbered suffix."""
+        config_manager = ConfigManager(temp_dir / "config.json")
+        app_config_dir = temp_dir / "vscode_config"
+        app_config_dir.mkdir()
+        app_details = AppDetails(alias="test-vscode", config_path=app_config_dir)
+        config_manager.save_config(
+            VscSyncConfig(
+                vscode_configs_path=mock_vscode_configs_repo,
+                managed_apps={"test-vscode": app_details},
+            )
+        )
+        apply_cmd = ApplyCommand(config_manager)
+
+        with patch("vsc_sync.commands.apply_cmd.time.time_ns", return_value=10**18):
+            first = apply_cmd._create_backup(app_details, None)
+            second = apply_cmd._create_backup(app_details, None)
+
+        assert first.name == "vscode_config.bak.1000000000"
+        assert second.name == "vscode_config.bak.1000000000.1"
+
+    def test_clean_user_directory_respects_flags(
+        self, temp_dir, mock_vscode_configs_repo
+    ):
+        """Only the selected managed items are removed; everything else stays."""
+        config_manager = ConfigManager(temp_dir / "config.json")
+        app_config_dir = temp_dir / "vscode_config"
+        app_config_dir.mkdir()
+        app_details = AppDetails(alias="test-vscode", config_path=app_config_dir)
+        config_manager.save_config(
+            VscSyncConfig(
+                vscode_configs_path=mock_vscode_configs_repo,
+                managed_apps={"test-vscode": app_details},
+            )
+        )
+        (app_config_dir / "settings.json").write_text("{}")
+        (app_config_dir / "keybindings.json").write_text("[]")
+        (app_config_dir / "snippets").mkdir()
+        (app_config_dir / "snippets" / "a.code-snippets").write_text("{}")
+        (app_config_dir / "globalStorage").mkdir()
+
+        ApplyCommand(config_manager)._clean_user_directory(
+            app_details,
+            include_settings=True,
+            include_keybindings=False,
+            include_snippets=True,
+            tasks_enabled=True,
+        )
+
+        assert sorted(p.name for p in app_config_dir.iterdir()) == [
+            "globalStorage",
+            "keybindings.json",
+        ]
+
+    def test_apply_snippets_later_layer_wins(self, temp_dir, mock_vscode_configs_repo):
+        """A snippet file present in several layers ends up with the last copy."""
+        config_manager = ConfigManager(temp_dir / "config.json")
+        app_config_dir = temp_dir / "vscode_config"
+        app_config_dir.mkdir()
+        app_details = AppDetails(alias="test-vscode", config_path=app_config_dir)
+        config_manager.save_config(
+            VscSyncConfig(
+                vscode_configs_path=mock_vscode_configs_repo,
+                managed_apps={"test-vscode": app_details},
+            )
+        )
+
+        layers = []
+        for name in ("first", "second"):
+            layer = temp_dir / name
+            layer.mkdir()
+            (layer / "shared.code-snippets").write_text(name)
+            (layer / f"{name}.json").write_text("{}")
+            layers.append(layer)
+
+        ApplyCommand(config_manager)._apply_snippets(app_details, layers)
+
+        app_snippets_dir = app_config_dir / "snippets"
+        assert (app_snippets_dir / "shared.code-snippets").read_text() == "second"
+        assert (app_snippets_dir / "first.json").exists()
+        assert (app_snippets_dir / "second.json").exists()
+
     @patch("vsc_sync.commands.apply_cmd.AppManager.get_installed_extensions")
-    @patch("vsc_sync.commands.apply_cmd.AppManager.install_extension")
+    @patch("vsc_sync.commands.apply_cmd.AppManager.install_extensions_batch")
     def test_apply_extensions_install(
         self, mock_install, mock_get_installed, temp_dir, mock_vscode_configs_repo
     ):
@@ -292,7 +381,7 @@ class TestApplyCommand:
 
         # Mock currently installed extensions
         mock_get_installed.return_value = ["existing.extension"]
-        mock_install.return_value = True
+        mock_install.return_value = {"new.extension": True}
 
         apply_cmd = ApplyCommand(config_manager)
 
@@ -302,10 +391,10 @@ class TestApplyCommand:
         )
 
         # Should install the new extension
-        mock_install.assert_called_once_with(app_details, "new.extension")
+        mock_install.assert_called_once_with(app_details, ["new.extension"])
 
     @patch("vsc_sync.commands.apply_cmd.AppManager.get_installed_extensions")
-    @patch("vsc_sync.commands.apply_cmd.AppManager.uninstall_extension")
+    @patch("vsc_sync.commands.apply_cmd.AppManager.uninstall_extensions_batch")
     def test_apply_extensions_prune(
         self, mock_uninstall, mock_get_installed, temp_dir, mock_vscode_configs_repo
     ):
@@ -329,7 +418,7 @@ class TestApplyCommand:
 
         # Mock currently installed extensions
         mock_get_installed.return_value = ["wanted.extension", "unwanted.extension"]
-        mock_uninstall.return_value = True
+        mock_uninstall.return_value = {"unwanted.extension": True}
 
         apply_cmd = ApplyCommand(config_manager)
 
@@ -339,7 +428,89 @@ class TestApplyCommand:
         )
 
         # Should uninstall the unwanted extension
-        mock_uninstall.assert_called_once_with(app_details, "unwanted.extension")
+        mock_uninstall.assert_called_once_with(app_details, ["unwanted.extension"])
+
+    @patch("vsc_sync.commands.apply_cmd.AppManager.get_installed_extensions")
+    def test_installed_extensions_listed_once(
+        self, mock_get_installed, temp_dir, mock_vscode_configs_repo
+    ):
+        """Dry-run and apply share one extension listing until something changes."""
+        config_manager = ConfigManager(temp_dir / "config.json")
+        app_config_dir = temp_dir / "vscode_config"
+        app_config_dir.mkdir()
+        app_details = AppDetails(
+            alias="test-vscode",
+            config_path=app_config_dir,
+            executable_path=Path("/usr/bin/code"),
+        )
+        config_manager.save_config(
+            VscSyncConfig(
+                vscode_configs_path=mock_vscode_configs_repo,
+                managed_apps={"test-vscode": app_details},
+            )
+        )
+        mock_get_installed.return_value = ["wanted.extension"]
+
+        apply_cmd = ApplyCommand(config_manager)
+        apply_cmd._show_extensions_diff(app_details, ["wanted.extension"], False)
+        apply_cmd._apply_extensions(
+            app_details, ["wanted.extension"], prune_extensions=False
+        )
+
+        mock_get_installed.assert_called_once_with(app_details)
+
+    @patch("vsc_sync.commands.apply_cmd.AppManager.get_installed_extensions")
+    def test_dry_run_prefetches_extensions_once(
+        self, mock_get_installed, temp_dir, mock_vscode_configs_repo
+    ):
+        """The listing started alongside the merge is the one the diff uses."""
+        config_manager = ConfigManager(temp_dir / "config.json")
+        app_config_dir = temp_dir / "vscode_config"
+        app_config_dir.mkdir()
+        app_details = AppDetails(
+            alias="test-vscode",
+            config_path=app_config_dir,
+            executable_path=Path("/usr/bin/code"),
+        )
+        config_manager.save_config(
+            VscSyncConfig(
+                vscode_configs_path=mock_vscode_configs_repo,
+                managed_apps={"test-vscode": app_details},
+            )
+        )
+        mock_get_installed.return_value = []
+
+        ApplyCommand(config_manager).run("test-vscode", dry_run=True)
+
+        mock_get_installed.assert_called_once()
+
+    @patch("vsc_sync.commands.apply_cmd.AppManager.get_installed_extensions")
+    def test_no_extension_listing_without_extensions(
+        self, mock_get_installed, temp_dir, mock_vscode_configs_repo
+    ):
+        """Installed extensions are not listed when no layer names any."""
+        config_manager = ConfigManager(temp_dir / "config.json")
+        app_config_dir = temp_dir / "vscode_config"
+        app_config_dir.mkdir()
+        app_details = AppDetails(
+            alias="test-vscode",
+            config_path=app_config_dir,
+            executable_path=Path("/usr/bin/code"),
+        )
+        config_manager.save_config(
+            VscSyncConfig(
+                vscode_configs_path=mock_vscode_configs_repo,
+                managed_apps={"test-vscode": app_details},
+            )
+        )
+
+        apply_cmd = ApplyCommand(config_manager)
+        with patch.object(
+            apply_cmd.layer_manager, "merge_layers", return_value=MergeResult()
+        ):
+            apply_cmd.run("test-vscode", dry_run=True)
+
+        mock_get_installed.assert_not_called()
 
     def test_show_setting_changes(self, temp_dir, mock_vscode_configs_repo):
         """Test showing setting changes."""
@@ -367,6 +538,67 @@ class TestApplyCommand:
         # This should not raise an exception
         apply_cmd._show_setting_changes(current, new)
 
+    def test_flatten_dict(self):
+        """Nested settings flatten to dotted keys; empty sub-dicts vanish."""
+        nested = {"editor": {"font": {"size": 12}, "tabSize": 2}, "empty": {}, "a": 1}
+
+        assert flatten_dict(nested) == {
+            "editor.font.size": 12,
+            "editor.tabSize": 2,
+            "a": 1,
+        }
+
+    def test_diff_settings(self):
+        """Changes are reported per leaf; equal subtrees are left out."""
+        current = {
+            "editor": {"fontSize": 12, "tabSize": 2},
+            "terminal": {"fontSize": 10},
+            "old": "value",
+            "files": "flat",
+        }
+        new = {
+            "editor": {"fontSize": 14, "tabSize": 2, "wordWrap": "on"},
+            "terminal": {"fontSize": 10},
+            "files": {"exclude": {"**/.git": True}},
+        }
+
+        added, modified, removed = diff_settings(current, new)
+
+        assert added == {"editor.wordWrap": "on", "files.exclude.**/.git": True}
+        assert modified == {"editor.fontSize": (12, 14)}
+        assert removed == {"old": "value", "files": "flat"}
+
+    def test_files_equal(self, temp_dir):
+        """Files compare equal only when every byte matches."""
+        a, b, c, d = (temp_dir / n for n in "abcd")
+        a.write_bytes(b"x" * 70000)
+        b.write_bytes(b"x" * 70000)
+        c.write_bytes(b"x" * 69999 + b"y")
+        d.write_bytes(b"x")
+
+        assert _files_equal(a, b)
+        assert not _files_equal(a, c)
+        assert not _files_equal(a, d)
+
+    def test_read_cached_reads_once(self, temp_dir, mock_vscode_configs_repo):
+        """Cached reads survive file changes until the directory is invalidated."""
+        config_manager = ConfigManager(temp_dir / "config.json")
+        config_manager.save_config(
+            VscSyncConfig(vscode_configs_path=mock_vscode_configs_repo, managed_apps={})
+        )
+        apply_cmd = ApplyCommand(config_manager)
+
+        app_dir = temp_dir / "app"
+        app_dir.mkdir()
+        target = app_dir / "keybindings.json"
+
+        assert apply_cmd._read_cached(target) is None
+        target.write_bytes(b"[]")
+        assert apply_cmd._read_cached(target) is None
+
+        apply_cmd._invalidate_file_cache(app_dir)
+        assert apply_cmd._read_cached(target) == b"[]"
+
     @patch("vsc_sync.commands.apply_cmd.Confirm.ask")
     def test_confirm_apply_yes(self, mock_confirm, temp_dir, mock_vscode_configs_repo):
         """Test confirming apply with yes."""
@@ -10,7 +10,7 @@ from rich.console import Console
 
 from vsc_sync.commands.init_cmd import InitCommand
 from vsc_sync.config import ConfigManager
-from vsc_sync.exceptions import VscSyncError
+from vsc_sync.exceptions import GitOperationError, VscSyncError
 from vsc_sync.models import AppDetails, VscSyncConfig
 
 
@@ -183,6 +183,52 @@ class TestInitCommand:
             == app_config_dir.resolve()
         )
 
+    @patch("vsc_sync.commands.init_cmd.Confirm.ask")
+    @patch("vsc_sync.commands.init_cmd.Prompt.ask")
+    @patch("vsc_sync.commands.init_cmd.AppManager.auto_discover_apps")
+    def test_run_non_interactive(
+        self,
+        mock_discover,
+        mock_prompt,
+        mock_confirm,
+        temp_dir,
+        mock_vscode_configs_repo,
+    ):
+        """Non-interactive init never prompts and keeps apps with configs."""
+        config_manager = ConfigManager(temp_dir / "config.json")
+        (temp_dir / "vscode_config").mkdir()
+        mock_discover.return_value = {
+            "vscode": AppDetails(
+                alias="vscode", config_path=temp_dir / "vscode_config"
+            ),
+            "cursor": AppDetails(alias="cursor", config_path=temp_dir / "missing"),
+        }
+
+        InitCommand(config_manager, non_interactive=True).run(
+            repo=str(mock_vscode_configs_repo)
+        )
+
+        mock_prompt.assert_not_called()
+        mock_confirm.assert_not_called()
+        assert list(config_manager.load_config().managed_apps) == ["vscode"]
+
+    @patch("vsc_sync.commands.init_cmd.Confirm.ask")
+    def test_run_non_interactive_keeps_existing_config(
+        self, mock_confirm, temp_dir, mock_vscode_configs_repo
+    ):
+        """Non-interactive init refuses to overwrite an existing configuration."""
+        config_file = temp_dir / "config.json"
+        config_file.write_text('{"existing": true}')
+        config_manager = ConfigManager(config_file)
+        assert config_manager.is_initialized()
+
+        InitCommand(config_manager, non_interactive=True).run(
+            repo=str(mock_vscode_configs_repo)
+        )
+
+        mock_confirm.assert_not_called()
+        assert config_file.read_text() == '{"existing": true}'
+
     def test_setup_config_path_default(self, temp_dir):
         """Test setting up config path with default."""
         config_manager = ConfigManager(temp_dir / "config.json")
@@ -230,6 +276,18 @@ class TestInitCommand:
         with pytest.raises(VscSyncError, match="Path is not a directory"):
             init_cmd._verify_local_repo(str(file_path))
 
+    @patch("vsc_sync.commands.init_cmd.Confirm.ask")
+    def test_verify_local_repo_incomplete_non_interactive(self, mock_confirm, temp_dir):
+        """Non-interactive init takes the prompt's default and refuses."""
+        init_cmd = InitCommand(
+            ConfigManager(temp_dir / "config.json"), non_interactive=True
+        )
+        (temp_dir / "incomplete-repo").mkdir()
+
+        with pytest.raises(VscSyncError, match="Repository verification failed"):
+            init_cmd._verify_local_repo(str(temp_dir / "incomplete-repo"))
+        mock_confirm.assert_not_called()
+
     @patch("vsc_sync.commands.init_cmd.Confirm.ask")
     def test_verify_local_repo_incomplete_structure(self, mock_confirm, temp_dir):
         """Test verifying a repository with incomplete structure."""
@@ -317,6 +375,48 @@ class TestInitCommand:
         actual_call_path = mock_clone.call_args[0][1].resolve()
         assert actual_call_path == expected_path
         assert path.resolve() == expected_path
+        # File contents are fetched on demand.
+        assert mock_clone.call_args.kwargs == {"filter_spec": "blob:none"}
+
+    @patch("vsc_sync.commands.init_cmd.GitOperations.clone_repository")
+    @patch("vsc_sync.commands.init_cmd.GitOperations.is_git_available")
+    @patch("vsc_sync.commands.init_cmd.Prompt.ask")
+    def test_clone_repository_falls_back_to_shallow(
+        self, mock_prompt, mock_git_available, mock_clone, temp_dir
+    ):
+        """A failed partial clone is retried as a shallow clone."""
+        init_cmd = InitCommand(ConfigManager(temp_dir / "config.json"))
+        mock_git_available.return_value = True
+        mock_prompt.return_value = str(temp_dir / "cloned-repo")
+        mock_clone.side_effect = [GitOperationError("filter not supported"), None]
+
+        init_cmd._clone_repository("https://github.com/user/vscode-configs.git")
+
+        assert mock_clone.call_count == 2
+        assert mock_clone.call_args.kwargs == {"depth": 1, "single_branch": True}
+
+    @patch("vsc_sync.commands.init_cmd.GitOperations.clone_repository")
+    @patch("vsc_sync.commands.init_cmd.GitOperations.is_git_available")
+    @patch("vsc_sync.commands.init_cmd.Prompt.ask")
+    @patch("vsc_sync.commands.init_cmd.Confirm.ask")
+    def test_clone_repository_replaces_existing(
+        self, mock_confirm, mock_prompt, mock_git_available, mock_clone, temp_dir
+    ):
+        """An existing clone directory is removed before cloning fresh."""
+        existing = temp_dir / "cloned-repo"
+        (existing / ".git" / "objects" / "ab").mkdir(parents=True)
+        (existing / ".git" / "objects" / "ab" / "cdef").write_text("x")
+        (existing / "base").mkdir()
+
+        init_cmd = InitCommand(ConfigManager(temp_dir / "config.json"))
+        mock_git_available.return_value = True
+        mock_prompt.return_value = str(existing)
+        mock_confirm.return_value = True
+
+        init_cmd._clone_repository("https://github.com/user/vscode-configs.git")
+
+        assert not existing.exists()
+        mock_clone.assert_called_once()
 
     @patch("vsc_sync.commands.init_cmd.GitOperations.is_git_available")
     def test_clone_repository_no_git(self, mock_git_available, temp_dir):
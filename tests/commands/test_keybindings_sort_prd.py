@@ -73,3 +73,57 @@ def test_prd_sorting(tmp_path):
 
     assert sorted_data[3]["key"] == "ctrl+c"
     assert sorted_data[3].get("when")  # has when clause
+
+
+def test_resort_of_unchanged_file_is_skipped(tmp_path, capsys):
+    """A second sort of an untouched file does not parse or rewrite it."""
+
+    config_manager, app = _setup_app(tmp_path)
+    kb_file = app.config_path / "keybindings.json"
+    kb_file.write_text(json.dumps([{"key": "b", "command": "x"}, {"key": "a", "command": "y"}]))
+
+    cmd = EditCommand(config_manager)
+    cmd._sort_keybindings(kb_file, yes=True)
+    first = kb_file.stat().st_mtime_ns
+
+    cmd._sort_keybindings(kb_file, yes=True)
+
+    assert "already sorted" in capsys.readouterr().out
+    assert kb_file.stat().st_mtime_ns == first
+
+    # Editing the file invalidates the marker.
+    kb_file.write_text(json.dumps([{"key": "c", "command": "z"}, {"key": "a", "command": "y"}]))
+    cmd._sort_keybindings(kb_file, yes=True)
+    assert [b["key"] for b in json.loads(kb_file.read_text())] == ["a", "c"]
+
+
+def test_sorted_file_is_not_rewritten(tmp_path, capsys):
+    """Bindings already in order leave the file byte-for-byte unchanged."""
+
+    config_manager, app = _setup_app(tmp_path)
+    kb_file = app.config_path / "keybindings.json"
+    content = '// mine\n[{"key": "a", "command": "x"}, {"key": "b", "command": "y"}]'
+    kb_file.write_text(content)
+
+    EditCommand(config_manager)._sort_keybindings(kb_file, yes=True)
+
+    assert "no changes" in capsys.readouterr().out
+    assert kb_file.read_text() == content
+
+
+def test_sort_round_trips_values_fast_json_rejects(tmp_path):
+    """Huge integers fall back to the stdlib parser and encoder intact."""
+
+    config_manager, app = _setup_app(tmp_path)
+    kb_file = app.config_path / "keybindings.json"
+    big = 2**70
+    kb_file.write_text(
+        json.dumps([{"key": "b", "command": "x"}, {"key": "a", "command": "y", "args": big}])
+    )
+
+    EditCommand(config_manager)._sort_keybindings(kb_file, yes=True)
+
+    assert json.loads(kb_file.read_text()) == [
+        {"key": "a", "command": "y", "args": big},
+        {"key": "b", "command": "x"},
+    ]
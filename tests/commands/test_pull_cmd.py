@@ -48,6 +48,14 @@ class TestPullCommand:
         """Create a PullCommand instance for testing."""
         return PullCommand(mock_config_manager)
 
+    def test_config_loaded_lazily(self, mock_config_manager):
+        """Test that the configuration is loaded once, on first use."""
+        pull_command = PullCommand(mock_config_manager)
+        mock_config_manager.load_config.assert_not_called()
+
+        assert pull_command.config is pull_command.config
+        mock_config_manager.load_config.assert_called_once()
+
     def test_validate_app_success(self, pull_command, temp_dirs):
         """Test successful app validation."""
         # Create the app config directory
@@ -157,6 +165,40 @@ class TestPullCommand:
         target_content = json.loads(target_file.read_text())
         assert target_content == source_settings
 
+    def test_pull_settings_invalidates_stat_cache(self, pull_command, temp_dirs):
+        """Test that a pulled file is no longer reported as missing."""
+        source_file = temp_dirs["app_config"] / "settings.json"
+        source_file.write_text('{"editor.fontSize": 14}')
+        target_dir = temp_dirs["vscode_configs"] / "base"
+        target_dir.mkdir(parents=True)
+        target_file = target_dir / "settings.json"
+
+        assert not pull_command._exists(target_file)
+        with patch("vsc_sync.commands.pull_cmd.os.stat") as mock_stat:
+            assert not pull_command._exists(target_file)
+            mock_stat.assert_not_called()
+
+        pull_command._pull_settings(
+            AppDetails(alias="test-app", config_path=temp_dirs["app_config"]),
+            target_dir,
+            overwrite=True,
+        )
+
+        assert pull_command._exists(target_file)
+
+    def test_index_source_seeds_stat_cache(self, pull_command, temp_dirs):
+        """Test that one directory scan answers the source existence checks."""
+        config_dir = temp_dirs["app_config"]
+        (config_dir / "settings.json").write_text("{}")
+
+        pull_command._index_source(config_dir)
+
+        with patch("vsc_sync.commands.pull_cmd.os.stat") as mock_stat:
+            assert pull_command._exists(config_dir / "settings.json")
+            assert not pull_command._exists(config_dir / "keybindings.json")
+            assert not pull_command._is_dir(config_dir / "snippets")
+            mock_stat.assert_not_called()
+
     def test_pull_settings_source_not_exists(self, pull_command, temp_dirs, capsys):
         """Test pulling settings when source doesn't exist."""
         target_dir = temp_dirs["vscode_configs"] / "base"
@@ -209,6 +251,21 @@ class TestPullCommand:
         }
         assert target_content == expected_content
 
+    @patch("vsc_sync.commands.pull_cmd.AppManager.get_installed_extensions")
+    def test_extensions_listed_once_per_run(
+        self, mock_get_extensions, pull_command, app_details, temp_dirs
+    ):
+        """Test that preview and pull share one extension listing."""
+        mock_get_extensions.return_value = ["ms-python.python"]
+        target_dir = temp_dirs["vscode_configs"] / "base"
+        target_dir.mkdir(parents=True)
+
+        with patch("vsc_sync.commands.pull_cmd.console"):
+            pull_command._show_extensions_pull_preview(app_details, target_dir)
+            pull_command._pull_extensions(app_details, target_dir, overwrite=True)
+
+        mock_get_extensions.assert_called_once_with(app_details)
+
     def test_pull_extensions_no_executable(self, pull_command, temp_dirs, capsys):
         """Test pulling extensions when no executable is configured."""
         target_dir = temp_dirs["vscode_configs"] / "base"
@@ -320,6 +377,18 @@ class TestPullCommand:
         assert target_file.exists()
         assert target_file.read_text() == snippet_content
 
+    def test_list_snippets(self, pull_command, temp_dirs):
+        """Test that only snippet files are listed and the scan is reused."""
+        snippets_dir = temp_dirs["app_config"] / "snippets"
+        snippets_dir.mkdir()
+        (snippets_dir / "python.code-snippets").write_text("{}")
+        (snippets_dir / "notes.txt").write_text("")
+        (snippets_dir / "dir.code-snippets").mkdir()
+
+        first = pull_command._list_snippets(snippets_dir)
+        assert first == [snippets_dir / "python.code-snippets"]
+        assert pull_command._list_snippets(snippets_dir) is first
+
     @pytest.mark.parametrize("overwrite", [True, False])
     @patch("vsc_sync.commands.pull_cmd.Confirm.ask")
     def test_pull_settings_overwrite_behavior(
@@ -537,6 +606,85 @@ class TestPullCommand:
                 kwargs.get("use_pager") is False
             )  # no_pager=True means use_pager=False
 
+    def test_settings_preview_truncates_long_content(self, pull_command, temp_dirs):
+        """Test that a long settings.json preview shows only its head."""
+        settings = {f"setting.{i}": "x" * 20 for i in range(50)}
+        source_file = temp_dirs["app_config"] / "settings.json"
+        source_file.write_text(json.dumps(settings, indent=2))
+        base_dir = temp_dirs["vscode_configs"] / "base"
+        base_dir.mkdir(parents=True)
+
+        with patch.object(
+            pull_command, "_prompt_for_full_content", return_value="no"
+        ), patch.object(pull_command, "_show_content_with_pager") as mock_pager, patch(
+            "rich.syntax.Syntax"
+        ) as mock_syntax:
+            pull_command._show_settings_pull_preview(
+                AppDetails(alias="test-app", config_path=temp_dirs["app_config"]),
+                base_dir,
+            )
+
+        mock_pager.assert_not_called()
+        shown = mock_syntax.call_args[0][0]
+        assert shown == source_file.read_text()[:500] + "..."
+
+    def test_keybindings_preview_sized_from_stat(
+        self, pull_command, temp_dirs, app_details
+    ):
+        """Test that a declined keybindings preview never reads the file."""
+        source_file = temp_dirs["app_config"] / "keybindings.json"
+        source_file.write_text(json.dumps([{"key": "ctrl+k"}] * 20))
+        base_dir = temp_dirs["vscode_configs"] / "base"
+        base_dir.mkdir(parents=True)
+
+        with patch.object(
+            pull_command, "_prompt_for_full_content", return_value="no"
+        ) as mock_prompt, patch.object(Path, "read_bytes") as mock_read:
+            pull_command._show_keybindings_pull_preview(app_details, base_dir)
+
+        mock_prompt.assert_called_once()
+        mock_read.assert_not_called()
+
+    def test_snippets_full_preview_combines_files(
+        self, pull_command, temp_dirs, app_details
+    ):
+        """Test that every snippet file appears once in the full preview."""
+        snippets_dir = temp_dirs["app_config"] / "snippets"
+        snippets_dir.mkdir()
+        for name in ("go", "python", "rust"):
+            (snippets_dir / f"{name}.code-snippets").write_text(f'{{"{name}": {{}}}}')
+        base_dir = temp_dirs["vscode_configs"] / "base"
+        base_dir.mkdir(parents=True)
+
+        with patch.object(pull_command, "_show_content_with_pager") as mock_pager:
+            pull_command._show_snippets_pull_preview(
+                app_details, base_dir, full_preview=True, no_pager=True
+            )
+
+        combined = mock_pager.call_args[0][0]
+        for name in ("go", "python", "rust"):
+            assert combined.count(f"=== {name}.code-snippets ===\n") == 1
+            assert f'{{"{name}": {{}}}}' in combined
+
+    @pytest.mark.parametrize(
+        "target_text",
+        ['{"editor.fontSize": 14}', '{\n  "editor.fontSize": 14\n}'],
+    )
+    def test_settings_preview_identical(
+        self, pull_command, temp_dirs, app_details, capsys, target_text
+    ):
+        """Test that identical settings are detected with or without parsing."""
+        (temp_dirs["app_config"] / "settings.json").write_text(
+            '{"editor.fontSize": 14}'
+        )
+        base_dir = temp_dirs["vscode_configs"] / "base"
+        base_dir.mkdir(parents=True)
+        (base_dir / "settings.json").write_text(target_text)
+
+        pull_command._show_settings_pull_preview(app_details, base_dir)
+
+        assert "settings are identical" in capsys.readouterr().out
+
     def test_show_content_with_pager_no_pager(self, pull_command):
         """Test content display without pager."""
         test_content = '{"test": "content"}'
@@ -550,34 +698,36 @@ class TestPullCommand:
             assert mock_console.print.call_count >= 2
 
     @patch("vsc_sync.commands.pull_cmd.subprocess.run")
-    @patch("vsc_sync.commands.pull_cmd.tempfile.NamedTemporaryFile")
-    def test_show_content_with_pager_with_pager(
-        self, mock_tempfile, mock_subprocess, pull_command
-    ):
+    def test_show_content_with_pager_with_pager(self, mock_subprocess, pull_command):
         """Test content display with pager."""
         test_content = '{"test": "content"}'
 
-        # Mock tempfile
-        mock_file = Mock()
-        mock_file.name = "/tmp/test_file.json"
-        mock_tempfile.return_value.__enter__.return_value = mock_file
-
         # Mock subprocess success
         mock_subprocess.return_value = None
 
-        with patch("vsc_sync.commands.pull_cmd.console") as mock_console, patch(
-            "vsc_sync.commands.pull_cmd.os.unlink"
+        with patch("vsc_sync.commands.pull_cmd.console"), patch.dict(
+            "os.environ", {"PAGER": "less"}
         ):
-
             pull_command._show_content_with_pager(
                 test_content, "Test Content", use_pager=True
             )
 
-            # Should call subprocess with less command
+            # Should pipe the content to less on stdin
             mock_subprocess.assert_called_once()
             cmd_args = mock_subprocess.call_args[0][0]
             assert cmd_args[0] == "less"
-            assert "/tmp/test_file.json" in cmd_args
+            assert mock_subprocess.call_args.kwargs["input"] == test_content.encode()
+
+    @patch("vsc_sync.commands.pull_cmd.subprocess.run", side_effect=FileNotFoundError)
+    def test_show_content_with_pager_missing_pager(self, mock_subprocess, pull_command):
+        """Test falling back to direct output when the pager is missing."""
+        with patch("vsc_sync.commands.pull_cmd.console") as mock_console:
+            pull_command._show_content_with_pager(
+                '{"test": "content"}', "Test Content", use_pager=True
+            )
+
+        printed = " ".join(str(c.args[0]) for c in mock_console.print.call_args_list)
+        assert "Pager not available" in printed
 
     @patch("typer.prompt")
     def test_prompt_for_full_content(self, mock_prompt, pull_command):
@@ -66,3 +66,22 @@ def test_settings_sort_and_dedup(tmp_path):
     # Duplicate removed – key 'a.first' occurs only once and value is 'true'
     assert keys.count("a.first") == 1
     assert ordered["a.first"] is True
+
+
+def test_settings_sort_keeps_slashes_inside_strings(tmp_path):
+    cm, app = _prepare(tmp_path)
+
+    file_path = app.config_path / "settings.json"
+    file_path.write_text(
+        "{\n"
+        "  \"http.proxy\": \"http://proxy:8080\",  // trailing comment\n"
+        "  \"a.glob\": \"/*.tmp\"\n"
+        "}\n"
+    )
+
+    EditCommand(cm)._sort_settings(file_path, yes=True)
+
+    assert json.loads(file_path.read_text()) == {
+        "a.glob": "/*.tmp",
+        "http.proxy": "http://proxy:8080",
+    }
@@ -9,6 +9,14 @@ import pytest
 from vsc_sync.models import AppDetails, VscSyncConfig
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path_factory, monkeypatch):
+    """Keep vsc-sync's on-disk caches out of the real ``~/.cache``."""
+    cache_home = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
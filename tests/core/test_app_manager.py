@@ -0,0 +1,108 @@
+"""Tests for application discovery and management."""
+
+from pathlib import Path
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from vsc_sync.core import app_manager
+from vsc_sync.core.app_manager import AppManager
+from vsc_sync.models import AppDetails
+
+
+@pytest.fixture
+def isolated_discovery_cache(temp_dir, monkeypatch):
+    """Point the discovery cache at a temp dir and clear the in-process memo."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir))
+    app_manager._cached_discovery.cache_clear()
+    yield temp_dir / "vsc-sync" / "discover.json"
+    app_manager._cached_discovery.cache_clear()
+
+
+class TestAutoDiscoveryCache:
+    """Tests for the auto-discovery caches."""
+
+    def test_discovery_is_persisted_and_reused(self, isolated_discovery_cache):
+        """A fresh on-disk result is reused by a new process."""
+        apps = {
+            "vscode": AppDetails(alias="vscode", config_path=Path("/tmp/Code/User"))
+        }
+
+        with patch.object(AppManager, "probe_apps", return_value=apps) as probe:
+            first = AppManager.auto_discover_apps()
+            # Simulate a new process: only the disk cache survives.
+            app_manager._cached_discovery.cache_clear()
+            second = AppManager.auto_discover_apps()
+
+        assert probe.call_count == 1
+        assert isolated_discovery_cache.exists()
+        assert first == second == apps
+
+    def test_expired_cache_is_ignored(self, isolated_discovery_cache, monkeypatch):
+        """Results older than the TTL trigger a new probe."""
+        with patch.object(AppManager, "probe_apps", return_value={}) as probe:
+            AppManager.auto_discover_apps()
+            app_manager._cached_discovery.cache_clear()
+            monkeypatch.setattr(app_manager, "DISCOVERY_CACHE_TTL", -1)
+            AppManager.auto_discover_apps()
+
+        assert probe.call_count == 2
+
+    def test_no_cache_probes_and_refreshes(self, isolated_discovery_cache):
+        """use_cache=False skips both caches but rewrites the disk cache."""
+        apps = {
+            "cursor": AppDetails(alias="cursor", config_path=Path("/tmp/Cursor/User"))
+        }
+
+        with patch.object(AppManager, "probe_apps", return_value={}) as probe:
+            AppManager.auto_discover_apps()
+            probe.return_value = apps
+            assert AppManager.auto_discover_apps(use_cache=False) == apps
+            app_manager._cached_discovery.cache_clear()
+            assert AppManager.auto_discover_apps() == apps
+
+        assert probe.call_count == 2
+
+
+class TestExtensionBatch:
+    """Tests for installing extensions with one CLI invocation."""
+
+    def _app(self):
+        return AppDetails(
+            alias="vscode",
+            config_path=Path("/tmp/Code/User"),
+            executable_path=Path("/usr/bin/code"),
+        )
+
+    def test_single_invocation_for_all_extensions(self):
+        """Every extension is passed to one process."""
+        done = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+        with patch(
+            "vsc_sync.core.app_manager.subprocess.run", return_value=done
+        ) as run:
+            result = AppManager.install_extensions_batch(
+                self._app(), ["a.one", "b.two"]
+            )
+
+        assert result == {"a.one": True, "b.two": True}
+        run.assert_called_once()
+        assert run.call_args[0][0] == [
+            "/usr/bin/code",
+            "--install-extension",
+            "a.one",
+            "--install-extension",
+            "b.two",
+        ]
+
+    def test_partial_failure_checks_installed_list(self):
+        """On a non-zero exit the installed list decides each result."""
+        failed = subprocess.CompletedProcess([], 1, stdout="", stderr="boom")
+        with patch(
+            "vsc_sync.core.app_manager.subprocess.run", return_value=failed
+        ), patch.object(AppManager, "get_installed_extensions", return_value=["A.One"]):
+            result = AppManager.install_extensions_batch(
+                self._app(), ["a.one", "b.two"]
+            )
+
+        assert result == {"a.one": True, "b.two": False}
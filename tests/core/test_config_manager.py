@@ -61,6 +61,20 @@ class TestLayerConfigManager:
         assert not manager.layer_exists("app", "nonexistent")
         assert not manager.layer_exists("invalid")
 
+    def test_list_layers(self, mock_vscode_configs_repo):
+        """Test listing layers, with and without a name filter."""
+        manager = LayerConfigManager(mock_vscode_configs_repo)
+        (mock_vscode_configs_repo / "stacks" / "web").mkdir()
+
+        all_stacks = [layer.layer_name for layer in manager.list_layers("stack")]
+        assert all_stacks == ["python", "web"]
+
+        named = list(manager.list_layers("stack", ["web", "missing"]))
+        assert [layer.layer_name for layer in named] == ["web"]
+        assert named[0].path == mock_vscode_configs_repo / "stacks" / "web"
+
+        assert list(manager.list_layers("project")) == []
+
     def test_load_json_file_existing(self, mock_vscode_configs_repo):
         """Test loading existing JSON file."""
         manager = LayerConfigManager(mock_vscode_configs_repo)
@@ -0,0 +1,224 @@
+"""Tests for file operation helpers."""
+
+import os
+import stat
+
+import pytest
+
+from vsc_sync.core.file_ops import FileOperations
+
+
+def test_parallel_rmtree_removes_nested_tree(temp_dir):
+    """Files, nested directories and symlinks are all removed."""
+    root = temp_dir / "extensions"
+    nested = root / "ext" / "node_modules" / "pkg"
+    nested.mkdir(parents=True)
+    for i in range(20):
+        (nested / f"f{i}.js").write_text("x")
+    (root / "ext" / "package.json").write_text("{}")
+    outside = temp_dir / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("keep")
+    os.symlink(outside, root / "link")
+
+    FileOperations.parallel_rmtree(root)
+
+    assert not root.exists()
+    assert (outside / "keep.txt").exists()
+
+
+def test_parallel_rmtree_refuses_symlinked_root(temp_dir):
+    """A symlinked root is refused and the directory it points to survives."""
+    real = temp_dir / "real"
+    (real / "sub").mkdir(parents=True)
+    (real / "sub" / "keep.txt").write_text("keep")
+    link = temp_dir / "link"
+    os.symlink(real, link)
+
+    with pytest.raises(OSError):
+        FileOperations.parallel_rmtree(link)
+
+    assert link.is_symlink()
+    assert (real / "sub" / "keep.txt").read_text() == "keep"
+
+
+def test_copy_file_replaces_destination(temp_dir):
+    """The destination ends up with the source bytes and no temp file remains."""
+    source = temp_dir / "source.json"
+    source.write_bytes(b'{"a": 1}' * 10000)
+    destination = temp_dir / "out" / "keybindings.json"
+    destination.parent.mkdir()
+    destination.write_text("old")
+
+    FileOperations.copy_file(source, destination)
+
+    assert destination.read_bytes() == source.read_bytes()
+    assert sorted(p.name for p in destination.parent.iterdir()) == ["keybindings.json"]
+
+
+def test_copy_file_writes_through_symlink(temp_dir):
+    """A symlinked destination keeps its link and the target is updated."""
+    source = temp_dir / "source.json"
+    source.write_text("new")
+    real = temp_dir / "real.json"
+    real.write_text("old")
+    link = temp_dir / "link.json"
+    os.symlink(real, link)
+
+    FileOperations.copy_file(source, link)
+
+    assert link.is_symlink()
+    assert real.read_text() == "new"
+
+
+def test_copy_file_keeps_hard_links(temp_dir):
+    """A hard-linked destination is overwritten in place, not replaced."""
+    source = temp_dir / "keybindings.json"
+    source.write_text("[]")
+    destination = temp_dir / "out.json"
+    destination.write_text("old")
+    other = temp_dir / "other.json"
+    os.link(destination, other)
+
+    FileOperations.copy_file(source, destination)
+
+    assert other.read_text() == "[]"
+    assert os.path.samefile(destination, other)
+
+
+def test_copy_file_uses_unique_temp_names(temp_dir, monkeypatch):
+    """The temporary file is not a fixed sibling that writers could share."""
+    from vsc_sync.core import file_ops
+
+    seen = []
+    real_copy = file_ops._copy_contents
+
+    def spy(source, destination):
+        seen.append(destination)
+        real_copy(source, destination)
+
+    monkeypatch.setattr(file_ops, "_copy_contents", spy)
+    source = temp_dir / "tasks.json"
+    source.write_text("{}")
+    destination = temp_dir / "out.json"
+
+    FileOperations.copy_file(source, destination)
+    FileOperations.copy_file(source, destination)
+
+    assert seen[0] != seen[1]
+    assert all(p.parent == temp_dir for p in seen)
+    assert sorted(p.name for p in temp_dir.iterdir()) == ["out.json", "tasks.json"]
+
+
+def test_copy_file_falls_back_when_kernel_copy_fails(temp_dir, monkeypatch):
+    """A failing in-kernel copy leaves no partial data behind."""
+    from vsc_sync.core import file_ops
+
+    def broken(src, dst, count):
+        os.write(dst, b"partial")
+        raise OSError("not supported")
+
+    monkeypatch.setattr(file_ops, "_KERNEL_COPIES", [broken])
+    source = temp_dir / "tasks.json"
+    source.write_text('{"version": "2.0.0"}')
+    destination = temp_dir / "out.json"
+
+    FileOperations.copy_file(source, destination)
+
+    assert destination.read_text() == '{"version": "2.0.0"}'
+
+
+def test_copy_file_without_metadata(temp_dir):
+    """Only the contents are copied when metadata is not preserved."""
+    source = temp_dir / "settings.json"
+    source.write_text("{}")
+    os.utime(source, (0, 0))
+    destination = temp_dir / "out.json"
+
+    FileOperations.copy_file(source, destination, preserve_metadata=False)
+
+    assert destination.read_text() == "{}"
+    assert destination.stat().st_mtime != 0
+
+
+def test_copy_file_without_metadata_keeps_mode(temp_dir):
+    """Permission bits survive when metadata is not preserved."""
+    source = temp_dir / "settings.json"
+    source.write_text("{}")
+    os.chmod(source, 0o600)
+    new = temp_dir / "new.json"
+    existing = temp_dir / "existing.json"
+    existing.write_text("old")
+    os.chmod(existing, 0o640)
+
+    FileOperations.copy_file(source, new, preserve_metadata=False)
+    FileOperations.copy_file(source, existing, preserve_metadata=False)
+
+    assert stat.S_IMODE(new.stat().st_mode) == 0o600
+    assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+
+
+def test_copy_directory_contents(temp_dir):
+    """Files and subdirectories are copied; existing files can be kept."""
+    source = temp_dir / "snippets"
+    (source / "nested").mkdir(parents=True)
+    for name in ("a.code-snippets", "b.code-snippets", "python.json"):
+        (source / name).write_text(name)
+    (source / "nested" / "c.json").write_text("c")
+    destination = temp_dir / "out"
+    destination.mkdir()
+    (destination / "python.json").write_text("mine")
+
+    FileOperations.copy_directory_contents(
+        source, destination, overwrite_existing=False
+    )
+
+    assert (destination / "a.code-snippets").read_text() == "a.code-snippets"
+    assert (destination / "b.code-snippets").read_text() == "b.code-snippets"
+    assert (destination / "nested" / "c.json").read_text() == "c"
+    assert (destination / "python.json").read_text() == "mine"
+
+
+def test_atomic_write_bytes_keeps_mode_and_symlink(temp_dir):
+    """The real file behind a symlink is replaced and keeps its mode."""
+    real = temp_dir / "dotfiles" / "keybindings.json"
+    real.parent.mkdir()
+    real.write_text("[]")
+    os.chmod(real, 0o600)
+    link = temp_dir / "keybindings.json"
+    os.symlink(real, link)
+
+    FileOperations.atomic_write_bytes(link, b'[{"key": "a"}]\n')
+
+    assert link.is_symlink()
+    assert real.read_bytes() == b'[{"key": "a"}]\n'
+    assert real.stat().st_mode & 0o777 == 0o600
+    assert sorted(p.name for p in real.parent.iterdir()) == ["keybindings.json"]
+
+
+def test_atomic_write_bytes_keeps_hard_links_and_tmp_files(temp_dir):
+    """Hard links survive and a user's own ``.tmp`` sibling is untouched."""
+    target = temp_dir / "keybindings.json"
+    target.write_text("[]")
+    other = temp_dir / "dotfiles-keybindings.json"
+    os.link(target, other)
+    user_tmp = temp_dir / "keybindings.json.tmp"
+    user_tmp.write_text("mine")
+
+    FileOperations.atomic_write_bytes(target, b"[1]\n")
+
+    assert other.read_bytes() == b"[1]\n"
+    assert os.path.samefile(target, other)
+    assert user_tmp.read_text() == "mine"
+
+
+def test_atomic_write_bytes_new_file_uses_umask_mode(temp_dir):
+    """A new file gets the umask default, not the temp file's 0600."""
+    target = temp_dir / "new.json"
+    umask = os.umask(0)
+    os.umask(umask)
+
+    FileOperations.atomic_write_bytes(target, b"{}")
+
+    assert stat.S_IMODE(target.stat().st_mode) == 0o666 & ~umask
+    assert [p.name for p in temp_dir.iterdir()] == ["new.json"]
@@ -24,6 +24,26 @@ def test_cli_version():
     assert "vsc-sync version" in result.stdout
 
 
+def test_fast_version_exits_before_typer(monkeypatch, capsys):
+    """The console-script fast path answers --version on its own."""
+    from vsc_sync.__main__ import _fast_version
+
+    monkeypatch.setattr("sys.argv", ["vsc-sync", "-V"])
+    with pytest.raises(SystemExit) as exc_info:
+        _fast_version()
+
+    assert exc_info.value.code == 0
+    assert "vsc-sync version" in capsys.readouterr().out
+
+
+def test_fast_version_ignores_subcommand_args(monkeypatch):
+    """Arguments after the sub-command are left to the regular parser."""
+    from vsc_sync.__main__ import _fast_version
+
+    monkeypatch.setattr("sys.argv", ["vsc-sync", "status", "--version"])
+    _fast_version()
+
+
 def test_discover_command():
     """Test discover command."""
     result = runner.invoke(app, ["discover"])
@@ -31,7 +51,7 @@ def test_discover_command():
     assert "Discovering VSCode-like applications" in result.stdout
 
 
-@patch("vsc_sync.cli.ConfigManager")
+@patch("vsc_sync.config.ConfigManager")
 def test_list_apps_not_initialized(mock_config_manager_class):
     """Test list-apps command when not initialized."""
     # Mock the config manager to return uninitialized state
@@ -43,6 +63,19 @@ def test_list_apps_not_initialized(mock_config_manager_class):
     assert "not initialized" in result.stdout
 
 
+def test_list_apps_plain_output_when_piped(mock_config_manager):
+    """list-apps prints tab-separated rows when stdout is not a terminal."""
+    mock_config_manager.save_config()
+
+    with patch("vsc_sync.config.ConfigManager", return_value=mock_config_manager):
+        result = runner.invoke(app, ["list-apps"])
+
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert lines[0] == "Alias\tConfig Path"
+    assert lines[1].startswith("test-vscode\t")
+
+
 def test_init_command():
     """Test init command."""
     result = runner.invoke(app, ["init"])
@@ -60,7 +93,7 @@ class TestCLICommands:
         assert result.exit_code == 0
         assert "coming soon" in result.stdout.lower()
 
-    @patch("vsc_sync.cli.ConfigManager")
+    @patch("vsc_sync.config.ConfigManager")
     def test_apply_command(self, mock_config_manager_class):
         """Test apply command structure."""
         # Mock the config manager to return uninitialized state
@@ -71,7 +104,7 @@ class TestCLICommands:
         assert result.exit_code == 1
         assert "not initialized" in result.stdout
 
-    @patch("vsc_sync.cli.ConfigManager")
+    @patch("vsc_sync.config.ConfigManager")
     def test_status_command_basic(self, mock_config_manager_class):
         """Test status command basic functionality."""
         # Mock the config manager to return uninitialized state
@@ -0,0 +1,52 @@
+"""Tests for vsc-sync's own configuration manager."""
+
+import json
+import os
+
+from vsc_sync.config import ConfigManager
+from vsc_sync.models import VscSyncConfig
+
+
+class TestConfigManagerCache:
+    """Tests for the stat-keyed configuration cache."""
+
+    def test_unchanged_file_is_parsed_once(self, temp_dir):
+        """A second manager reuses the parsed config while the file is unchanged."""
+        config_file = temp_dir / "config.json"
+        ConfigManager(config_file).save_config(
+            VscSyncConfig(vscode_configs_path=temp_dir, managed_apps={})
+        )
+
+        first = ConfigManager(config_file).load_config()
+        second = ConfigManager(config_file).load_config()
+
+        assert first is second
+
+    def test_modified_file_is_reparsed(self, temp_dir):
+        """Changing the file on disk invalidates the cached config."""
+        config_file = temp_dir / "config.json"
+        ConfigManager(config_file).save_config(
+            VscSyncConfig(vscode_configs_path=temp_dir, managed_apps={})
+        )
+        first = ConfigManager(config_file).load_config()
+
+        other_path = temp_dir / "elsewhere"
+        config_file.write_text(
+            json.dumps({"vscode_configs_path": str(other_path), "managed_apps": {}})
+        )
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        second = ConfigManager(config_file).load_config()
+
+        assert second is not first
+        assert second.vscode_configs_path == other_path
+
+    def test_is_initialized_does_not_parse(self, temp_dir):
+        """is_initialized only checks that the file exists."""
+        config_file = temp_dir / "config.json"
+        manager = ConfigManager(config_file)
+        assert not manager.is_initialized()
+
+        config_file.write_text("not json")
+        assert manager.is_initialized()
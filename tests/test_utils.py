@@ -0,0 +1,95 @@
+"""Tests for general utility helpers."""
+
+from unittest.mock import MagicMock, patch
+
+from vsc_sync.utils import paths_exist, resolve_path, setup_logging
+
+
+def test_paths_exist_batches_siblings(temp_dir):
+    """Siblings and lone paths are both reported correctly."""
+    (temp_dir / "a").mkdir()
+    (temp_dir / "b.json").write_text("{}")
+    lone = temp_dir / "a" / "missing"
+
+    result = paths_exist([temp_dir / "a", temp_dir / "b.json", temp_dir / "c", lone])
+
+    assert result == {
+        temp_dir / "a": True,
+        temp_dir / "b.json": True,
+        temp_dir / "c": False,
+        lone: False,
+    }
+
+
+def test_paths_exist_missing_parent(temp_dir):
+    """Paths under a missing directory are reported as absent."""
+    parent = temp_dir / "nope"
+
+    result = paths_exist([parent / "x", parent / "y"])
+
+    assert result == {parent / "x": False, parent / "y": False}
+
+
+def test_paths_exist_dangling_symlink_and_dotdot(temp_dir):
+    """Dangling symlinks are missing and ``..`` paths group with siblings."""
+    (temp_dir / "real").write_text("")
+    (temp_dir / "dangling").symlink_to(temp_dir / "gone")
+    (temp_dir / "link").symlink_to(temp_dir / "real")
+    (temp_dir / "sub").mkdir()
+    dotted = temp_dir / "sub" / ".." / "real"
+
+    result = paths_exist(
+        [temp_dir / "dangling", temp_dir / "link", temp_dir / "gone", dotted]
+    )
+
+    assert result == {
+        temp_dir / "dangling": False,
+        temp_dir / "link": True,
+        temp_dir / "gone": False,
+        dotted: True,
+    }
+
+
+def test_paths_exist_unlistable_parent(temp_dir):
+    """If the parent cannot be listed, each path is stat'ed instead."""
+    (temp_dir / "a").write_text("")
+
+    with patch("vsc_sync.utils.os.scandir", side_effect=PermissionError):
+        result = paths_exist([temp_dir / "a", temp_dir / "b"])
+
+    assert result == {temp_dir / "a": True, temp_dir / "b": False}
+
+
+def test_paths_exist_confirms_unlisted_names(temp_dir):
+    """A name missing from the listing (e.g. mis-cased) is checked directly."""
+    (temp_dir / "a").write_text("")
+    listing = MagicMock()
+    listing.__enter__.return_value = iter(())
+
+    with patch("vsc_sync.utils.os.scandir", return_value=listing):
+        result = paths_exist([temp_dir / "a", temp_dir / "b"])
+
+    assert result == {temp_dir / "a": True, temp_dir / "b": False}
+
+
+def test_setup_logging_is_idempotent(monkeypatch):
+    """A repeated call with the same verbosity does not reconfigure logging."""
+    monkeypatch.setattr(setup_logging, "_done", None, raising=False)
+    with patch("vsc_sync.utils.logging.basicConfig") as basic_config:
+        setup_logging(True)
+        setup_logging(True)
+
+    assert basic_config.call_count == 1
+
+
+def test_resolve_path_depends_on_working_directory(temp_dir, monkeypatch):
+    """Relative paths are resolved against the current directory each time."""
+    (temp_dir / "a").mkdir()
+    (temp_dir / "b").mkdir()
+
+    monkeypatch.chdir(temp_dir / "a")
+    first = resolve_path("repo")
+    assert resolve_path("repo") is first
+
+    monkeypatch.chdir(temp_dir / "b")
+    assert resolve_path("repo") == (temp_dir / "b" / "repo").resolve()